@@ -0,0 +1,247 @@
+# -*- coding: utf-8 -*-
+#
+# File : echotorch/datasets/DynamicalSystemDataset.py
+# Description : Base class for datasets generated by a dynamical system
+# Date : 18th of October, 2026
+#
+# This file is part of EchoTorch.  EchoTorch is free software: you can
+# redistribute it and/or modify it under the terms of the GNU General Public
+# License as published by the Free Software Foundation, version 2.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, write to the Free Software Foundation, Inc., 51
+# Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# Copyright Nils Schaetti <nils.schaetti@unine.ch>
+
+# Imports
+import torch
+
+# Local imports
+from .EchoDataset import EchoDataset
+from .TimeseriesCache import TimeseriesCache
+
+
+# Base class for datasets generated by a dynamical system
+class DynamicalSystemDataset(EchoDataset):
+    """
+    Base class for datasets generated by a dynamical system (ODE integrated with a fixed-step RK4, or map).
+    With one initial state per sample (n samples x state dim), the samples are independent trajectories
+    stepped in parallel as tensor operations. With a single initial state, the samples are consecutive
+    segments of one trajectory. The series can be kept in an on-disk cache, only with a seed if the
+    generation uses the random number generator.
+    """
+
+    # The generation uses the random number generator
+    _random = False
+
+    # Constructor
+    def __init__(self, sample_len, n_samples, initial_state, washout=0, normalize=False, seed=None, cache=None,
+                 dtype=torch.float32):
+        """
+        Constructor
+        :param sample_len: Length of the time-series in time steps.
+        :param n_samples: Number of samples to generate.
+        :param initial_state: Initial state (state dim) or one initial state per sample (n samples x state dim)
+        :param washout: Time steps ignored before the first sample
+        :param normalize: Normalize each dimension of each sample between 0 and 1
+        :param seed: Seed of the random number generator (global), part of the cache key
+        :param cache: None (no cache), True (default directory), cache directory or TimeseriesCache, only
+        used with a seed if the generation is random
+        :param dtype: Data type of the samples
+        """
+        # Properties
+        self.sample_len = sample_len
+        self.n_samples = n_samples
+        self.washout = washout
+        self.normalize = normalize
+        self.seed = seed
+        self.dtype = dtype
+        self._initial_state = torch.as_tensor(initial_state, dtype=torch.float64).clone()
+        self._cache = TimeseriesCache.create(cache) if seed is not None or not self._random else None
+
+        # One initial state per sample
+        if self._initial_state.dim() > 1 and self._initial_state.size(0) != n_samples:
+            raise Exception("One initial state per sample expected, got {}".format(self._initial_state.size(0)))
+        # end if
+
+        # Seed
+        if seed is not None:
+            torch.manual_seed(seed)
+        # end if
+    # end __init__
+
+    # region PROPERTIES
+
+    # System parameters (to override)
+    @property
+    def system_parameters(self):
+        """
+        System parameters
+        :return: Dictionary of parameters
+        """
+        return dict()
+    # end system_parameters
+
+    # Whole dataset
+    @property
+    def data(self):
+        """
+        Whole dataset
+        :return: Samples (n samples x sample len x state dim)
+        """
+        return self.outputs
+    # end data
+
+    # endregion PROPERTIES
+
+    # region PUBLIC
+
+    # Regenerate
+    def regenerate(self):
+        """
+        Regenerate, continuing from the last states of the previous generation
+        """
+        # Generate data set
+        self.outputs = self._generate()
+    # end regenerate
+
+    # endregion PUBLIC
+
+    # region PRIVATE
+
+    # Step all states (to override)
+    def _step(self, states):
+        """
+        Step all states
+        :param states: States (n trajectories x state dim)
+        :return: Next states
+        """
+        raise Exception("_step not implemented")
+    # end _step
+
+    # Derivatives of all states (to override for ODEs)
+    def _derivatives(self, states):
+        """
+        Derivatives of all states
+        :param states: States (n trajectories x state dim)
+        :return: Derivatives (n trajectories x state dim)
+        """
+        raise Exception("_derivatives not implemented")
+    # end _derivatives
+
+    # Fixed-step Runge-Kutta 4 step
+    def _rk4_step(self, states, dt):
+        """
+        Fixed-step Runge-Kutta 4 step of all states
+        :param states: States (n trajectories x state dim)
+        :param dt: Time step
+        :return: Next states
+        """
+        k1 = self._derivatives(states)
+        k2 = self._derivatives(states + (0.5 * dt) * k1)
+        k3 = self._derivatives(states + (0.5 * dt) * k2)
+        k4 = self._derivatives(states + dt * k3)
+        return states + (dt / 6.0) * (k1 + 2.0 * (k2 + k3) + k4)
+    # end _rk4_step
+
+    # Generate dataset
+    def _generate(self):
+        """
+        Generate dataset, from the cache if possible. The last states become the initial states.
+        :return: Samples (n samples x sample len x state dim)
+        """
+        # Without cache
+        if self._cache is None:
+            samples, self._initial_state = self._integrate()
+            return samples
+        # end if
+
+        # Cache key
+        parameters = dict(self.system_parameters)
+        parameters.update(
+            initial_state=self._initial_state,
+            sample_len=self.sample_len,
+            n_samples=self.n_samples,
+            washout=self.washout,
+            normalize=self.normalize,
+            seed=self.seed,
+            dtype=self.dtype
+        )
+
+        # Load or integrate
+        samples, self._initial_state = self._cache.get(self.__class__.__name__, parameters, self._integrate)
+        return samples
+    # end _generate
+
+    # Integrate the system
+    def _integrate(self):
+        """
+        Integrate the system for all samples at the same time
+        :return: Samples (n samples x sample len x state dim), last states
+        """
+        # One trajectory per sample or consecutive segments of one trajectory
+        states = self._initial_state.clone()
+        if states.dim() == 1:
+            states = states.unsqueeze(0)
+            n_steps = self.sample_len * self.n_samples
+        else:
+            n_steps = self.sample_len
+        # end if
+
+        # Washout
+        for t in range(self.washout):
+            states = self._step(states)
+        # end for
+
+        # Time steps
+        trajectories = torch.empty(states.size(0), n_steps, states.size(1), dtype=torch.float64)
+        for t in range(n_steps):
+            states = self._step(states)
+            trajectories[:, t] = states
+        # end for
+
+        # Samples
+        samples = trajectories.reshape(self.n_samples, self.sample_len, -1)
+
+        # Normalize
+        if self.normalize:
+            minval = torch.min(samples, dim=1, keepdim=True)[0]
+            maxval = torch.max(samples, dim=1, keepdim=True)[0]
+            samples = (samples - minval) / (maxval - minval)
+        # end if
+
+        return samples.to(self.dtype), states.reshape(self._initial_state.size())
+    # end _integrate
+
+    # endregion PRIVATE
+
+    # region OVERRIDE
+
+    # Length
+    def __len__(self):
+        """
+        Length
+        :return:
+        """
+        return self.n_samples
+    # end __len__
+
+    # Get item
+    def __getitem__(self, idx):
+        """
+        Get item
+        :param idx:
+        :return:
+        """
+        return self.outputs[idx]
+    # end __getitem__
+
+    # endregion OVERRIDE
+
+# end DynamicalSystemDataset
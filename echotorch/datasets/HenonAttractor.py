@@ -3,153 +3,100 @@
 
 # Imports
 import torch
-from torch.utils.data.dataset import Dataset
-from random import shuffle
-import numpy as np
 
 # Load imports
-from .EchoDataset import EchoDataset
+from .DynamicalSystemDataset import DynamicalSystemDataset
 
 
 # Henon Attractor
-class HenonAttractor(EchoDataset):
+class HenonAttractor(DynamicalSystemDataset):
     """
-    The Rössler attractor is the attractor for the Rössler system, a system of three non-linear ordinary differential
-    equations originally studied by Otto Rössler. These differential equations define a continuous-time dynamical
-    system that exhibits chaotic dynamics associated with the fractal properties of the attractor.
+    The Hénon map is a discrete-time dynamical system introduced by Michel Hénon, one of the most studied
+    examples of dynamical systems that exhibit chaotic behavior. The map is iterated for all samples at the
+    same time, and the samples are shuffled (cached only with a seed).
     """
 
+    # The shuffle uses the random number generator
+    _random = True
+
     # Constructor
-    def __init__(self, sample_len, n_samples, xy, a, b, washout=0, normalize=False, seed=None):
+    def __init__(self, sample_len, n_samples, xy, a, b, washout=0, normalize=False, seed=None, cache=None,
+                 dtype=torch.float32):
         """
         Constructor
         :param sample_len: Length of the time-series in time steps.
         :param n_samples: Number of samples to generate.
-        :param a:
-        :param b:
-        :param c:
-        """
+        :param xy: Initial state (2) for consecutive segments of one trajectory, or one initial state per sample
+        (n samples x 2) for independent trajectories
+        :param a: A parameter
+        :param b: B parameter
+        :param washout: Time steps ignored before the first sample
+        :param normalize: Normalize each dimension of each sample between 0 and 1
+        :param seed: Seed of the random number generator
+        :param cache: None (no cache), True (default directory), cache directory or TimeseriesCache, only
+        used with a seed
+        :param dtype: Data type of the samples
+        """
+        # Call upper class
+        super(HenonAttractor, self).__init__(
+            sample_len=sample_len,
+            n_samples=n_samples,
+            initial_state=xy,
+            washout=washout,
+            normalize=normalize,
+            seed=seed,
+            cache=cache,
+            dtype=dtype
+        )
+
         # Properties
-        self.sample_len = sample_len
-        self.n_samples = n_samples
         self.a = a
         self.b = b
         self.xy = xy
-        self.normalize = normalize
-        self.washout = washout
-
-        # Seed
-        if seed is not None:
-            torch.initial_seed(seed)
-        # end if
 
         # Generate data set
         self.outputs = self._generate()
     # end __init__
 
-    # region PUBLIC
+    # region PROPERTIES
 
-    # Regenerate
-    def regenerate(self):
+    # System parameters
+    @property
+    def system_parameters(self):
         """
-        Regenerate
-        :return:
+        System parameters
+        :return: Dictionary of parameters
         """
-        # Generate data set
-        self.outputs = self._generate()
-    # end regenerate
+        return {'a': self.a, 'b': self.b}
+    # end system_parameters
 
-    # endregion PUBLIC
+    # endregion PROPERTIES
 
     # region PRIVATE
 
-    # Henon
-    def _henon(self, x, y):
+    # Step
+    def _step(self, states):
         """
-        Henon
-        :param x:
-        :param y:
-        :param z:
-        :return:
+        Iterate the Hénon map for all states
+        :param states: X, Y states (n trajectories x 2)
+        :return: Next states
         """
-        x_dot = 1 - (self.a * (x * x)) + y
-        y_dot = self.b * x
-        return x_dot, y_dot
-    # end _lorenz
+        x, y = states[:, 0], states[:, 1]
+        return torch.stack(HenonAttractor.henon(self.a, self.b, x, y), dim=1)
+    # end _step
 
-    # Generate
-    def _generate(self):
+    # Integrate the system
+    def _integrate(self):
         """
-        Generate dataset
-        :return:
+        Iterate the map for all samples at the same time, and shuffle the samples
+        :return: Samples (n samples x sample len x 2), last states
         """
-        # Sizes
-        total_size = self.sample_len
-
-        # First position
-        xy = self.xy
-
-        # Samples
-        samples = list()
-
-        # Washout
-        for t in range(self.washout):
-            xy = self._henon(xy[0], xy[1])
-        # end for
-
-        # For each sample
-        for n in range(self.n_samples):
-            # Tensor
-            sample = torch.zeros(total_size, 2)
-
-            # Timesteps
-            for t in range(total_size):
-                xy = self._henon(xy[0], xy[1])
-                sample[t] = xy
-            # end for
-
-            # Normalize
-            if self.normalize:
-                maxval = torch.max(sample, dim=0)
-                minval = torch.min(sample, dim=0)
-                sample = torch.mm(torch.inv(torch.diag(maxval - minval)), (sample - minval.repeat(total_size, 1)))
-            # end if
-
-            # Add
-            samples.append(sample)
-        # end for
-
-        # Shuffle
-        shuffle(samples)
-
-        return samples
-    # end _generate
+        samples, states = super(HenonAttractor, self)._integrate()
+        return samples[torch.randperm(self.n_samples)], states
+    # end _integrate
 
     # endregion PRIVATE
 
-    # region OVERRIDE
-
-    # Length
-    def __len__(self):
-        """
-        Length
-        :return:
-        """
-        return self.n_samples
-    # end __len__
-
-    # Get item
-    def __getitem__(self, idx):
-        """
-        Get item
-        :param idx:
-        :return:
-        """
-        return self.outputs[idx]
-    # end __getitem__
-
-    # endregion OVERRIDE
-
     # region STATIC
 
     # Henon
@@ -157,59 +104,44 @@ class HenonAttractor(EchoDataset):
     def henon(a, b, x, y):
         """
         Henon
-        :param x:
-        :param y:
-        :return:
+        :param a: A parameter
+        :param b: B parameter
+        :param x: X state(s)
+        :param y: Y state(s)
+        :return: Next X and Y state(s)
         """
         x_dot = 1 - (a * (x * x)) + y
         y_dot = b * x
         return x_dot, y_dot
-    # end lorenz
+    # end henon
 
     # Generate
     @staticmethod
     def generate(n_samples, sample_len, xy, a, b, washout, normalize=False, dtype=torch.float64):
         """
-        Generate dataset
-        :return:
-        """
-        # Sizes
-        total_size = sample_len
-
-        # Samples
-        samples = list()
-
-        # Washout
-        for t in range(washout):
-            xy = HenonAttractor.henon(a, b, xy[0], xy[1])
-        # end for
-
-        # For each sample
-        for n in range(n_samples):
-            # Tensor
-            sample = torch.zeros(total_size, 2, dtype=dtype)
-
-            # Timesteps
-            for t in range(total_size):
-                xy = HenonAttractor.henon(a, b, xy[0], xy[1])
-                sample[t] = xy
-            # end for
-
-            # Normalize
-            if normalize:
-                maxval = torch.max(sample, dim=0)
-                minval = torch.min(sample, dim=0)
-                sample = torch.mm(torch.inv(torch.diag(maxval - minval)), (sample - minval.repeat(total_size, 1)))
-            # end if
-
-            # Add
-            samples.append(sample)
-        # end for
-
-        # Shuffle
-        shuffle(samples)
-
-        return samples
+        Generate samples
+        :param n_samples: Number of samples to generate.
+        :param sample_len: Length of the time-series in time steps.
+        :param xy: Initial state (2) or one initial state per sample (n samples x 2)
+        :param a: A parameter
+        :param b: B parameter
+        :param washout: Time steps ignored before the first sample
+        :param normalize: Normalize each dimension of each sample between 0 and 1
+        :param dtype: Data type of the samples
+        :return: List of samples (sample len x 2)
+        """
+        return list(
+            HenonAttractor(
+                sample_len=sample_len,
+                n_samples=n_samples,
+                xy=xy,
+                a=a,
+                b=b,
+                washout=washout,
+                normalize=normalize,
+                dtype=dtype if dtype is not None else torch.get_default_dtype()
+            ).outputs
+        )
     # end generate
 
     # endregion STATIC
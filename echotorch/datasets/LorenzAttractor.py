@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 #
-# File : echotorch/datasets/EchoDataset.py
-# Description : Base class for EchoTorch datasets
+# File : echotorch/datasets/LorenzAttractor.py
+# Description : Lorenz attractor dataset
 # Date : 25th of January, 2021
 #
 # This file is part of EchoTorch.  EchoTorch is free software: you can
@@ -21,164 +21,102 @@
 
 # Imports
 import torch
-from torch.utils.data.dataset import Dataset
 
 # Local imports
-from .EchoDataset import EchoDataset
+from .DynamicalSystemDataset import DynamicalSystemDataset
 
 
 # Lorenz Attractor
-class LorenzAttractor(EchoDataset):
+class LorenzAttractor(DynamicalSystemDataset):
     """
-    The Rössler attractor is the attractor for the Rössler system, a system of three non-linear ordinary differential
-    equations originally studied by Otto Rössler. These differential equations define a continuous-time dynamical
-    system that exhibits chaotic dynamics associated with the fractal properties of the attractor.
+    The Lorenz attractor is the attractor for the Lorenz system, a system of three non-linear ordinary differential
+    equations originally studied by Edward Lorenz. These differential equations define a continuous-time dynamical
+    system that exhibits chaotic dynamics associated with the fractal properties of the attractor. The equations are
+    integrated with a fixed-step RK4 for all samples at the same time.
     """
 
     # Constructor
-    def __init__(self, sample_len, n_samples, xyz, sigma, b, r, dt=0.01, washout=0, normalize=False, seed=None):
+    def __init__(self, sample_len, n_samples, xyz, sigma, b, r, dt=0.01, washout=0, normalize=False, seed=None,
+                 cache=None, dtype=torch.float32):
         """
         Constructor
         :param sample_len: Length of the time-series in time steps.
         :param n_samples: Number of samples to generate.
-        :param a:
-        :param b:
-        :param c:
+        :param xyz: Initial state (3) for consecutive segments of one trajectory, or one initial state per sample
+        (n samples x 3) for independent trajectories
+        :param sigma: Sigma parameter
+        :param b: Beta parameter
+        :param r: Rho parameter
+        :param dt: Time step
+        :param washout: Time steps ignored before the first sample
+        :param normalize: Normalize each dimension of each sample between 0 and 1
+        :param seed: Seed of the random number generator
+        :param cache: None (no cache), True (default directory), cache directory or TimeseriesCache
+        :param dtype: Data type of the samples
         """
+        # Call upper class
+        super(LorenzAttractor, self).__init__(
+            sample_len=sample_len,
+            n_samples=n_samples,
+            initial_state=xyz,
+            washout=washout,
+            normalize=normalize,
+            seed=seed,
+            cache=cache,
+            dtype=dtype
+        )
+
         # Properties
-        self.sample_len = sample_len
-        self.n_samples = n_samples
         self.xyz = xyz
         self.dt = dt
-        self.normalize = normalize
-        self.washout = washout
         self.sigma = sigma
         self.b = b
         self.r = r
 
-        # Seed
-        if seed is not None:
-            torch.initial_seed(seed)
-        # end if
-
         # Generate data set
         self.outputs = self._generate()
     # end __init__
 
-    # region PUBLIC
+    # region PROPERTIES
 
-    # Regenerate
-    def regenerate(self):
+    # System parameters
+    @property
+    def system_parameters(self):
         """
-        Regenerate
-        :return:
+        System parameters
+        :return: Dictionary of parameters
         """
-        # Generate data set
-        self.outputs = self._generate()
-    # end regenerate
+        return {'sigma': self.sigma, 'b': self.b, 'r': self.r, 'dt': self.dt}
+    # end system_parameters
 
-    # endregion PUBLIC
+    # endregion PROPERTIES
 
     # region PRIVATE
 
     # Lorenz
-    def _lorenz(self, x, y, z):
+    def _derivatives(self, states):
         """
-        Lorenz
-        :param x:
-        :param y:
-        :param z:
-        :return:
+        Derivatives of the Lorenz system
+        :param states: X, Y, Z states (n trajectories x 3)
+        :return: Derivatives (n trajectories x 3)
         """
+        x, y, z = states[:, 0], states[:, 1], states[:, 2]
         x_dot = self.sigma * (y - x)
         y_dot = self.r * x - y - x * z
         z_dot = x * y - self.b * z
-        return x_dot, y_dot, z_dot
-
-    # end _lorenz
+        return torch.stack((x_dot, y_dot, z_dot), dim=1)
+    # end _derivatives
 
-    # Generate
-    def _generate(self):
+    # Step
+    def _step(self, states):
         """
-        Generate dataset
-        :return:
+        RK4 step of all states
+        :param states: X, Y, Z states (n trajectories x 3)
+        :return: Next states
         """
-        # Sizes
-        total_size = self.sample_len
-
-        # List of samples
-        samples = list()
-
-        # XYZ
-        xyz = self.xyz
-
-        # Washout
-        for t in range(self.washout):
-            # Derivatives of the X, Y, Z state
-            x_dot, y_dot, z_dot = self._lorenz(xyz[0], xyz[1], xyz[2])
-
-            # Apply changes
-            xyz[0] += self.dt * x_dot
-            xyz[1] += self.dt * y_dot
-            xyz[2] += self.dt * z_dot
-        # end for
-
-        # For each sample
-        for i in range(self.n_samples):
-            # Tensor
-            sample = torch.zeros(self.sample_len, 3)
-            for t in range(self.sample_len):
-                # Derivatives of the X, Y, Z state
-                x_dot, y_dot, z_dot = self._lorenz(xyz[0], xyz[1], xyz[2])
-
-                # Apply changes
-                xyz[0] += self.dt * x_dot
-                xyz[1] += self.dt * y_dot
-                xyz[2] += self.dt * z_dot
-
-                # Set
-                sample[t, 0] = xyz[0]
-                sample[t, 1] = xyz[1]
-                sample[t, 2] = xyz[2]
-            # end for
-
-            # Normalize
-            if self.normalize:
-                maxval = torch.max(sample, dim=0)
-                minval = torch.min(sample, dim=0)
-                sample = torch.mm(torch.inv(torch.diag(maxval - minval)), (sample - minval.repeat(total_size, 1)))
-            # end if
-
-            # Append
-            samples.append(sample)
-        # end for
-
-        return samples
-    # end _generate
+        return self._rk4_step(states, self.dt)
+    # end _step
 
     # endregion PRIVATE
 
-    # region OVERRIDE
-
-    # Length
-    def __len__(self):
-        """
-        Length
-        :return:
-        """
-        return self.n_samples
-    # end __len__
-
-    # Get item
-    def __getitem__(self, idx):
-        """
-        Get item
-        :param idx:
-        :return:
-        """
-        return self.outputs[idx]
-    # end __getitem__
-
-    # endregion OVERRIDE
-
 # end LorenzAttractor
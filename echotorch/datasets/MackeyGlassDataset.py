@@ -3,27 +3,30 @@
 
 # Imports
 import torch
-from torch.utils.data.dataset import Dataset
-import collections
 
 # Local imports
 from .EchoDataset import EchoDataset
+from .TimeseriesCache import TimeseriesCache
 
 
 # Mackey Glass dataset
 class MackeyGlassDataset(EchoDataset):
     """
-    Mackey Glass dataset
+    Mackey Glass dataset. The series of all samples are generated at the same time when the dataset
+    is created, and can be kept in an on-disk cache when a seed is given.
     """
 
     # Constructor
-    def __init__(self, sample_len, n_samples, tau=17, seed=None):
+    def __init__(self, sample_len, n_samples, tau=17, seed=None, cache=None, dtype=torch.float32):
         """
         Constructor
         :param sample_len: Length of the time-series in time steps.
         :param n_samples: Number of samples to generate.
         :param tau: Delay of the MG with commonly used value of tau=17 (mild chaos) and tau=30 is moderate chaos.
         :param seed: Seed of random number generator.
+        :param cache: None (no cache), True (default directory), cache directory or TimeseriesCache, only
+        used with a seed
+        :param dtype: Data type of the samples
         """
         # Properties
         self.sample_len = sample_len
@@ -32,13 +35,75 @@ class MackeyGlassDataset(EchoDataset):
         self.delta_t = 10
         self.timeseries = 1.2
         self.history_len = tau * self.delta_t
+        self.seed = seed
+        self.dtype = dtype
+        self._cache = TimeseriesCache.create(cache) if seed is not None else None
 
         # Init seed if needed
         if seed is not None:
             torch.manual_seed(seed)
         # end if
+
+        # Generate data set
+        self.outputs = self._generate()
     # end __init__
 
+    # region PUBLIC
+
+    # Regenerate
+    def regenerate(self):
+        """
+        Regenerate with new random histories
+        """
+        self.outputs = self._generate()
+    # end regenerate
+
+    # endregion PUBLIC
+
+    # region PRIVATE
+
+    # Generate dataset
+    def _generate(self):
+        """
+        Generate the series of all samples, from the cache if possible
+        :return: Series (n samples x sample len x 1)
+        """
+        # Without cache
+        if self._cache is None:
+            return self._generate_series()
+        # end if
+
+        # Cache key
+        parameters = {
+            'tau': self.tau,
+            'delta_t': self.delta_t,
+            'sample_len': self.sample_len,
+            'n_samples': self.n_samples,
+            'seed': self.seed,
+            'dtype': self.dtype
+        }
+
+        return self._cache.get(self.__class__.__name__, parameters, self._generate_series)
+    # end _generate
+
+    # Generate the series
+    def _generate_series(self):
+        """
+        Generate the series of all samples from random histories
+        :return: Series (n samples x sample len x 1)
+        """
+        # Histories
+        history = 1.2 * torch.ones(self.n_samples, self.history_len, dtype=torch.float64) + \
+            0.2 * (torch.rand(self.n_samples, self.history_len, dtype=torch.float64) - 0.5)
+
+        # Squash timeseries through tan
+        return torch.tan(
+            MackeyGlassDataset.generate_series(self.sample_len, history, self.delta_t, x0=self.timeseries) - 1
+        ).unsqueeze(-1).to(self.dtype)
+    # end _generate_series
+
+    # endregion PRIVATE
+
     # region OVERRIDE
 
     # Length
@@ -57,26 +122,7 @@ class MackeyGlassDataset(EchoDataset):
         :param idx:
         :return:
         """
-        # History
-        history = collections.deque(1.2 * torch.ones(self.history_len) + 0.2 * (torch.rand(self.history_len) - 0.5))
-
-        # Preallocate tensor for time-serie
-        inp = torch.zeros(self.sample_len, 1)
-
-        # For each time step
-        for timestep in range(self.sample_len):
-            for _ in range(self.delta_t):
-                xtau = history.popleft()
-                history.append(self.timeseries)
-                self.timeseries = history[-1] + (0.2 * xtau / (1.0 + xtau ** 10) - 0.1 * history[-1]) / self.delta_t
-            # end for
-            inp[timestep] = self.timeseries
-        # end for
-
-        # Inputs
-        inputs = torch.tan(inp - 1)
-
-        # Squash timeseries through tanh
+        inputs = self.outputs[idx]
         return inputs[:-1], inputs[1:]
     # end __getitem__
 
@@ -86,29 +132,79 @@ class MackeyGlassDataset(EchoDataset):
 
     # Generate
     @staticmethod
-    def generate(sample_len, history_len, delta_t):
-        # History
-        history = collections.deque(1.2 * torch.ones(history_len) + 0.2 * (torch.rand(history_len) - 0.5))
-
-        # Preallocate tensor for time-serie
-        inp = torch.zeros(sample_len, 1)
-
-        # For each time step
-        for timestep in range(self.sample_len):
-            for _ in range(self.delta_t):
-                xtau = history.popleft()
-                history.append(self.timeseries)
-                self.timeseries = history[-1] + (0.2 * xtau / (1.0 + xtau ** 10) - 0.1 * history[-1]) / self.delta_t
+    def generate(sample_len, history_len, delta_t, n_samples=1, dtype=torch.float32):
+        """
+        Generate samples from random histories
+        :param sample_len: Length of the time-series in time steps.
+        :param history_len: Length of the history (tau x delta_t)
+        :param delta_t: Number of Euler sub-steps per time step
+        :param n_samples: Number of samples to generate.
+        :param dtype: Data type of the samples
+        :return: Inputs and targets (n samples x sample len - 1 x 1)
+        """
+        # Histories
+        history = 1.2 * torch.ones(n_samples, history_len, dtype=torch.float64) + \
+            0.2 * (torch.rand(n_samples, history_len, dtype=torch.float64) - 0.5)
+
+        # Squash timeseries through tan
+        inputs = torch.tan(MackeyGlassDataset.generate_series(sample_len, history, delta_t) - 1)
+        inputs = inputs.unsqueeze(-1).to(dtype)
+        return inputs[:, :-1], inputs[:, 1:]
+    # end generate
+
+    # Generate Mackey-Glass series
+    @staticmethod
+    def generate_series(sample_len, history, delta_t, x0=1.2):
+        """
+        Generate Mackey-Glass series for all histories at the same time, with delta_t Euler sub-steps per
+        time step. The sub-steps are run by blocks of the history length, the delayed terms of a block are all
+        known at its start and are computed at once, which leaves one operation per sub-step.
+        :param sample_len: Length of the time-series in time steps.
+        :param history: Initial histories, oldest first (n samples x history length)
+        :param delta_t: Number of Euler sub-steps per time step
+        :param x0: Initial value
+        :return: Series (n samples x sample len)
+        """
+        # Time major history
+        n_samples, history_len = history.size()
+        history = history.t().contiguous()
+
+        # Decay of the current value at each sub-step
+        decay = 1.0 - 0.1 / delta_t
+
+        # Series and current values
+        outputs = torch.empty(sample_len, n_samples, dtype=history.dtype)
+        x = torch.full((n_samples,), x0, dtype=history.dtype)
+
+        # Blocks of sub-steps
+        n_substeps = sample_len * delta_t
+        for start in range(0, n_substeps, history_len):
+            block_len = min(history_len, n_substeps - start)
+
+            # Delayed terms of the block
+            xtau = history[:block_len]
+            delayed = 0.2 * xtau / (1.0 + xtau ** 10) / delta_t
+
+            # Values before and after each sub-step
+            values = torch.empty(block_len + 1, n_samples, dtype=history.dtype)
+            values[0] = x
+            for k in range(block_len):
+                torch.add(delayed[k], values[k], alpha=decay, out=values[k + 1])
             # end for
-            inp[timestep] = self.timeseries
-        # end for
+            x = values[-1]
 
-        # Inputs
-        inputs = torch.tan(inp - 1)
+            # Values before each sub-step enter the history
+            history = torch.cat((history[block_len:], values[:-1]), dim=0)
 
-        # Squash timeseries through tanh
-        return inputs[:-1], inputs[1:]
-    # end generate
+            # Values at the end of each time step
+            first = delta_t - 1 - start % delta_t
+            block_outputs = values[1 + first::delta_t]
+            t0 = (start + first + 1) // delta_t - 1
+            outputs[t0:t0 + block_outputs.size(0)] = block_outputs
+        # end for
+
+        return outputs.t()
+    # end generate_series
 
     # endregion STATIC
 
@@ -20,6 +20,7 @@
 # Copyright Nils Schaetti, University of Neuchâtel <nils.schaetti@unine.ch>
 
 # Imports
+import numpy as np
 import torch
 
 # Local imports
@@ -35,20 +36,26 @@ class NARMADataset(EchoDataset):
     where this problem happens less often.
     """
 
+    # Minimum number of samples advanced together as tensors (Python floats below)
+    LOCKSTEP_MIN_SAMPLES = 12
+
     # region CONSTUCTORS
 
     # Constructor
-    def __init__(self, sample_len, n_samples, system_order=10):
+    def __init__(self, sample_len, n_samples, system_order=10, seed=None, dtype=torch.float32):
         """
         Constructor
         :param sample_len: Length of the time-series in time steps.
         :param n_samples: Number of samples to generate.
         :param system_order: th order NARMA
+        :param seed: Seed of random number generator.
+        :param dtype: Data type of the samples
         """
         # Properties
         self.sample_len = sample_len
         self.n_samples = n_samples
         self.system_order = system_order
+        self.dtype = dtype
 
         # System order
         self.parameters = torch.zeros(4)
@@ -64,6 +71,11 @@ class NARMADataset(EchoDataset):
             self.parameters[3] = 0.001
         # end if
 
+        # Init seed if needed
+        if seed is not None:
+            torch.manual_seed(seed)
+        # end if
+
         # Generate data set
         self.inputs, self.outputs = self._generate()
     # end __init__
@@ -76,23 +88,19 @@ class NARMADataset(EchoDataset):
     def _generate(self):
         """
         Generate dataset
-        :return:
+        :return: Inputs and outputs (n samples x sample len x 1)
         """
-        inputs = list()
-        outputs = list()
-        for i in range(self.n_samples):
-            ins = torch.rand(self.sample_len, 1) * 0.5
-            outs = torch.zeros(self.sample_len, 1)
-            for k in range(self.system_order - 1, self.sample_len - 1):
-                outs[k + 1] = self.parameters[0] * outs[k] + self.parameters[1] * outs[k] * torch.sum(
-                    outs[k - (self.system_order - 1):k + 1]) + 1.5 * ins[k - int(self.parameters[2])] * ins[k] + \
-                              self.parameters[3]
-            # end for
-            inputs.append(ins)
-            outputs.append(outs)
-        # end for
+        # Inputs of all samples
+        inputs = torch.rand(self.n_samples, self.sample_len, 1) * 0.5
+
+        # Outputs of all samples
+        outputs = NARMADataset.narma(
+            inputs.squeeze(-1).to(torch.float64),
+            self.system_order,
+            *self.parameters.tolist()
+        )
 
-        return inputs, outputs
+        return inputs.to(self.dtype), outputs.unsqueeze(-1).to(self.dtype)
     # end _generate
 
     # endregion PRIVATE
@@ -120,4 +128,89 @@ class NARMADataset(EchoDataset):
 
     # endregion OVERRIDE
 
+    # region STATIC
+
+    # NARMA outputs
+    @staticmethod
+    def narma(inputs, system_order, alpha, beta, delay, gamma):
+        """
+        NARMA outputs of all samples, advanced in lockstep one time step at a time on NumPy arrays, whose
+        per-operation overhead is lower than the one of tensor operations on a vector of samples. The outputs
+        are scaled by beta (z = beta * y) so that alpha + beta * sum of the last system_order outputs is kept
+        as a running sum of z, which leaves four operations per time step. With less than LOCKSTEP_MIN_SAMPLES
+        samples, each sample is generated with Python floats.
+        y[k+1] = alpha * y[k] + beta * y[k] * sum(y[k-order+1..k]) + 1.5 * u[k-delay] * u[k] + gamma
+        :param inputs: Inputs (n samples x sample len)
+        :param system_order: Order of the system
+        :param alpha: Alpha parameter
+        :param beta: Beta parameter
+        :param delay: Delay of the input term
+        :param gamma: Gamma parameter
+        :return: Outputs (n samples x sample len)
+        """
+        # Time major
+        n_samples, sample_len = inputs.size()
+        inputs = inputs.t()
+
+        # Input terms of all time steps (delayed indices wrap around as with negative indexing)
+        delayed = torch.arange(sample_len) - int(delay)
+        input_terms = 1.5 * inputs[delayed % sample_len] * inputs + gamma
+
+        # Few samples, Python floats are faster than operations on tiny vectors
+        if n_samples < NARMADataset.LOCKSTEP_MIN_SAMPLES:
+            return torch.tensor(
+                [NARMADataset._narma_sample(terms, system_order, alpha, beta) for terms in input_terms.t().tolist()],
+                dtype=inputs.dtype
+            ).reshape(n_samples, sample_len)
+        # end if
+
+        # Scale of the outputs (no window sum without beta)
+        scale = beta if beta != 0 else 1.0
+
+        # Scaled input terms, scaled outputs, and alpha + running sum of the last system_order scaled outputs
+        scaled_terms = (input_terms.to(torch.float64) * scale).numpy()
+        outputs = np.zeros((sample_len, n_samples))
+        factors = np.full(n_samples, alpha, dtype=np.float64)
+
+        # Time steps (unstable samples diverge silently, as with Python floats)
+        with np.errstate(over='ignore', invalid='ignore'):
+            for k in range(system_order - 1, sample_len - 1):
+                # z[k+1] = z[k] * (alpha + sum) + beta * input term
+                np.multiply(outputs[k], factors, out=outputs[k + 1])
+                outputs[k + 1] += scaled_terms[k]
+
+                # Slide the window
+                if beta != 0:
+                    factors += outputs[k + 1]
+                    factors -= outputs[k + 1 - system_order]
+                # end if
+            # end for
+        # end with
+
+        return (torch.from_numpy(outputs).t() / scale).to(inputs.dtype)
+    # end narma
+
+    # NARMA outputs of one sample
+    @staticmethod
+    def _narma_sample(input_terms, system_order, alpha, beta):
+        """
+        NARMA outputs of one sample with Python floats and a running sum
+        :param input_terms: Input terms 1.5 * u[k-delay] * u[k] + gamma (list of sample len floats)
+        :param system_order: Order of the system
+        :param alpha: Alpha parameter
+        :param beta: Beta parameter
+        :return: Outputs (list of sample len floats)
+        """
+        outputs = [0.0] * len(input_terms)
+        factor = alpha
+        for k in range(system_order - 1, len(input_terms) - 1):
+            y = outputs[k] * factor + input_terms[k]
+            outputs[k + 1] = y
+            factor += beta * (y - outputs[k + 1 - system_order]) if k + 1 >= system_order else beta * y
+        # end for
+        return outputs
+    # end _narma_sample
+
+    # endregion STATIC
+
 # end NARMADataset
@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+#
+# File : echotorch/datasets/TimeseriesCache.py
+# Description : On-disk cache of generated timeseries
+# Date : 18th of October, 2026
+#
+# This file is part of EchoTorch.  EchoTorch is free software: you can
+# redistribute it and/or modify it under the terms of the GNU General Public
+# License as published by the Free Software Foundation, version 2.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, write to the Free Software Foundation, Inc., 51
+# Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# Copyright Nils Schaetti <nils.schaetti@unine.ch>
+
+# Imports
+import os
+import hashlib
+import tempfile
+import numpy as np
+import torch
+
+
+# On-disk cache of generated timeseries
+class TimeseriesCache(object):
+    """
+    On-disk cache of generated timeseries, one file per system and set of generation parameters
+    (system parameters, initial states, seed, length and number of samples).
+    """
+
+    # Environment variable for the default directory
+    ENV_ROOT = 'ECHOTORCH_CACHE'
+
+    # Constructor
+    def __init__(self, root=None):
+        """
+        Constructor
+        :param root: Cache directory (default: $ECHOTORCH_CACHE or ~/.cache/echotorch)
+        """
+        if root is None:
+            root = os.environ.get(
+                TimeseriesCache.ENV_ROOT,
+                os.path.join(os.path.expanduser('~'), '.cache', 'echotorch')
+            )
+        # end if
+        self._root = root
+    # end __init__
+
+    # region PROPERTIES
+
+    # Cache directory
+    @property
+    def root(self):
+        """
+        Cache directory
+        :return: Cache directory
+        """
+        return self._root
+    # end root
+
+    # endregion PROPERTIES
+
+    # region PUBLIC
+
+    # Path of a cached timeseries
+    def path(self, system, parameters):
+        """
+        Path of a cached timeseries
+        :param system: System name
+        :param parameters: Dictionary of generation parameters
+        :return: File path
+        """
+        key = hashlib.sha1(repr(TimeseriesCache._key(parameters)).encode('utf-8')).hexdigest()
+        return os.path.join(self._root, "{}-{}.pth".format(system, key))
+    # end path
+
+    # Load a cached timeseries
+    def load(self, system, parameters):
+        """
+        Load a cached timeseries
+        :param system: System name
+        :param parameters: Dictionary of generation parameters
+        :return: The cached data, or None if not in the cache
+        """
+        path = self.path(system, parameters)
+        if os.path.exists(path):
+            return torch.load(path)
+        # end if
+        return None
+    # end load
+
+    # Save a timeseries
+    def save(self, system, parameters, data):
+        """
+        Save a timeseries, written to a temporary file first so that readers never see a partial file
+        :param system: System name
+        :param parameters: Dictionary of generation parameters
+        :param data: Data to save
+        """
+        os.makedirs(self._root, exist_ok=True)
+        file_handle, tmp_path = tempfile.mkstemp(dir=self._root, suffix='.tmp')
+        try:
+            with os.fdopen(file_handle, 'wb') as f:
+                torch.save(data, f)
+            # end with
+            os.replace(tmp_path, self.path(system, parameters))
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+        # end try
+    # end save
+
+    # Load a timeseries or generate it
+    def get(self, system, parameters, generate_func):
+        """
+        Load a timeseries from the cache, or generate and save it
+        :param system: System name
+        :param parameters: Dictionary of generation parameters
+        :param generate_func: Function generating the data
+        :return: The data
+        """
+        data = self.load(system, parameters)
+        if data is None:
+            data = generate_func()
+            self.save(system, parameters, data)
+        # end if
+        return data
+    # end get
+
+    # endregion PUBLIC
+
+    # region STATIC
+
+    # Cache from a dataset argument
+    @staticmethod
+    def create(cache):
+        """
+        Cache from the cache argument of a dataset
+        :param cache: None or False (no cache), True (default directory), a directory or a TimeseriesCache
+        :return: TimeseriesCache or None
+        """
+        if cache is None or cache is False:
+            return None
+        elif cache is True:
+            return TimeseriesCache()
+        elif isinstance(cache, TimeseriesCache):
+            return cache
+        # end if
+        return TimeseriesCache(cache)
+    # end create
+
+    # Stable key of the parameters
+    @staticmethod
+    def _key(value):
+        """
+        Stable key of the parameters
+        :param value: Parameter value (dictionary, list, tuple, tensor, array, dtype or scalar)
+        :return: Key made of tuples and scalars
+        """
+        if isinstance(value, dict):
+            return tuple(sorted((k, TimeseriesCache._key(v)) for k, v in value.items()))
+        elif isinstance(value, (list, tuple)):
+            return tuple(TimeseriesCache._key(v) for v in value)
+        elif isinstance(value, (torch.Tensor, np.ndarray)):
+            return TimeseriesCache._key(value.tolist())
+        elif isinstance(value, np.generic):
+            return value.item()
+        elif isinstance(value, torch.dtype):
+            return str(value)
+        # end if
+        return value
+    # end _key
+
+    # endregion STATIC
+
+# end TimeseriesCache
@@ -24,6 +24,7 @@ from .CopyTaskDataset import CopyTaskDataset
 from .DatasetComposer import DatasetComposer
 from .DelayDataset import DelayDataset
 from .DiscreteMarkovChainDataset import DiscreteMarkovChainDataset
+from .DynamicalSystemDataset import DynamicalSystemDataset
 from .EchoDataset import EchoDataset
 from .FromCSVDataset import FromCSVDataset
 from .HenonAttractor import HenonAttractor
@@ -40,6 +41,7 @@ from .MixedSinesDataset import MixedSinesDataset
 from .NARMADataset import NARMADataset
 from .RosslerAttractor import RosslerAttractor
 from .SinusoidalTimeseries import SinusoidalTimeseries
+from .TimeseriesCache import TimeseriesCache
 from .PeriodicSignalDataset import PeriodicSignalDataset
 from .RandomSymbolDataset import RandomSymbolDataset
 from .RepeatTaskDataset import RepeatTaskDataset
@@ -54,5 +56,5 @@ __all__ = [
    'NARMADataset', 'RosslerAttractor', 'SinusoidalTimeseries', 'PeriodicSignalDataset', 'RandomSymbolDataset',
    'ImageToTimeseries', 'MarkovChainDataset', 'MixedSinesDataset', 'RepeatTaskDataset',
    'TimeseriesBatchSequencesDataset', 'TransformDataset', 'TripletBatching', 'DelayDataset', 'EchoDataset',
-   'MackeyGlass2DDataset'
+   'MackeyGlass2DDataset', 'DynamicalSystemDataset', 'TimeseriesCache'
 ]
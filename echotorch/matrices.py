@@ -117,7 +117,7 @@ def matlab(
 # Normal matrix generator
 def normal_generator(
         connectivity: float = 1.0, spectral_radius: float = 1.0, scale: float = 1.0, mean: float = 0.0,
-        std: float = 1.0, minimum_edges: float = 0, apply_spectral_radius: bool = False
+        std: float = 1.0, minimum_edges: float = 0, apply_spectral_radius: bool = False, sparse: bool = False
 ) -> MatrixGenerator:
     """
     Create a generator to create normal matrices
@@ -128,6 +128,7 @@ def normal_generator(
     @param std: Standard deviation parameter for the normal distribution
     @param minimum_edges: Minimum number of edge(s) present in the matrix
     @param apply_spectral_radius: True to apply the spectral radius rescaling, False otherwise
+    @param sparse: True to store the generated matrices as sparse tensors
     @return: A MatrixGenerator to generate normal matrices
     """
     return etmg.matrix_factory.get_generator(
@@ -138,14 +139,15 @@ def normal_generator(
         apply_spectral_radius=apply_spectral_radius,
         mean=mean,
         std=std,
-        minimum_edges=minimum_edges
+        minimum_edges=minimum_edges,
+        sparse=sparse
     )
 # end normal_generator
 
 
 # Normal matrix generation
 def normal(*size, connectivity=1.0, spectral_radius=1.0, scale=1.0, mean=0.0, std=1.0, minimum_edges=0,
-           apply_spectral_radius=False, dtype=None):
+           apply_spectral_radius=False, sparse=False, dtype=None):
     """
     Generate a matrix from a normal distribution
     @param size: Size of the output matrix as a tuple
@@ -156,6 +158,7 @@ def normal(*size, connectivity=1.0, spectral_radius=1.0, scale=1.0, mean=0.0, st
     @param std:
     @param minimum_edges:
     @param apply_spectral_radius:
+    @param sparse: True to return a sparse tensor
     @param dtype:
     @return:
     """
@@ -167,7 +170,8 @@ def normal(*size, connectivity=1.0, spectral_radius=1.0, scale=1.0, mean=0.0, st
         apply_spectral_radius=apply_spectral_radius,
         mean=mean,
         std=std,
-        minimum_edges=minimum_edges
+        minimum_edges=minimum_edges,
+        sparse=sparse
     )
 
     # Generate matrix
@@ -177,7 +181,7 @@ def normal(*size, connectivity=1.0, spectral_radius=1.0, scale=1.0, mean=0.0, st
 
 # Uniform matrix generator
 def uniform_generator(connectivity=1.0, spectral_radius=1.0, scale=1.0, input_set=[1.0, -1.0], minimum_edges=0,
-            min=-1.0, max=1.0, apply_spectral_radius=False):
+            min=-1.0, max=1.0, apply_spectral_radius=False, sparse=False):
     """
     Uniform matrix generator
     """
@@ -190,14 +194,15 @@ def uniform_generator(connectivity=1.0, spectral_radius=1.0, scale=1.0, input_se
         minimum_edges=minimum_edges,
         min=min,
         max=max,
-        apply_spectral_radius=apply_spectral_radius
+        apply_spectral_radius=apply_spectral_radius,
+        sparse=sparse
     )
 # end uniform_generator
 
 
 # Uniform matrix generation
 def uniform(*size, connectivity=1.0, spectral_radius=1.0, scale=1.0, input_set=[1.0, -1.0], minimum_edges=0,
-            min=-1.0, max=1.0, apply_spectral_radius=False, dtype=None):
+            min=-1.0, max=1.0, apply_spectral_radius=False, sparse=False, dtype=None):
     """
     Uniform matrix generation
     :param connectivity:
@@ -208,6 +213,7 @@ def uniform(*size, connectivity=1.0, spectral_radius=1.0, scale=1.0, input_set=[
     :param min:
     :param max:
     :param apply_spectral_radius:
+    :param sparse: True to return a sparse tensor
     :param dtype:
     """
     # Matrix generator
@@ -219,7 +225,8 @@ def uniform(*size, connectivity=1.0, spectral_radius=1.0, scale=1.0, input_set=[
         minimum_edges=minimum_edges,
         min=min,
         max=max,
-        apply_spectral_radius=apply_spectral_radius
+        apply_spectral_radius=apply_spectral_radius,
+        sparse=sparse
     )
 
     # Generate matrix
@@ -283,13 +283,13 @@ class Node(nn.Module):
 
     # region PRIVATE
 
-    # Matrix inverse
-    def _inverse(self, name, M, code_class, code_pos):
+    # Debug condition number of a matrix
+    def _debug_condition_number(self, name, M, operation, code_class, code_pos):
         """
-        Matrix inverse
+        Show the condition number of a matrix in debug mode and warn if it is high
         :param name: Name associated with M
-        :param M: Matrix to inverse
-        :return: Inverse matrix
+        :param M: Matrix
+        :param operation: Operation done with M (for the messages)
         """
         if self._debug == Node.DEBUG_TEST or self._debug == Node.DEBUG_OUTPUT:
             # SVD of matrix
@@ -301,7 +301,8 @@ class Node(nn.Module):
             # Show condition number
             if self._debug == Node.DEBUG_OUTPUT:
                 print(
-                    "DEBUG - INFO : Condition number while inversing {} : {} (at {}:{})".format(
+                    "DEBUG - INFO : Condition number while {} {} : {} (at {}:{})".format(
+                        operation,
                         name,
                         condition_number,
                         code_class,
@@ -312,7 +313,8 @@ class Node(nn.Module):
             # Bad condition number
             if condition_number > 14:
                 print(
-                    "DEBUG - WARNING : High condition number while inversing {} : {} (at {}:{})".format(
+                    "DEBUG - WARNING : High condition number while {} {} : {} (at {}:{})".format(
+                        operation,
                         name,
                         condition_number,
                         code_class,
@@ -321,6 +323,17 @@ class Node(nn.Module):
                 )
             # end if
         # end if
+    # end _debug_condition_number
+
+    # Matrix inverse
+    def _inverse(self, name, M, code_class, code_pos):
+        """
+        Matrix inverse
+        :param name: Name associated with M
+        :param M: Matrix to inverse
+        :return: Inverse matrix
+        """
+        self._debug_condition_number(name, M, "inversing", code_class, code_pos)
         return torch.inverse(M)
     # end _inverse
 
@@ -332,38 +345,62 @@ class Node(nn.Module):
         :param M: Matrix to inverse
         :return: Pseudo-inverse of matrix
         """
-        if self._debug == Node.DEBUG_TEST or self._debug == Node.DEBUG_OUTPUT:
-            # SVD of matrix
-            _, S, _ = torch.svd(M)
+        self._debug_condition_number(name, M, "pseudo-inversing", code_class, code_pos)
+        return torch.pinverse(M)
+    # end _pinverse
 
-            # Condition number
-            condition_number = torch.log10(S[0] / S[-1])
+    # Solve a linear system with a Cholesky factorization
+    def _cholesky_solve(self, name, M, B, code_class, code_pos):
+        """
+        Solve M * X = B with a Cholesky factorization of the symmetric positive definite
+        matrix M and two triangular solves, M is never inverted explicitly.
+        :param name: Name associated with M
+        :param M: Symmetric positive definite matrix
+        :param B: Right-hand side
+        :return: Solution X
+        """
+        self._debug_condition_number(name, M, "solving with", code_class, code_pos)
 
-            # Show condition number
-            if self._debug == Node.DEBUG_OUTPUT:
-                print(
-                    "DEBUG - INFO : Condition number while pseudo-inversing {} : {} (at {}:{})".format(
-                        name,
-                        condition_number,
-                        code_class,
-                        code_pos
-                    )
-                )
+        # Lower triangular factor (torch.linalg appeared in 1.8)
+        if hasattr(torch, 'linalg') and hasattr(torch.linalg, 'cholesky'):
+            L = torch.linalg.cholesky(M)
+        else:
+            L = torch.cholesky(M)
+        # end if
 
-            # Bad condition number
-            if condition_number > 14:
-                print(
-                    "DEBUG - WARNING : High condition number while pseudo-inversing {} : {} (at {}:{})".format(
-                        name,
-                        condition_number,
-                        code_class,
-                        code_pos
-                    )
-                )
-            # end if
+        return torch.cholesky_solve(B, L)
+    # end _cholesky_solve
+
+    # Solve a ridge regression for several ridge parameters
+    def _ridge_path(self, name, xTx, xTy, ridge_params, code_class, code_pos):
+        """
+        Solve (xTx + r * I) * X = xTy for each ridge parameter r with a single eigendecomposition
+        of the symmetric matrix xTx = Q * diag(L) * Q^T, as X = Q * diag(1 / (L + r)) * Q^T * xTy.
+        :param name: Name associated with xTx
+        :param xTx: Symmetric covariance matrix (without ridge)
+        :param xTy: Right-hand side
+        :param ridge_params: Sequence of K ridge parameters
+        :return: Solutions stacked as a tensor (K x xTx size x xTy columns)
+        """
+        # Ridge parameters as a vector
+        ridge_params = torch.as_tensor(ridge_params, dtype=xTx.dtype, device=xTx.device).reshape(-1)
+
+        # Eigendecomposition of xTx (torch.linalg appeared in 1.8)
+        if hasattr(torch, 'linalg') and hasattr(torch.linalg, 'eigh'):
+            L, Q = torch.linalg.eigh(xTx)
+        else:
+            L, Q = torch.symeig(xTx, eigenvectors=True)
         # end if
-        return torch.pinverse(M)
-    # end _pinverse
+
+        # Debug eigenvalues
+        self._call_debug_point("{}_eigenvalues".format(name), L, code_class, code_pos)
+
+        # Project xTy on the eigenvectors once
+        QTy = torch.mm(Q.t(), xTy)
+
+        # Scale by 1 / (L + r) for each r and go back
+        return torch.matmul(Q, QTy.unsqueeze(0) / (L.unsqueeze(0) + ridge_params.unsqueeze(1)).unsqueeze(2))
+    # end _ridge_path
 
     # Call debug point
     def _call_debug_point(self, name, value, code_class, code_pos):
@@ -465,6 +502,17 @@ class Node(nn.Module):
         return inputs
     # end _pre_step_update_hook
 
+    # Hook which gets executed before the update state equation for every timesteps (batched mode).
+    def _pre_step_batch_update_hook(self, inputs, forward_i, t):
+        """
+        Hook which gets executed before the update equation for every timesteps in batched mode
+        :param inputs: Input signal for the whole batch (batch size x input dim).
+        :param forward_i: Index of forward call
+        :param t: Timestep.
+        """
+        return inputs
+    # end _pre_step_batch_update_hook
+
     # Hook which gets executed after the update state equation for every sample.
     def _post_update_hook(self, states, inputs, forward_i, sample_i):
         """
@@ -490,6 +538,18 @@ class Node(nn.Module):
         return states
     # end _post_step_update_hook
 
+    # Hook which gets executed after the update state equation for every timesteps (batched mode).
+    def _post_step_batch_update_hook(self, states, inputs, forward_i, t):
+        """
+        Hook which gets executed after the update equation for every timesteps in batched mode
+        :param states: Reservoir's states for the whole batch (batch size x output dim).
+        :param inputs: Input signal for the whole batch (batch size x input dim).
+        :param forward_i: Index of forward call
+        :param t: Timestep
+        """
+        return states
+    # end _post_step_batch_update_hook
+
     # endregion PRIVATE
 
     # region OVERRIDE
@@ -42,6 +42,7 @@ from .reservoir.BDESNPCA import BDESNPCA
 from .reservoir.EESN import EESN
 from .reservoir.ESN import ESN
 from .reservoir.ESNCell import ESNCell
+from .reservoir.ESNStream import ESNStream
 from .reservoir.GatedESN import GatedESN
 from .reservoir.HESN import HESN
 from .reservoir.LiESN import LiESN
@@ -57,6 +58,6 @@ from .utils.Identity import Identity
 # All
 __all__ = [
     'Conceptor', 'ConceptorNet', 'ICACell', 'OnlinePCACell', 'PCACell', 'SFACell',
-    'BDESN', 'BDESNPCA', 'EESN', 'ESN', 'ESNCell', 'GatedESN', 'HESN', 'LiESN', 'LiESNCell', 'Node', 'StackedESN',
+    'BDESN', 'BDESNPCA', 'EESN', 'ESN', 'ESNCell', 'ESNStream', 'GatedESN', 'HESN', 'LiESN', 'LiESNCell', 'Node', 'StackedESN',
     'RRCell', 'Identity', 'CSTLoss'
 ]
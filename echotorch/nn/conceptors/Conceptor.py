@@ -31,7 +31,7 @@ from typing import Union, List
 from torch.autograd import Variable
 import math
 from ..NeuralFilter import NeuralFilter
-from echotorch.utils.utility_functions import generalized_squared_cosine
+from echotorch.utils.utility_functions import generalized_squared_cosine, generalized_squared_cosine_svd
 
 
 # Conceptor base class
@@ -41,12 +41,13 @@ class Conceptor(NeuralFilter):
     """
 
     # Constructor
-    def __init__(self, input_dim, aperture, *args, **kwargs):
+    def __init__(self, input_dim, aperture, *args, accumulation_dtype=None, **kwargs):
         """
         Constructor
         :param input_dim: Conceptor dimension
         :param aperture: Aperture parameter
         :param args: Arguments
+        :param accumulation_dtype: Data type used to accumulate the correlation matrix (default: dtype)
         :param kwargs: Propositional arguments
         """
         # Superclass
@@ -60,13 +61,18 @@ class Conceptor(NeuralFilter):
         # Parameters
         self._aperture = aperture
         self._n_samples = 0
+        self._accumulation_dtype = accumulation_dtype
+        self._R_accumulator = None
         c_size = input_dim
 
-        # Initialize correlation matrix R
-        self.register_buffer('R', Variable(torch.zeros(c_size, c_size, dtype=self._dtype), requires_grad=False))
+        # Versions of R and C, cached eigendecompositions as (version, eigenvalues, eigenvectors)
+        # and cached SVD of C as (version, U, S, V)
+        self._versions = {'C': 0, 'R': 0}
+        self._eigen_cache = {'C': None, 'R': None}
+        self._svd_cache = None
 
-        # Initialize Conceptor matrix C
-        self.register_buffer('C', Variable(torch.zeros(c_size, c_size, dtype=self._dtype), requires_grad=False))
+        # Initialize correlation matrix R and Conceptor matrix C
+        self._init_matrices(c_size)
     # end __init__
 
     # region PROPERTIES
@@ -108,18 +114,22 @@ class Conceptor(NeuralFilter):
         Singular values
         :return: Singular values as a vector
         """
-        (U, S, V) = torch.svd(self.C)
-        return S
+        return self._eigen()[0].abs()
     # end SV
 
     # Singular values decomposition on C
     @property
     def SVD(self):
         """
-        Singular values decomposition on C
-        :return: Singular values as a vector
+        Singular values decomposition on C (computed once and kept until C changes)
+        :return: U, S, V
         """
-        return torch.svd(self.C)
+        # Cached SVD still valid
+        if self._svd_cache is None or self._svd_cache[0] != self._versions['C']:
+            U, S, V = torch.svd(self.C)
+            self._svd_cache = (self._versions['C'], U, S, V)
+        # end if
+        return tuple(m.clone() for m in self._svd_cache[1:])
     # end SVD
 
     # Quota
@@ -145,16 +155,29 @@ class Conceptor(NeuralFilter):
         """
         Modify singular values with a function
         """
-        # SVD on C
-        Uc, Sc, Vc = torch.svd(self.C)
+        # Eigendecomposition of C
+        Sc, Uc = self._eigen()
 
         # Modify singular values with the function
-        new_Sc = svs_func(Sc)
+        new_Sc = svs_func(Sc.abs())
 
         # Apply the change to C
-        self.C = torch.mm(Uc, torch.mm(torch.diag(new_Sc), Vc.t()))
+        self.C = torch.mm(Uc * new_Sc, Uc.t())
     # end modify_SVs
 
+    # Eigendecomposition of C or R
+    def eigen(self, based_on='C'):
+        """
+        Eigendecomposition of the symmetric matrix C or R, computed once and kept until the matrix changes
+        (set_R, set_C, update_C, update_R, finalize, in-place operators or assignment of C or R). The cached
+        decomposition is shared with copies of the conceptor, copies of it are returned.
+        :param based_on: Conceptor matrix ('C') or correlation matrix ('R')
+        :return: Eigenvalues (descending order), eigenvectors (as columns)
+        """
+        S, U = self._eigen(based_on)
+        return S.clone(), U.clone()
+    # end eigen
+
     # The conceptor is empty (zero matrix)
     def is_null(self):
         """
@@ -192,13 +215,59 @@ class Conceptor(NeuralFilter):
         return X
     # end filter_fit
 
+    # Accumulate states into the correlation matrix
+    def accumulate(self, X, time_length=None, n_samples=0):
+        """
+        Add the states of a batch, or of a chunk of the time steps of a batch, to the correlation
+        matrix with a single matrix product, so that long state sequences can be learned chunk by chunk.
+        :param X: States (batch size x chunk length x dim, chunk length x dim or dim)
+        :param time_length: Whole time length of the samples (default: length of X)
+        :param n_samples: Number of new samples to count (batch size for whole sequences, zero for the next chunks)
+        """
+        # Normalization by the time length
+        if time_length is None:
+            time_length = X.size(-2) if X.ndim > 1 else 1
+        # end if
+
+        # Accumulator (R, or a matrix with the accumulation data type)
+        accumulator = self._accumulator()
+
+        # All states as rows
+        X = X.reshape(-1, X.size(-1)).to(accumulator.dtype)
+
+        # R += X^T * X / time length
+        accumulator.addmm_(X.t(), X, alpha=1.0 / float(time_length))
+        self._invalidate('R')
+
+        # Inc. n samples
+        self._n_samples += n_samples
+    # end accumulate
+
+    # Accumulate states as a post-states-update handler
+    def accumulate_handler(self, states, inputs, forward_i, sample_i):
+        """
+        Accumulate the states of a sample when connected to a reservoir cell with
+        cell.connect("post-states-update", conceptor.accumulate_handler)
+        :param states: States of the sample (time length x dim)
+        :param inputs: Inputs of the sample
+        :param forward_i: Forward call index
+        :param sample_i: Sample index
+        """
+        if self.training:
+            self.accumulate(states, n_samples=1)
+        # end if
+    # end accumulate_handler
+
     # Filter transform
     def filter_transform(self, X, *args, **kwargs):
         """
         Filter transform
-        :param X: Input signal to filter
+        :param X: Input signal to filter (dim, or batch size x dim)
         :return: Filtered signal
         """
+        if X.ndim == 2:
+            return torch.mm(X, self.C.t())
+        # end if
         return self.C.mv(X)
     # end filter_transform
 
@@ -207,8 +276,13 @@ class Conceptor(NeuralFilter):
         """
         Finalize training (learn C from R)
         """
-        # Average R
-        self.R /= self._n_samples
+        # Average R (and add the states accumulated with another data type)
+        if self._R_accumulator is not None:
+            self.R = ((self.R.to(self._R_accumulator.dtype) + self._R_accumulator) / self._n_samples).to(self.R.dtype)
+            self._R_accumulator = None
+        else:
+            self.R /= self._n_samples
+        # end if
 
         # Debug for R
         self._call_debug_point("R", self.C, "Conceptor", "finalize")
@@ -231,8 +305,13 @@ class Conceptor(NeuralFilter):
         """
         # No samples
         self._n_samples = 0
+        self._R_accumulator = None
         self.R.fill_(0.0)
         self.C.fill_(0.0)
+
+        # Cached decompositions
+        self._invalidate('R')
+        self._invalidate('C')
     # end reset
 
     # Set correlation matrix
@@ -280,18 +359,49 @@ class Conceptor(NeuralFilter):
     # Update Conceptor matrix C
     def update_C(self):
         """
-        Update Conceptor matrix C
+        Update Conceptor matrix C, the eigenvalues of R are rescaled to
+        s / (s + aperture^-2) with the cached eigendecomposition of R.
         """
-        self.C = Conceptor.computeC(self.R, self.aperture)
+        # Aperture^-2 (infinite aperture is not defined on the null space of R)
+        aperture_inv = math.pow(self.aperture, -2)
+
+        if aperture_inv > 0:
+            # Eigendecomposition of R (positive semi-definite, negative eigenvalues are rounding errors)
+            S, U = self._eigen('R')
+            S = S.clamp(min=0.0)
+
+            # C = U * diag(s / (s + a^-2)) * U^T
+            Sc = S / (S + aperture_inv)
+            self.C = torch.mm(U * Sc, U.t())
+
+            # C has the same eigenvectors
+            self._set_eigen('C', Sc, U)
+        else:
+            self.C = Conceptor.computeC(self.R, self.aperture)
+        # end if
         self.train(False)
     # end update_C
 
     # Update correlation matrix R
     def update_R(self):
         """
-        Update correlation matrix R
+        Update correlation matrix R, the eigenvalues of C are rescaled to
+        aperture^-2 * s / (1 - s) with the cached eigendecomposition of C.
         """
-        self.R = Conceptor.computeR(self.C, self.aperture)
+        # Eigendecomposition of C
+        S, U = self._eigen('C')
+
+        # R is only defined if all eigenvalues are below one
+        if torch.all(S < 1.0) and self.aperture != 0:
+            # R = U * diag(a^-2 * s / (1 - s)) * U^T
+            Sr = math.pow(self.aperture, -2) * S / (1.0 - S)
+            self.R = torch.mm(U * Sr, U.t())
+
+            # R has the same eigenvectors
+            self._set_eigen('R', Sr, U)
+        else:
+            self.R = Conceptor.computeR(self.C, self.aperture)
+        # end if
         self.train(False)
     # end update_R
 
@@ -301,26 +411,26 @@ class Conceptor(NeuralFilter):
         Multiply aperture by a factor
         :param gamma: Multiply aperture by a factor.
         """
-        # Dimension
-        dim = self.dim
+        # Eigendecomposition of C
+        S, U = self._eigen()
+        S = S.abs()
 
         # Multiply by 0
         if gamma == 0:
-            (U, S, V) = torch.svd(self.C)
-            Sdiag = S
-            Sdiag[Sdiag < 1] = torch.zeros((sum(Sdiag < 1), 1))
-            Cnew = torch.mm(U, torch.mm(torch.diag(Sdiag), U.t()))
+            Snew = S.clone()
+            Snew[Snew < 1] = 0.0
         elif gamma == float("inf"):
-            (U, S, V) = torch.svd(self.C)
-            Sdiag = S
-            Sdiag[Sdiag > 0] = torch.ones(sum(Sdiag > 0), 1)
-            Cnew = torch.mm(U, torch.mm(torch.diag(Sdiag), U.t()))
+            Snew = S.clone()
+            Snew[Snew > 0] = 1.0
         else:
-            Cnew = torch.mm(self.C, torch.inverse(self.C + math.pow(gamma, -2) * (torch.eye(dim) - self.C)))
+            # Eigenvalues of C * (C + gamma^-2 * (I - C))^-1
+            Snew = S / (S + math.pow(gamma, -2) * (1.0 - S))
         # end
 
-        # Set aperture and C
-        self.set_C(Cnew, self._aperture * gamma)
+        # Set aperture and C (same eigenvectors), then R
+        self.set_C(torch.mm(U * Snew, U.t()), self._aperture * gamma, compute_R=False)
+        self._set_eigen('C', Snew, U)
+        self.update_R()
     # end PHI
 
     # AND in Conceptor Logic
@@ -340,16 +450,10 @@ class Conceptor(NeuralFilter):
         # Same conceptor ?
         same_conceptor = torch.all(torch.eq(Cc, Bc))
 
-        # Apertures
-        C_aperture = self.aperture
-        B_aperture = B.aperture
-
-        # Same aperture
-        same_aperture = C_aperture == B_aperture
-
-        # SV on both conceptor
-        (UC, SC, UtC) = torch.svd(Cc)
-        (UB, SB, UtB) = torch.svd(Bc)
+        # SV on both conceptor (eigendecompositions, conceptors being symmetric)
+        SCe, UC = self._eigen()
+        SBe, UB = B._eigen()
+        SC, SB = SCe.abs(), SBe.abs()
 
         # Get singular values
         dSC = SC
@@ -359,9 +463,22 @@ class Conceptor(NeuralFilter):
         numRankC = int(torch.sum(1.0 * (dSC > tol)))
         numRankB = int(torch.sum(1.0 * (dSB > tol)))
 
+        # Full rank conceptors, C AND B = (C^-1 + B^-1 - I)^-1 from the eigendecompositions
+        if numRankC == dim and numRankB == dim:
+            # Eigendecomposition of C^-1 + B^-1 - I (eigenvalues >= 1)
+            S_inv, U = Conceptor._symmetric_eigen(
+                torch.mm(UC / SCe, UC.t()) + torch.mm(UB / SBe, UB.t()) - torch.eye(dim, dtype=UC.dtype)
+            )
+
+            # Eigenvalues of C AND B in descending order
+            SandB, UandB = torch.flip(1.0 / S_inv, dims=[0]), torch.flip(U, dims=[1])
+            return self._new_conceptor_from_and(B, torch.mm(UandB * SandB, UandB.t()), same_conceptor,
+                                                (SandB, UandB))
+        # end if
+
         # Select zero singular vector
-        UC0 = UC[:, numRankC:]
-        UB0 = UB[:, numRankB:]
+        UC0 = UC[:, SC <= tol]
+        UB0 = UB[:, SB <= tol]
 
         # SVD on UC0 + UB0
         # (W, Sigma, Wt) = lin.svd(np.dot(UC0, UC0.T) + np.dot(UB0, UB0.T))
@@ -376,35 +493,11 @@ class Conceptor(NeuralFilter):
         # C and B
         # Wgk * (Wgk^T * (C^-1 + B^-1 - I) * Wgk)^-1 * Wgk^T
         # CandB = Wgk @ torch.inverse(Wgk.t() @ (torch.pinverse(Cc, tol) + torch.pinverse(Bc, tol) - torch.eye(dim)) @ Wgk) @ Wgk.t()
-        CandB = torch.mm(torch.mm(Wgk, torch.inverse(torch.mm(Wgk.t(), torch.mm((torch.pinverse(Cc, tol) + torch.pinverse(Bc, tol) - torch.eye(dim)), Wgk)))), Wgk.t())
+        pinv_C = Conceptor._pinverse_svd(UC, SC, UC * torch.sign(SCe), tol)
+        pinv_B = Conceptor._pinverse_svd(UB, SB, UB * torch.sign(SBe), tol)
+        CandB = torch.mm(torch.mm(Wgk, torch.inverse(torch.mm(Wgk.t(), torch.mm((pinv_C + pinv_B - torch.eye(dim)), Wgk)))), Wgk.t())
 
-        # New conceptor
-        new_conceptor = Conceptor(
-            input_dim=dim,
-            aperture=1
-        )
-
-        # Cet C
-        # TODO: Problem with aperture of a AND of two different conceptors
-        if same_conceptor:
-            new_conceptor.set_C(
-                C=CandB,
-                aperture=1.0 / math.sqrt(math.pow(C_aperture, -2) + math.pow(B_aperture, -2))
-            )
-        elif not same_conceptor and same_aperture:
-            new_conceptor.set_C(
-                C=CandB,
-                aperture=C_aperture
-            )
-        else:
-            # print("WARNING: Computing the AND of two different conceptors with different aperture is hazardous (aperture put to 1)")
-            new_conceptor.set_C(
-                C=CandB,
-                aperture=1.0
-            )
-        # end if
-
-        return new_conceptor
+        return self._new_conceptor_from_and(B, CandB, same_conceptor)
     # end AND
 
     # AND in Conceptor Logic
@@ -505,6 +598,68 @@ class Conceptor(NeuralFilter):
         # end if
     # end sim
 
+    # Aperture measure for candidate apertures
+    def aperture_curve(self, apertures, measure='delta'):
+        """
+        Measure for candidate apertures, computed for all candidates at once from the cached
+        eigenvalues of C (eigenvalues s / (s + gamma^-2 * (1 - s)) of PHI(C, gamma) with
+        gamma = candidate aperture / aperture) instead of computing a conceptor per candidate.
+        :param apertures: Candidate apertures (tensor or list)
+        :param measure: 'delta' (d ||C||^2 / d log(aperture)), 'norm' (||C||^2), 'quota' or
+        'attenuation' (tr((I - C)^2 * R) / tr(R))
+        :return: Measure for each candidate aperture
+        """
+        # Eigenvalues of C for each candidate (candidates x dim)
+        S = self._eigen()[0].abs()
+        Sa = Conceptor._phi_eigenvalues(S, torch.as_tensor(apertures, dtype=S.dtype) / self.aperture)
+
+        # Measure
+        if measure == 'delta':
+            # d s / d log(aperture) = 2 * s * (1 - s)
+            return 4.0 * torch.sum(Sa * Sa * (1.0 - Sa), dim=1)
+        elif measure == 'norm':
+            return torch.sum(Sa * Sa, dim=1)
+        elif measure == 'quota':
+            return torch.sum(Sa, dim=1) / self.input_dim
+        elif measure == 'attenuation':
+            Sr = self._eigen('R')[0].clamp(min=0.0)
+            return torch.sum(Sr * torch.pow(1.0 - Sa, 2), dim=1) / torch.sum(Sr)
+        else:
+            raise Exception("Unknown aperture measure {}".format(measure))
+        # end if
+    # end aperture_curve
+
+    # Best aperture among candidates
+    def optimal_aperture(self, apertures=None, measure='delta', target=None):
+        """
+        Best aperture among candidates, the one maximizing the delta measure (steepest change of ||C||^2
+        with log(aperture)) or the one whose measure is closest to a target (e.g. a quota).
+        :param apertures: Candidate apertures (default: 1000 apertures between 10^-2 and 10^4)
+        :param measure: Measure ('delta', 'norm', 'quota' or 'attenuation')
+        :param target: Target value of the measure (None to maximize the delta measure)
+        :return: Aperture, value of the measure
+        """
+        # Default candidates
+        if apertures is None:
+            apertures = torch.logspace(-2, 4, 1000, dtype=torch.float64)
+        # end if
+        apertures = torch.as_tensor(apertures, dtype=torch.float64)
+
+        # Measure for all candidates
+        curve = self.aperture_curve(apertures, measure)
+
+        # Maximum of delta or closest to the target
+        if target is None:
+            if measure != 'delta':
+                raise Exception("A target is needed to select an aperture with measure {}".format(measure))
+            # end if
+            best_i = int(torch.argmax(curve))
+        else:
+            best_i = int(torch.argmin(torch.abs(curve - target)))
+        # end if
+        return float(apertures[best_i]), float(curve[best_i])
+    # end optimal_aperture
+
     # Delta measure (sensibility of Frobenius norm to change of aperture)
     def delta(self, gamma, epsilon=0.01):
         """
@@ -534,6 +689,17 @@ class Conceptor(NeuralFilter):
         new_C = Conceptor(self.input_dim, self.aperture)
         new_C.set_R(self.R, compute_C=False)
         new_C.set_C(self.C, self.aperture, compute_R=False)
+
+        # Share valid cached decompositions
+        for name in ['C', 'R']:
+            cached = self._eigen_cache[name]
+            if cached is not None and cached[0] == self._versions[name]:
+                new_C._set_eigen(name, cached[1], cached[2])
+            # end if
+        # end for
+        if self._svd_cache is not None and self._svd_cache[0] == self._versions['C']:
+            new_C._svd_cache = (new_C._versions['C'],) + self._svd_cache[1:]
+        # end if
         return new_C
     # end copy
 
@@ -549,42 +715,148 @@ class Conceptor(NeuralFilter):
 
     # region PRIVATE
 
-    # Increment correlation matrices
-    def _increment_correlation_matrices(self, X):
+    # New conceptor resulting from an AND
+    def _new_conceptor_from_and(self, B, CandB, same_conceptor, eigen=None):
         """
-        Increment correlation matrices
-        :param X: Reservoir states
+        New conceptor resulting from an AND
+        :param B: Second conceptor operand
+        :param CandB: Conceptor matrix of self AND B
+        :param same_conceptor: Both operands are the same conceptor
+        :param eigen: Eigendecomposition of CandB (eigenvalues, eigenvectors) if known
+        :return: New conceptor
         """
-        if X.ndim == 3:
-            # Learn length
-            learn_length = X.size(1)
+        # Apertures
+        C_aperture = self.aperture
+        B_aperture = B.aperture
 
-            # Batch size
-            batch_size = X.size(0)
+        # Same aperture
+        same_aperture = C_aperture == B_aperture
 
-            # Increment R for each sample
-            for batch_i in range(batch_size):
-                # CoRrelation matrix of reservoir states
-                self.R += (torch.mm(X[batch_i].t(), X[batch_i])) / float(learn_length)
+        # New conceptor
+        new_conceptor = Conceptor(
+            input_dim=self.input_dim,
+            aperture=1
+        )
 
-                # Inc. n samples
-                self._n_samples += 1
-            # end for
-        elif X.ndim == 2:
-            # Learn length
-            learn_length = X.size(0)
+        # Cet C
+        # TODO: Problem with aperture of a AND of two different conceptors
+        if same_conceptor:
+            aperture = 1.0 / math.sqrt(math.pow(C_aperture, -2) + math.pow(B_aperture, -2))
+        elif not same_conceptor and same_aperture:
+            aperture = C_aperture
+        else:
+            # print("WARNING: Computing the AND of two different conceptors with different aperture is hazardous (aperture put to 1)")
+            aperture = 1.0
+        # end if
+
+        # Set C, then R from the eigendecomposition if known
+        new_conceptor.set_C(C=CandB, aperture=aperture, compute_R=eigen is None)
+        if eigen is not None:
+            new_conceptor._set_eigen('C', eigen[0], eigen[1])
+            new_conceptor.update_R()
+        # end if
+
+        return new_conceptor
+    # end _new_conceptor_from_and
+
+    # Matrix accumulating the states
+    def _accumulator(self):
+        """
+        Matrix accumulating the states, R itself or a matrix with the accumulation data type
+        :return: Accumulator matrix
+        """
+        if self._accumulation_dtype is None or self._accumulation_dtype == self.R.dtype:
+            return self.R
+        # end if
+        if self._R_accumulator is None:
+            self._R_accumulator = torch.zeros(self.R.size(), dtype=self._accumulation_dtype, device=self.R.device)
+        # end if
+        return self._R_accumulator
+    # end _accumulator
+
+    # Initialize matrices
+    def _init_matrices(self, c_size):
+        """
+        Initialize correlation matrix R and Conceptor matrix C
+        :param c_size: Conceptor dimension
+        """
+        # Initialize correlation matrix R
+        self.register_buffer('R', Variable(torch.zeros(c_size, c_size, dtype=self._dtype), requires_grad=False))
+
+        # Initialize Conceptor matrix C
+        self.register_buffer('C', Variable(torch.zeros(c_size, c_size, dtype=self._dtype), requires_grad=False))
+    # end _init_matrices
+
+    # Quadratic forms x^T * C * x
+    def _quadratic_form(self, x):
+        """
+        Quadratic forms x^T * C * x for all states at once
+        :param x: Reservoir state(s) (B x T x Nx, T x Nx, or Nx)
+        :return: Quadratic forms (B x T, T, or scalar)
+        """
+        return torch.sum(torch.matmul(x, self.C) * x, dim=-1)
+    # end _quadratic_form
+
+    # Cached eigendecomposition of C or R
+    def _eigen(self, based_on='C'):
+        """
+        Cached eigendecomposition of the symmetric matrix C or R, the tensors are the cached ones and
+        must not be modified in place.
+        :param based_on: Conceptor matrix ('C') or correlation matrix ('R')
+        :return: Eigenvalues (descending order), eigenvectors (as columns)
+        """
+        # Cached decomposition still valid
+        cached = self._eigen_cache[based_on]
+        if cached is not None and cached[0] == self._versions[based_on]:
+            return cached[1], cached[2]
+        # end if
+
+        # From the SVD of C if already computed (C is symmetric positive semi-definite)
+        if based_on == 'C' and self._svd_cache is not None and self._svd_cache[0] == self._versions['C']:
+            self._set_eigen('C', self._svd_cache[2], self._svd_cache[1])
+            return self._svd_cache[2], self._svd_cache[1]
+        # end if
 
-            # CoRrelation matrix of reservoir states
-            self.R += (torch.mm(X.t(), X)) / float(learn_length)
+        # Eigendecomposition of the symmetric matrix
+        S, U = Conceptor._symmetric_eigen(self.C if based_on == 'C' else self.R)
 
-            # Inc. n samples
-            self._n_samples += 1
-        elif X.ndim == 0:
-            # CoRrelation matrix of reservoir states
-            self.R += (torch.mm(X, X.t()))
+        # Keep it
+        self._set_eigen(based_on, S, U)
+        return S, U
+    # end _eigen
+
+    # Invalidate cached decomposition
+    def _invalidate(self, name):
+        """
+        Invalidate the cached decomposition of C or R (new version)
+        :param name: 'C' or 'R'
+        """
+        self._versions[name] += 1
+    # end _invalidate
 
-            # Inc. n samples
-            self._n_samples += 1
+    # Set cached decomposition
+    def _set_eigen(self, name, S, U):
+        """
+        Set the cached decomposition of the current version of C or R
+        :param name: 'C' or 'R'
+        :param S: Eigenvalues (descending order)
+        :param U: Eigenvectors (as columns)
+        """
+        self._eigen_cache[name] = (self._versions[name], S, U)
+    # end _set_eigen
+
+    # Increment correlation matrices
+    def _increment_correlation_matrices(self, X):
+        """
+        Increment correlation matrices
+        :param X: Reservoir states
+        """
+        if X.ndim == 3:
+            # One sample per batch element
+            self.accumulate(X, n_samples=X.size(0))
+        elif X.ndim in [1, 2]:
+            # One sample
+            self.accumulate(X, n_samples=1)
         else:
             raise Exception("Unknown number of dimension for states (X) {}".format(X.size()))
         # end if
@@ -605,6 +877,44 @@ class Conceptor(NeuralFilter):
         return s.format(**self.__dict__)
     # end extra_repr
 
+    # Set attribute
+    def __setattr__(self, name, value):
+        """
+        Set attribute, cached decompositions are invalidated when C or R are replaced
+        :param name: Attribute name
+        :param value: Attribute value
+        """
+        super(Conceptor, self).__setattr__(name, value)
+        if name in ['C', 'R'] and '_versions' in self.__dict__:
+            self._invalidate(name)
+        # end if
+    # end __setattr__
+
+    # Apply a function to the buffers (to, float, cuda, ...)
+    def _apply(self, fn, *args, **kwargs):
+        """
+        Apply a function to the buffers, cached decompositions are invalidated as C and R are replaced
+        :param fn: Function applied to each tensor
+        :return: The module
+        """
+        module = super(Conceptor, self)._apply(fn, *args, **kwargs)
+        self._invalidate('C')
+        self._invalidate('R')
+        return module
+    # end _apply
+
+    # Load buffers from a state dict
+    def _load_from_state_dict(self, state_dict, prefix, *args, **kwargs):
+        """
+        Load buffers from a state dict, cached decompositions are invalidated as C and R are copied in place
+        :param state_dict: State dict
+        :param prefix: Prefix of this module's entries
+        """
+        super(Conceptor, self)._load_from_state_dict(state_dict, prefix, *args, **kwargs)
+        self._invalidate('C')
+        self._invalidate('R')
+    # end _load_from_state_dict
+
     # Hash
     def __hash__(self):
         """
@@ -790,6 +1100,131 @@ class Conceptor(NeuralFilter):
         return C.AND(B, tol=tol)
     # end operator_AND
 
+    # OR of a list of conceptors
+    @staticmethod
+    def OR_all(conceptors, tol=1e-14):
+        """
+        OR of a list of conceptors. When no eigenvalue of the conceptors reaches one, the OR is computed
+        in one pass from the sum of R_k = C_k * (I - C_k)^-1, as C = R * (R + I)^-1, instead of folding
+        pairwise ORs.
+        :param conceptors: List of conceptors (not empty)
+        :param tol: Tolerance
+        :return: OR of all conceptors (aperture of the operands if all the same, 1 otherwise)
+        """
+        # Non-null conceptors
+        operands = [c for c in conceptors if not c.is_null()]
+        if len(operands) == 0:
+            return conceptors[0].copy()
+        elif len(operands) == 1:
+            return operands[0].copy()
+        # end if
+
+        # Eigendecompositions of the operands
+        eigens = [c._eigen() for c in operands]
+
+        # Some eigenvalues reach one, fold pairwise ORs
+        if any(float(torch.max(S)) >= 1.0 - tol for S, _ in eigens):
+            result = operands[0]
+            for c in operands[1:]:
+                result = result.OR(c, tol=tol)
+            # end for
+            return result
+        # end if
+
+        # Sum of C_k * (I - C_k)^-1
+        R = sum([torch.mm(U * (S / (1.0 - S)), U.t()) for S, U in eigens])
+
+        # C = R * (R + I)^-1 with the same eigenvectors
+        S, U = Conceptor._symmetric_eigen(R)
+        S = S.clamp(min=0.0)
+        S = S / (S + 1.0)
+
+        return Conceptor._new_conceptor_from_operands(operands, torch.mm(U * S, U.t()), (S, U))
+    # end OR_all
+
+    # AND of a list of conceptors
+    @staticmethod
+    def AND_all(conceptors, tol=1e-14):
+        """
+        AND of a list of conceptors. When all conceptors are full rank, the AND is computed in one
+        pass as (sum of C_k^-1 - (K - 1) * I)^-1 instead of folding pairwise ANDs.
+        :param conceptors: List of conceptors (not empty)
+        :param tol: Tolerance
+        :return: AND of all conceptors (aperture of the operands if all the same, 1 otherwise)
+        """
+        # Only one
+        if len(conceptors) == 1:
+            return conceptors[0].copy()
+        # end if
+
+        # Eigendecompositions of the operands
+        eigens = [c._eigen() for c in conceptors]
+        dim = conceptors[0].input_dim
+
+        # Some conceptors are not full rank, fold pairwise ANDs
+        if any(int(torch.sum(S.abs() > tol)) < dim for S, _ in eigens):
+            result = conceptors[0]
+            for c in conceptors[1:]:
+                result = result.AND(c, tol=tol)
+            # end for
+            return result
+        # end if
+
+        # Sum of C_k^-1 - (K - 1) * I
+        M = sum([torch.mm(U / S, U.t()) for S, U in eigens])
+        M -= (len(conceptors) - 1) * torch.eye(dim, dtype=M.dtype)
+
+        # Inverse with the same eigenvectors (eigenvalues in descending order)
+        S_inv, U = Conceptor._symmetric_eigen(M)
+        S, U = torch.flip(1.0 / S_inv, dims=[0]), torch.flip(U, dims=[1])
+
+        return Conceptor._new_conceptor_from_operands(conceptors, torch.mm(U * S, U.t()), (S, U))
+    # end AND_all
+
+    # New conceptor resulting from an operation on a list of conceptors
+    @staticmethod
+    def _new_conceptor_from_operands(operands, C, eigen):
+        """
+        New conceptor resulting from an operation on a list of conceptors
+        :param operands: List of conceptors
+        :param C: Resulting conceptor matrix
+        :param eigen: Eigendecomposition of C (eigenvalues, eigenvectors)
+        :return: New conceptor
+        """
+        # Aperture of the operands if all the same
+        apertures = set([c.aperture for c in operands])
+        aperture = apertures.pop() if len(apertures) == 1 else 1.0
+
+        # Set C, then R with the eigendecomposition
+        new_conceptor = Conceptor(input_dim=operands[0].input_dim, aperture=aperture)
+        new_conceptor.set_C(C, aperture=aperture, compute_R=False)
+        new_conceptor._set_eigen('C', eigen[0], eigen[1])
+        new_conceptor.update_R()
+        return new_conceptor
+    # end _new_conceptor_from_operands
+
+    # Eigendecomposition of a symmetric matrix
+    @staticmethod
+    def _symmetric_eigen(M):
+        """
+        Eigendecomposition of a symmetric matrix
+        :param M: Symmetric matrix
+        :return: Eigenvalues (descending order), eigenvectors (as columns)
+        """
+        # Symmetric part
+        M = (M + M.t()) / 2.0
+
+        # Eigendecomposition (torch.linalg appeared in 1.8)
+        if hasattr(torch, 'linalg') and hasattr(torch.linalg, 'eigh'):
+            S, U = torch.linalg.eigh(M)
+        else:
+            S, U = torch.symeig(M, eigenvectors=True)
+        # end if
+
+        # Descending order
+        return torch.flip(S, dims=[0]), torch.flip(U, dims=[1])
+    # end _symmetric_eigen
+
     # PHI in Conceptor Logic
     @staticmethod
     def operator_PHI(C, gamma):
@@ -802,6 +1237,25 @@ class Conceptor(NeuralFilter):
         return C.PHI(gamma)
     # end operator_PHI
 
+    # Pseudo-inverse from a singular value decomposition
+    @staticmethod
+    def _pinverse_svd(U, S, V, rcond):
+        """
+        Pseudo-inverse from a singular value decomposition (same cut-off as torch.pinverse)
+        :param U: Left singular vectors
+        :param S: Singular values
+        :param V: Right singular vectors
+        :param rcond: Singular values below rcond * max(S) are set to zero
+        :return: Pseudo-inverse
+        """
+        S_inv = torch.zeros_like(S)
+        if S.numel() > 0:
+            mask = S > rcond * torch.max(S)
+            S_inv[mask] = 1.0 / S[mask]
+        # end if
+        return torch.mm(V * S_inv, U.t())
+    # end _pinverse_svd
+
     # Compute C from correlation matrix R
     # TODO: Test
     @staticmethod
@@ -940,6 +1394,13 @@ class Conceptor(NeuralFilter):
 
         # Measure
         # return sim_func(Sa, Ua, Sb, Ub)
+        # Generalized squared cosine from the cached decompositions
+        if sim_func is generalized_squared_cosine:
+            Sa, Ua = c1._eigen(based_on)
+            Sb, Ub = c2._eigen(based_on)
+            return generalized_squared_cosine_svd(Sa.abs(), Ua, Sb.abs(), Ub)
+        # end if
+
         if based_on == 'C':
             return sim_func(c1.C, c2.C)
         else:
@@ -949,7 +1410,7 @@ class Conceptor(NeuralFilter):
     # Delta measure (sensibility of Frobenius norm to change of aperture)
     # TODO: Test
     @staticmethod
-    def delta_measure(self, C, gamma, epsilon=0.01):
+    def delta_measure(C, gamma, epsilon=0.01):
         """
         Delta measure (sensibility of Frobenius norm to change of aperture)
         :param C: Conceptor object
@@ -957,20 +1418,33 @@ class Conceptor(NeuralFilter):
         :param epsilon: Epsilon
         :return: Delta measure
         """
-        # Conceptors with two gammas
-        A = Conceptor.operator_PHI(C, gamma - epsilon)
-        B = Conceptor.operator_PHI(C, gamma + epsilon)
+        # Eigenvalues of PHI(C, gamma - epsilon) and PHI(C, gamma + epsilon)
+        S = C._eigen()[0].abs()
+        Sa, Sb = Conceptor._phi_eigenvalues(S, torch.tensor([gamma - epsilon, gamma + epsilon], dtype=S.dtype))
 
         # Gradient of Frobenius norm
-        A_norm = math.pow(torch.norm(A, p=2), 2)
-        B_norm = math.pow(torch.norm(B, p=2), 2)
+        A_norm = torch.sum(Sa * Sa).item()
+        B_norm = torch.sum(Sb * Sb).item()
         d_C_norm = B_norm - A_norm
 
         # Change in log (gamma)
-        d_log_gamma = torch.log(gamma + epsilon) - torch.log(gamma - epsilon)
+        d_log_gamma = math.log(gamma + epsilon) - math.log(gamma - epsilon)
         return d_C_norm / d_log_gamma, d_C_norm
     # end delta
 
+    # Eigenvalues of PHI(C, gamma) for several gammas
+    @staticmethod
+    def _phi_eigenvalues(S, gammas):
+        """
+        Eigenvalues of PHI(C, gamma) for several gammas
+        :param S: Eigenvalues of C
+        :param gammas: Aperture factors (tensor)
+        :return: Eigenvalues s / (s + gamma^-2 * (1 - s)) (gammas x dim)
+        """
+        inv_gamma2 = torch.pow(gammas, -2).unsqueeze(1)
+        return S / (S + inv_gamma2 * (1.0 - S))
+    # end _phi_eigenvalues
+
     # How x fits in Conceptor ellipsoid (Evidence)
     # TODO: Test
     @staticmethod
@@ -978,26 +1452,14 @@ class Conceptor(NeuralFilter):
         """
         How x fits in Conceptor ellipsoid (Evidence)
         :param C: Conceptor object
-        :param x: Reservoir state(s) (T x Nx, or Nx)
-        :return:
+        :param x: Reservoir state(s) (B x T x Nx, T x Nx, or Nx)
+        :return: Evidence for each state (B x T, T, or scalar)
         """
-        if x.ndim == 1:
-            return torch.mv(C.C.t(), x).t().dot(x) / torch.dot(x, x)
-        elif x.ndim == 2:
-            # Time length
-            time_length = x.size(0)
-
-            # Evidence vector
-            evidences_vector = torch.empty(time_length)
-
-            # For each time step
-            for t in range(time_length):
-                evidences_vector[t] = torch.mv(C.C.t(), x[t]).t().dot(x[t]) / torch.dot(x[t], x[t])
-            # end for
-
-            return evidences_vector
+        if x.ndim in [1, 2, 3]:
+            # Quadratic forms x^T * C * x / x^T * x for all states at once
+            return C._quadratic_form(x) / torch.sum(x * x, dim=-1)
         else:
-            raise Exception("Waiting for 1-dim or 2-dim tensor, got {}".format(x.ndim))
+            raise Exception("Waiting for 1-dim, 2-dim or 3-dim tensor, got {}".format(x.ndim))
         # end if
     # end evidence
 
@@ -28,6 +28,7 @@ Created on 26 January 2018
 import torch
 from ..reservoir import ESN
 from .SPESN import SPESN
+from .ConceptorSet import ConceptorSet
 
 
 # Conceptor Network
@@ -65,8 +66,9 @@ class ConceptorNet(SPESN):
         # Current conceptor
         self.conceptor = conceptor
 
-        # Neural filter
+        # Neural filter (per sample, or for the whole batch with batched cells)
         self._esn_cell.connect("neural-filter", self._neural_filter)
+        self._esn_cell.connect("neural-batch-filter", self._neural_batch_filter)
         self._esn_cell.connect("post-states-update", self._post_update_states)
     # end __init__
 
@@ -105,6 +107,11 @@ class ConceptorNet(SPESN):
         :param t: Time t
         :param washout: In washout period
         """
+        # Batched cells filter the whole batch at once
+        if self._esn_cell.batched:
+            return x
+        # end if
+
         if self._conceptor_active and self.conceptor is not None and not self.conceptor.training:
             # Morphing
             if self._morphing_on:
@@ -125,6 +132,60 @@ class ConceptorNet(SPESN):
         # end if
     # end _neural_filter
 
+    # Neural filter for the whole batch
+    def _neural_batch_filter(self, x, ut, forward_i, t, washout):
+        """
+        Neural filter for the whole batch, morphed conceptors are applied as sum_k w_k * (C_k * x)
+        :param x: States to filter (batch size x reservoir size)
+        :param ut: Inputs
+        :param forward_i: Forward call
+        :param t: Time t
+        :param washout: In washout period
+        """
+        if self._conceptor_active and self.conceptor is not None and not self.conceptor.training:
+            # Morphing
+            if self._morphing_on:
+                # Current morphing vectors (batch size x number of conceptors)
+                if self._morphing_type == ConceptorNet.MORPHING_TYPE_TIMELESS:
+                    morphing_vectors = self._morphing_vectors
+                else:
+                    morphing_vectors = self._morphing_vectors[:, t]
+                # end if
+
+                # Conceptor filtering
+                return self.conceptor(x, morphing_vector=morphing_vectors)
+            else:
+                return self.conceptor(x)
+            # end if
+        else:
+            return x
+        # end if
+    # end _neural_batch_filter
+
+    # Conceptors controlling each sample
+    def _controlling_conceptors(self, conceptor_indices):
+        """
+        Conceptors controlling each sample
+        :param conceptor_indices: Name of the conceptor (in the conceptor set) of each sample (list or tensor),
+        or of each sample and time step (tensor, batch size x time length)
+        :return: List of conceptors, index of the conceptor of each sample (and time step) in the list
+        """
+        # Single conceptor
+        if not isinstance(self.conceptor, ConceptorSet):
+            return [self.conceptor], torch.zeros(torch.as_tensor(conceptor_indices).size(), dtype=torch.long)
+        # end if
+
+        # Conceptors used and their positions
+        if isinstance(conceptor_indices, torch.Tensor):
+            names, positions = torch.unique(conceptor_indices, return_inverse=True)
+            names = names.tolist()
+        else:
+            names = list(dict.fromkeys(conceptor_indices))
+            positions = torch.tensor([names.index(k) for k in conceptor_indices], dtype=torch.long)
+        # end if
+        return [self.conceptor.conceptors[k] for k in names], positions
+    # end _controlling_conceptors
+
     # Get states after batch update to train conceptors
     def _post_update_states(self, states, inputs, forward_i, sample_i):
         """
@@ -144,16 +205,37 @@ class ConceptorNet(SPESN):
     # region OVERRIDE
 
     # Forward
-    def forward(self, u, y=None, reset_state=True, morphing_vectors=None):
+    def forward(self, u, y=None, reset_state=True, morphing_vectors=None, conceptor_indices=None):
         """
         Forward
         :param u: Input signal
         :param y: Target outputs (or None if prediction)
         :param reset_state: Reset state before running layer (to zero)
         :param morphing_vectors: Morphing vectors (batch, time, number of conceptors)
+        :param conceptor_indices: Name of the conceptor controlling each sample (batch) or each sample and time
+        step (batch, time), the whole batch is run at once with the conceptors folded in the reservoir (eval only)
         :return: Output (eval) or hidden states (training)
         """
-        if morphing_vectors is not None:
+        if conceptor_indices is not None:
+            # Trained network and conceptors only
+            if self.training or self.conceptor.training:
+                raise Exception("Conceptor-controlled runs are only available once trained")
+            # end if
+
+            # Conceptors and their position for each sample
+            conceptors, positions = self._controlling_conceptors(conceptor_indices)
+            if positions.size(0) != u.size(0):
+                raise Exception(
+                    "Inputs and conceptor indices have different batch sizes ({} != {})".format(
+                        u.size(0),
+                        positions.size(0)
+                    )
+                )
+            # end if
+
+            # Run all samples together
+            return self._output(self._esn_cell._forward_controlled(u, conceptors, positions, reset_state), None)
+        elif morphing_vectors is not None:
             # Save morphing vectors
             self._morphing_vectors = morphing_vectors
 
@@ -22,6 +22,7 @@
 # Imports
 from __future__ import annotations
 import torch
+import concurrent.futures
 from typing import Union, List
 from ..NeuralFilter import NeuralFilter
 from .Conceptor import Conceptor
@@ -57,6 +58,18 @@ class ConceptorSet(NeuralFilter):
 
         # We link conceptors to names
         self._conceptors = dict()
+
+        # Stacked evidence matrices as (set version, tol, positive matrices, negative matrices)
+        self._evidence_cache = None
+
+        # Stacked conceptor matrices as (set version, matrices)
+        self._stack_cache = None
+
+        # Memory conceptor A: sum of the R_k = C_k * (I - C_k)^-1 of the conceptors it contains (name -> (conceptor,
+        # version of C, null conceptor)) and cached A and NOT A as (set version, tol, A, NOT A)
+        self._memory_R = None
+        self._memory_terms = dict()
+        self._memory_cache = None
     # end __init__
 
     # region PROPERTIES
@@ -101,7 +114,8 @@ class ConceptorSet(NeuralFilter):
         NOT A - Subspace not populated by conceptors
         :return: Matrix N (Conceptor)
         """
-        return self.A().NOT()
+        A, not_A = self._memory()
+        return A.NOT() if not_A is None else not_A.copy()
     # end N
 
     # Conceptor matrix of NOT A
@@ -113,25 +127,22 @@ class ConceptorSet(NeuralFilter):
         if self.is_null():
             return torch.eye(self.input_dim, dtype=self._dtype)
         else:
-            return self.N().conceptor_matrix()
+            return self._memory()[1].conceptor_matrix()
         # end if
     # end F
 
     # OR of all conceptors stored
     def A(self, tol=1e-14):
         """
-        OR of all conceptors stored
+        OR of all conceptors stored, updated incrementally when conceptors are added, deleted or modified
         :return: OR (Conceptor) of all conceptors stored
         """
-        # Start at 0
-        A = Conceptor(input_dim=self._conceptor_dim, aperture=1, dtype=self._dtype)
-
-        # For each conceptor
-        for kc, C in self._conceptors.items():
-            A.OR_(C, tol=tol)
-        # end for
+        # Empty set
+        if self.count == 0:
+            return Conceptor(input_dim=self._conceptor_dim, aperture=1, dtype=self._dtype)
+        # end if
 
-        return A
+        return self._memory(tol)[0].copy()
     # end A
 
     # Quota of the set of Conceptors
@@ -144,7 +155,7 @@ class ConceptorSet(NeuralFilter):
         if self.is_null():
             return 0.0
         else:
-            return self.A().quota
+            return self._memory()[0].quota
         # end if
     # end quota
 
@@ -172,48 +183,85 @@ class ConceptorSet(NeuralFilter):
         # end for
     # end PHI
 
+    # Aperture measure of each conceptor for candidate apertures
+    def aperture_curves(self, apertures, measure='delta'):
+        """
+        Measure of each conceptor for candidate apertures (see Conceptor.aperture_curve)
+        :param apertures: Candidate apertures (tensor or list)
+        :param measure: Measure ('delta', 'norm', 'quota' or 'attenuation')
+        :return: Dictionary of measures for each candidate aperture
+        """
+        return {k: c.aperture_curve(apertures, measure) for k, c in self.conceptors.items()}
+    # end aperture_curves
+
+    # Best aperture of each conceptor among candidates
+    def optimal_apertures(self, apertures=None, measure='delta', target=None, apply=False):
+        """
+        Best aperture of each conceptor among candidates (see Conceptor.optimal_aperture)
+        :param apertures: Candidate apertures (default: 1000 apertures between 10^-2 and 10^4)
+        :param measure: Measure ('delta', 'norm', 'quota' or 'attenuation')
+        :param target: Target value of the measure (None to maximize the delta measure)
+        :param apply: Set the best aperture of each conceptor
+        :return: Dictionary of best apertures
+        """
+        # Best aperture of each conceptor
+        apertures = {
+            k: c.optimal_aperture(apertures, measure, target)[0] for k, c in self.conceptors.items()
+        }
+
+        # Set apertures
+        if apply:
+            for k, aperture in apertures.items():
+                self.conceptors[k].aperture = aperture
+            # end for
+        # end if
+        return apertures
+    # end optimal_apertures
+
     # Similarity between conceptors and a given one
     def sim(
             self,
             other: Union[Conceptor, List[Conceptor], ConceptorSet],
             based_on='C',
-            sim_func=generalized_squared_cosine
+            sim_func=generalized_squared_cosine,
+            num_workers=1
     ) -> torch.Tensor:
         """
         Similarity between conceptors and a given one
         :param conceptor:
         :param based_on:
         :param sim_func:
+        :param num_workers: Number of threads computing the similarities (if not the generalized squared cosine)
         """
         if isinstance(other, Conceptor):
-            # Similarity vector
-            sim_vector = torch.zeros(self.count)
-
-            # For each conceptor
-            for i in range(self.count):
-                sim_vector[i] = Conceptor.similarity(
-                    other,
-                    self.conceptors[i],
-                    based_on=based_on,
-                    sim_func=sim_func
-                )
-            # end for
-
-            return sim_vector
+            return self.sim([other], based_on=based_on, sim_func=sim_func, num_workers=num_workers)[:, 0]
         elif isinstance(other, ConceptorSet) or isinstance(other, list):
-            # Similarity vector
+            # Conceptors on both sides
+            conceptors = [self.conceptors[i] for i in range(self.count)]
+            others = [other[j] for j in range(len(other))]
+
+            # All pairs with the Gram matrix of C or R
+            if sim_func is generalized_squared_cosine:
+                return ConceptorSet._generalized_squared_cosine_matrix(
+                    ConceptorSet._stacked_matrices(conceptors, based_on),
+                    ConceptorSet._stacked_matrices(others, based_on)
+                ).float()
+            # end if
+
+            # Similarity matrix
             sim_matrix = torch.zeros(self.count, len(other))
 
-            # For each pair of conceptor
-            for i in range(self.count):
-                for j in range(len(other)):
-                    sim_matrix[i, j] = Conceptor.similarity(
-                        self.conceptors[i],
-                        other[j],
-                        based_on=based_on,
-                        sim_func=sim_func
-                    )
-                # end for
+            # Each pair of conceptor
+            pairs = [(i, j) for i in range(self.count) for j in range(len(other))]
+            sims = ConceptorSet._map_pairs(
+                lambda c1, c2: Conceptor.similarity(c1, c2, based_on=based_on, sim_func=sim_func),
+                conceptors,
+                others,
+                pairs,
+                num_workers
+            )
+            for (i, j), sim in zip(pairs, sims):
+                sim_matrix[i, j] = sim
             # end for
 
             return sim_matrix
@@ -239,30 +287,51 @@ class ConceptorSet(NeuralFilter):
     # end similarity
 
     # Compute similarity matrix between conceptors
-    def similarity_matrix(self, based_on='C', sim_func=generalized_squared_cosine):
+    def similarity_matrix(self, based_on='C', sim_func=generalized_squared_cosine, num_workers=1):
         """
-        Compute similarity matrix between conceptors
+        Compute similarity matrix between conceptors. With the generalized squared cosine, all pairs come from
+        the Gram matrix of the flattened C (or R) matrices, otherwise only the upper triangle is computed
+        (optionally with a pool of threads) and mirrored.
         :param based_on: Similarity based on C ('C') or R ('R)
         :param sim_func: Similarity function (default: generalized squared cosine)
+        :param num_workers: Number of threads computing the similarities (if not the generalized squared cosine)
         :return: Similarity matrix as torch tensor
         """
+        # Conceptors
+        conceptors = [self.conceptors[i] for i in range(self.count)]
+
+        # All pairs with the Gram matrix of C or R
+        if sim_func is generalized_squared_cosine:
+            matrices = ConceptorSet._stacked_matrices(conceptors, based_on)
+            return ConceptorSet._generalized_squared_cosine_matrix(matrices, matrices).float()
+        # end if
+
         # Similarity matrix
         sim_matrix = torch.zeros(self.count, self.count)
 
-        # For each pair of conceptor
-        for i in range(self.count):
-            for j in range(self.count):
-                sim_matrix[i, j] = self.similarity(i, j, based_on, sim_func)
-            # end for
+        # Upper triangle
+        pairs = [(i, j) for i in range(self.count) for j in range(i, self.count)]
+        sims = ConceptorSet._map_pairs(
+            lambda c1, c2: Conceptor.similarity(c1, c2, based_on=based_on, sim_func=sim_func),
+            conceptors,
+            conceptors,
+            pairs,
+            num_workers
+        )
+        for (i, j), sim in zip(pairs, sims):
+            sim_matrix[i, j] = sim
+            sim_matrix[j, i] = sim
         # end for
         return sim_matrix
     # end similarity_matrix
 
     # Intersection matrix between conceptors
-    def intersection_matrix(self, return_rank=False, gamma=1):
+    def intersection_matrix(self, return_rank=False, gamma=1, num_workers=1):
         """
-        Union matrix between conceptors
+        Union matrix between conceptors (AND being commutative, only the upper triangle is computed)
         :param return_rank: Rank of union
+        :param gamma: Aperture adaptation of the intersections
+        :param num_workers: Number of threads computing the intersections
         """
         # Intersection matrix
         if return_rank:
@@ -271,24 +340,31 @@ class ConceptorSet(NeuralFilter):
             intersection_matrix = torch.zeros(self.count, self.count)
         # end if
 
-        # For each pair
-        for i, i_name in enumerate(self._conceptors.keys()):
-            for j, j_name in enumerate(self._conceptors.keys()):
-                # Compute
-                E = Conceptor.operator_AND(self._conceptors[i_name], self._conceptors[j_name])
+        # Intersection measure
+        def intersection(c1, c2):
+            # Compute
+            E = Conceptor.operator_AND(c1, c2)
 
-                # Change aperture
-                if gamma != 1:
-                    E.PHI(gamma)
-                # end if
+            # Change aperture
+            if gamma != 1:
+                E.PHI(gamma)
+            # end if
 
-                # Compute rank or quota
-                if return_rank:
-                    intersection_matrix[i, j] = rank(E.C)
-                else:
-                    intersection_matrix[i, j] = quota(E.C)
-                # end if
-            # end for
+            # Compute rank or quota
+            if return_rank:
+                return rank(E.C)
+            else:
+                return quota(E.C)
+            # end if
+        # end intersection
+
+        # For each pair in the upper triangle
+        conceptors = list(self._conceptors.values())
+        pairs = [(i, j) for i in range(self.count) for j in range(i, self.count)]
+        for (i, j), value in zip(pairs, ConceptorSet._map_pairs(intersection, conceptors, conceptors, pairs,
+                                                                num_workers)):
+            intersection_matrix[i, j] = value
+            intersection_matrix[j, i] = value
         # end for
 
         return intersection_matrix
@@ -314,6 +390,11 @@ class ConceptorSet(NeuralFilter):
         """
         # Empty dict
         self._conceptors = dict()
+
+        # Empty memory
+        self._memory_R = None
+        self._memory_terms = dict()
+        self._memory_cache = None
     # end reset
 
     # Add a conceptor to the set
@@ -357,18 +438,36 @@ class ConceptorSet(NeuralFilter):
         """
         Get morphed conceptor matrix
         """
-        # Start with zero
-        Cm = torch.zeros(self.input_dim, self.input_dim, dtype=self._dtype)
-
-        # For each conceptor
-        for c_i, c_name in enumerate(self.conceptors.keys()):
-            Cc = self.conceptors[c_name]
-            Cm += morphing_vector[c_i] * Cc.C
-        # end for
+        # Stacked conceptor matrices
+        stack = self._stacked_conceptor_matrices()
 
-        return Cm
+        # Weighted sum of the conceptor matrices
+        morphing_vector = torch.as_tensor(morphing_vector, dtype=stack.dtype)
+        return torch.tensordot(morphing_vector, stack, dims=1).to(self._dtype)
     # end morphed_C
 
+    # Filter states with morphed conceptors
+    def morphed_filter(self, X, morphing_vectors):
+        """
+        Filter states with morphed conceptors, (sum_k w_k * C_k) * x is computed as sum_k w_k * (C_k * x) with
+        the stacked conceptor matrices, without building the morphed conceptor matrix.
+        :param X: States (dim, or batch size x dim)
+        :param morphing_vectors: Morphing vectors (number of conceptors, or batch size x number of conceptors)
+        :return: Filtered states (same size as X)
+        """
+        # Stacked conceptor matrices (K x Nx x Nx)
+        stack = self._stacked_conceptor_matrices()
+        n_conceptors, dim, _ = stack.size()
+
+        # C_k * x for all conceptors (batch size x K x Nx)
+        states = X.reshape(-1, dim).to(stack.dtype)
+        Cx = torch.mm(states, stack.view(n_conceptors * dim, dim).t()).view(-1, n_conceptors, dim)
+
+        # Sum weighted by the morphing vectors
+        weights = torch.as_tensor(morphing_vectors, dtype=stack.dtype).reshape(-1, 1, n_conceptors)
+        return torch.bmm(weights, Cx).view(X.size()).to(X.dtype)
+    # end morphed_filter
+
     # Negative evidence for a Conceptor
     # TODO: Test
     def Eneg(self, conceptor_i, x, tol=1e-14):
@@ -388,21 +487,12 @@ class ConceptorSet(NeuralFilter):
             # end if
         # end for
 
-        # Start at 0
-        others = Conceptor(input_dim=self._conceptor_dim, aperture=1, dtype=self._dtype)
-
-        # For each conceptor
-        for kc, C in self._conceptors.items():
-            if kc != conceptor_i:
-                others.OR_(C, tol=tol)
-            # end if
-        # end for
-
-        # NOT others
-        not_others = Conceptor.operator_NOT(others)
+        # NOT(OR of other conceptors), computed once per version of the set
+        _, negative_matrices = self.evidence_matrices(tol=tol)
+        c_i = list(self._conceptors.keys()).index(conceptor_i)
 
         # Tensor dim
-        return Conceptor.evidence(not_others, x)
+        return ConceptorSet._quadratic_evidences(negative_matrices[c_i:c_i+1], x)[..., 0]
     # end Eneg
 
     # Positive evidence for a conceptor
@@ -434,48 +524,294 @@ class ConceptorSet(NeuralFilter):
     # TODO: Test
     def evidences(self, x, based_on='both', average=False):
         """
-        Get evidences for each conceptor
-        :param x: Matrix of points in the reservoir space (T x Nx)
+        Get evidences for each conceptor, all conceptors and time steps are computed at once
+        :param x: Matrix of points in the reservoir space (T x Nx, or B x T x Nx)
         :param based_on: both (positive evidence + negative evidence), positive, negative
-        :return: Evidence matrix with evidence for each conceptor (T x conceptors)
-        """
-        # A single point in reservoir space
-        if x.ndim == 2:
-            # Time length
-            time_length = x.size(0)
-
-            # Evidence vector
-            evidences_matrix = torch.zeros(time_length, self.count)
-
-            # For each conceptor
-            for c_i, k in enumerate(self.conceptors.keys()):
-                # Evidences for this conceptor
-                if based_on == 'both':
-                    evidences_matrix[:, c_i] = self.E(k, x)
-                elif based_on == 'positive':
-                    evidences_matrix[:, c_i] = self.Eplus(k, x)
-                elif based_on == 'negative':
-                    evidences_matrix[:, c_i] = self.Eneg(k, x)
-                else:
-                    raise Exception("Waiting for both, positive or negative for based_on, got {}".format(based_on))
-                # end if
-            # end for
+        :param average: Average over time
+        :return: Evidence matrix with evidence for each conceptor (T x conceptors, or B x T x conceptors)
+        """
+        # Check dimension
+        if x.ndim not in [2, 3]:
+            raise Exception("Waiting for 2-dim or 3-dim tensor, got {} instead".format(x.ndim))
+        # end if
+
+        # Matrices of the quadratic forms
+        if based_on == 'both':
+            positive_matrices, negative_matrices = self.evidence_matrices()
+            evidence_matrices = (positive_matrices + negative_matrices) / 2.0
+        elif based_on == 'positive':
+            evidence_matrices = self._stacked_conceptor_matrices()
+        elif based_on == 'negative':
+            evidence_matrices = self.evidence_matrices()[1]
+        else:
+            raise Exception("Waiting for both, positive or negative for based_on, got {}".format(based_on))
+        # end if
+
+        # Evidences (T x conceptors or B x T x conceptors)
+        evidences_matrix = ConceptorSet._quadratic_evidences(evidence_matrices, x)
+
+        # Average
+        if average:
+            return torch.mean(evidences_matrix, axis=-2)
+        else:
+            return evidences_matrix
+        # end if
+    # end evidences
+
+    # Matrices of positive and negative evidences
+    def evidence_matrices(self, tol=1e-14):
+        """
+        Stacked conceptor matrices (positive evidences) and NOT(OR of the other conceptors) matrices
+        (negative evidences). The OR chains are computed once and kept until a conceptor is added,
+        deleted or modified.
+        :param tol: Tolerance of the OR operations
+        :return: Positive matrices (conceptors x Nx x Nx), negative matrices (conceptors x Nx x Nx)
+        """
+        # Version of the set
+        version = self._version()
 
-            # Average
-            if average:
-                return torch.mean(evidences_matrix, axis=0)
+        # Cached matrices still valid
+        if self._evidence_cache is not None and self._evidence_cache[0] == version and \
+                self._evidence_cache[1] == tol:
+            return self._evidence_cache[2], self._evidence_cache[3]
+        # end if
+
+        # NOT others for each conceptor
+        negative_matrices = torch.empty(self.count, self._conceptor_dim, self._conceptor_dim, dtype=self._dtype)
+        for c_i, k in enumerate(self._conceptors.keys()):
+            # OR of the other conceptors
+            others = [C for kc, C in self._conceptors.items() if kc != k]
+            if len(others) > 0:
+                others = Conceptor.OR_all(others, tol=tol)
             else:
-                return evidences_matrix
+                others = Conceptor(input_dim=self._conceptor_dim, aperture=1, dtype=self._dtype)
             # end if
-        elif x.ndim == 3:
-            raise Exception("Waiting for 2-dim tensor, got {} instead".format(x.ndim))
-        #end if
-    # end evidences
+
+            # NOT others
+            negative_matrices[c_i] = Conceptor.operator_NOT(others).C
+        # end for
+
+        # Keep them
+        positive_matrices = self._stacked_conceptor_matrices()
+        self._evidence_cache = (version, tol, positive_matrices, negative_matrices)
+        return positive_matrices, negative_matrices
+    # end evidence_matrices
 
     # endregion PUBLIC
 
     # region PRIVATE
 
+    # Memory conceptor
+    def _memory(self, tol=1e-14):
+        """
+        Memory conceptor A (OR of all conceptors) and NOT A. A = R * (R + I)^-1 where R is the sum of the
+        R_k = C_k * (I - C_k)^-1, the terms of the conceptors added, deleted or modified since the last
+        call are added to or subtracted from R, so only one eigendecomposition is needed whatever the
+        number of conceptors stored.
+        :param tol: Tolerance
+        :return: A, NOT A (Conceptor)
+        """
+        # Version of the set
+        version = self._version()
+
+        # Cached conceptors still valid
+        if self._memory_cache is not None and self._memory_cache[0] == version and self._memory_cache[1] == tol:
+            return self._memory_cache[2], self._memory_cache[3]
+        # end if
+
+        # Update R incrementally
+        if self._update_memory_R(tol):
+            # A = R * (R + I)^-1 with the eigenvalues of R
+            S, U = Conceptor._symmetric_eigen(self._memory_R)
+            S = S.clamp(min=0.0)
+            S = S / (S + 1.0)
+
+            # Operands giving the aperture
+            operands = [c for c in self._conceptors.values() if not c.is_null()]
+            A = Conceptor._new_conceptor_from_operands(
+                operands if len(operands) > 0 else list(self._conceptors.values()),
+                torch.mm(U * S, U.t()),
+                (S, U)
+            )
+        else:
+            # Some eigenvalues reach one, OR of all conceptors
+            A = Conceptor.OR_all(list(self._conceptors.values()), tol=tol)
+        # end if
+
+        # NOT A
+        not_A = A.NOT() if not A.is_null() else None
+
+        # Keep them
+        self._memory_cache = (version, tol, A, not_A)
+        return A, not_A
+    # end _memory
+
+    # Update the sum of the R_k of the memory conceptor
+    def _update_memory_R(self, tol=1e-14):
+        """
+        Update the sum of the R_k = C_k * (I - C_k)^-1 with the conceptors added, deleted or modified
+        :param tol: Tolerance
+        :return: False if the sum cannot be used (some eigenvalues reach one)
+        """
+        # Term of a conceptor
+        def term(c):
+            S, U = c._eigen()
+            return torch.mm(U * (S / (1.0 - S)), U.t())
+        # end term
+
+        # Eigenvalues of the conceptors below one
+        for c in self._conceptors.values():
+            if not c.is_null() and float(torch.max(c._eigen()[0])) >= 1.0 - tol:
+                self._memory_R = None
+                self._memory_terms = dict()
+                return False
+            # end if
+        # end for
+
+        # Terms of the conceptors deleted or replaced
+        for k, (c, c_version, c_null) in list(self._memory_terms.items()):
+            if k not in self._conceptors or self._conceptors[k] is not c or c._versions['C'] != c_version:
+                if c_null:
+                    # Null term
+                    del self._memory_terms[k]
+                elif c._versions['C'] == c_version:
+                    # Same matrix, remove its term
+                    self._memory_R -= term(c)
+                    del self._memory_terms[k]
+                else:
+                    # Term unknown, R computed again from all conceptors
+                    self._memory_R = None
+                    self._memory_terms = dict()
+                    break
+                # end if
+            # end if
+        # end for
+
+        # Terms of the new conceptors
+        for k, c in self._conceptors.items():
+            if k not in self._memory_terms:
+                # Add
+                if self._memory_R is None:
+                    self._memory_R = torch.zeros(self._conceptor_dim, self._conceptor_dim, dtype=c.C.dtype)
+                # end if
+                c_null = bool(c.is_null())
+                if not c_null:
+                    self._memory_R += term(c)
+                # end if
+                self._memory_terms[k] = (c, c._versions['C'], c_null)
+            # end if
+        # end for
+
+        return True
+    # end _update_memory_R
+
+    # Apply a function to pairs of conceptors
+    @staticmethod
+    def _map_pairs(pair_func, conceptors1, conceptors2, pairs, num_workers=1):
+        """
+        Apply a function to pairs of conceptors, in a pool of threads if more than one worker
+        :param pair_func: Function taking two conceptors
+        :param conceptors1: First list of conceptors
+        :param conceptors2: Second list of conceptors
+        :param pairs: List of (i, j) indices
+        :param num_workers: Number of threads
+        :return: List of results (same order as pairs)
+        """
+        # Apply to one pair
+        def apply_pair(pair):
+            return pair_func(conceptors1[pair[0]], conceptors2[pair[1]])
+        # end apply_pair
+
+        # In threads
+        if num_workers > 1:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=num_workers) as executor:
+                return list(executor.map(apply_pair, pairs))
+            # end with
+        # end if
+        return [apply_pair(pair) for pair in pairs]
+    # end _map_pairs
+
+    # Stacked C or R matrices
+    @staticmethod
+    def _stacked_matrices(conceptors, based_on='C'):
+        """
+        Stacked C or R matrices of a list of conceptors
+        :param conceptors: List of conceptors
+        :param based_on: Conceptor matrices ('C') or correlation matrices ('R')
+        :return: Matrices (conceptors x Nx x Nx)
+        """
+        return torch.stack([c.C if based_on == 'C' else c.R for c in conceptors], dim=0)
+    # end _stacked_matrices
+
+    # Generalized squared cosine between all pairs of symmetric matrices
+    @staticmethod
+    def _generalized_squared_cosine_matrix(matrices1, matrices2):
+        """
+        Generalized squared cosine between all pairs of symmetric positive semi-definite matrices.
+        With A = Ua * Sa * Ua^T, ||sqrt(Sa) * Ua^T * Ub * sqrt(Sb)||^2 = tr(A * B) and ||Sa|| = ||A||_F,
+        so the similarities are the cosines between the flattened matrices (one matrix product).
+        :param matrices1: First matrices (K1 x Nx x Nx)
+        :param matrices2: Second matrices (K2 x Nx x Nx)
+        :return: Similarity matrix (K1 x K2)
+        """
+        # Flattened matrices
+        flat1 = matrices1.reshape(matrices1.size(0), -1)
+        flat2 = matrices2.reshape(matrices2.size(0), -1)
+
+        # tr(A * B) for all pairs, divided by the Frobenius norms
+        return torch.mm(flat1, flat2.t()) / torch.ger(torch.norm(flat1, dim=1), torch.norm(flat2, dim=1))
+    # end _generalized_squared_cosine_matrix
+
+    # Version of the set
+    def _version(self):
+        """
+        Version of the set, changes when a conceptor is added, deleted or modified
+        :return: Tuple of (name, conceptor id, conceptor matrix version)
+        """
+        return tuple((k, id(c), c._versions['C']) for k, c in self._conceptors.items())
+    # end _version
+
+    # Stacked conceptor matrices
+    def _stacked_conceptor_matrices(self):
+        """
+        Stacked conceptor matrices
+        :return: Conceptor matrices (conceptors x Nx x Nx)
+        """
+        if self.count == 0:
+            return torch.empty(0, self._conceptor_dim, self._conceptor_dim, dtype=self._dtype)
+        # end if
+
+        # Stacked again only if a conceptor was added, deleted or modified
+        version = self._version()
+        if self._stack_cache is None or self._stack_cache[0] != version:
+            self._stack_cache = (version, torch.stack([c.C for c in self._conceptors.values()], dim=0))
+        # end if
+        return self._stack_cache[1]
+    # end _stacked_conceptor_matrices
+
+    # Quadratic evidences
+    @staticmethod
+    def _quadratic_evidences(matrices, x):
+        """
+        Quadratic forms x^T * M_k * x / x^T * x for all states and matrices with a single matrix product
+        :param matrices: Stacked matrices (K x Nx x Nx)
+        :param x: States (T x Nx or B x T x Nx)
+        :return: Evidences (T x K or B x T x K)
+        """
+        # Dimensions
+        n_matrices, dim, _ = matrices.size()
+
+        # All states as rows
+        states = x.reshape(-1, dim).to(matrices.dtype)
+
+        # x^T * M_k for all k (n states x K x Nx)
+        xM = torch.mm(states, matrices.permute(1, 0, 2).reshape(dim, n_matrices * dim)).view(-1, n_matrices, dim)
+
+        # Quadratic forms normalized by the states' squared norms
+        evidences = torch.sum(xM * states.unsqueeze(1), dim=2) / torch.sum(states * states, dim=1, keepdim=True)
+        return evidences.view(x.shape[:-1] + (n_matrices,))
+    # end _quadratic_evidences
+
     # endregion PRIVATE
 
     # region OVERRIDE
@@ -509,11 +845,8 @@ class ConceptorSet(NeuralFilter):
             # Morphing vector
             morphing_vector = kwargs["morphing_vector"]
 
-            # Morph conceptors
-            Cm = self.morphed_C(morphing_vector)
-
-            # Filter with morphed conceptor
-            return Cm.mv(X)
+            # Filter with morphed conceptors
+            return self.morphed_filter(X, morphing_vector)
         else:
             return self.current_conceptor(X)
         # end if
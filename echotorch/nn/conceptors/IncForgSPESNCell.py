@@ -175,12 +175,18 @@ class IncForgSPESNCell(IncSPESNCell):
         # Debug
         self._call_debug_point("sTs{}".format(self._n_samples), sTs, "IncForgSPESNCell", "_compute_update")
 
-        # Ridge sTs
-        ridge_sTs = sTs + ridge_param * torch.eye(self._output_dim)
+        # Ridge sTs, added on the diagonal of a copy (sTs was given to its debug point)
+        ridge_sTs = sTs.clone()
+        ridge_sTs.diagonal().add_(ridge_param)
 
         # Debug
         self._call_debug_point("ridge_sTs{}".format(self._n_samples), ridge_sTs, "IncForgSPESNCell", "_compute_update")
 
+        # Solve with a Cholesky factorization, no explicit inverse
+        if self._w_learning_algo == "cholesky":
+            return self._cholesky_solve("ridge_sTs", ridge_sTs, sTd, "IncForgSPESNCell", "_compute_update").t()
+        # end if
+
         # Inverse / pinverse
         if self._w_learning_algo == "inv":
             inv_sTs = self._inverse("ridge_sTs", ridge_sTs, "IncForgSPESNCell", "_compute_update")
@@ -317,9 +323,9 @@ class IncForgSPESNCell(IncSPESNCell):
         # Compute the increment for matrix D
         # with adaptive ridge param (*1000 if free zone F is too small)
         if quota(self.F) < 1e-1:
-            self.Dinc = self._compute_increment(X_old, Yinc, self._ridge_param_inc * 1000, F=self._compute_F_matrix())
+            self.Dinc = self._compute_increment(X_old, Yinc, self._ridge_param_inc * 1000, F=self.F)
         else:
-            self.Dinc = self._compute_increment(X_old, Yinc, self._ridge_param_inc, F=self._compute_F_matrix())
+            self.Dinc = self._compute_increment(X_old, Yinc, self._ridge_param_inc, F=self.F)
         # end if
 
         # DEBUG Dinc
@@ -122,12 +122,18 @@ class IncSPESNCell(SPESNCell):
         # Debug
         self._call_debug_point("sTs{}".format(self._n_samples), sTs, "IncSPESNCell", "_compute_increment")
 
-        # Ridge sTs
-        ridge_sTs = sTs + ridge_param * torch.eye(self._output_dim)
+        # Ridge sTs, added on the diagonal of a copy (sTs was given to its debug point)
+        ridge_sTs = sTs.clone()
+        ridge_sTs.diagonal().add_(ridge_param)
 
         # Debug
         self._call_debug_point("ridge_sTs{}".format(self._n_samples), ridge_sTs, "IncSPESNCell", "_compute_increment")
 
+        # Solve with a Cholesky factorization, no explicit inverse
+        if self._w_learning_algo == "cholesky":
+            return self._cholesky_solve("ridge_sTs", ridge_sTs, sTd, "IncSPESNCell", "_compute_increment").t()
+        # end if
+
         # Inverse / pinverse
         if self._w_learning_algo == "inv":
             inv_sTs = self._inverse("ridge_sTs", ridge_sTs, "IncSPESNCell", "_compute_increment")
@@ -265,6 +271,19 @@ class IncSPESNCell(SPESNCell):
         # end if
     # end _input_layer
 
+    # Compute input layer for all time steps
+    def _input_layer_bulk(self, u):
+        """
+        Compute input layer for all time steps
+        :param u: Scaled inputs
+        :return: Processed inputs, or None if they depend on the reservoir states
+        """
+        if not self.training:
+            return None
+        # end if
+        return super(SPESNCell, self)._input_layer_bulk(u)
+    # end _input_layer_bulk
+
     # Hook which gets executed after the update state equation for every sample.
     def _post_update_hook(self, states, inputs, forward_i, sample_i):
         """
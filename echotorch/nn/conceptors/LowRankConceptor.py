@@ -0,0 +1,577 @@
+# -*- coding: utf-8 -*-
+#
+# File : echotorch/nn/conceptors/LowRankConceptor.py
+# Description : Conceptor stored as a truncated eigenbasis
+# Date : 18th of October, 2026
+#
+# This file is part of EchoTorch.  EchoTorch is free software: you can
+# redistribute it and/or modify it under the terms of the GNU General Public
+# License as published by the Free Software Foundation, version 2.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, write to the Free Software Foundation, Inc., 51
+# Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# Copyright Nils Schaetti <nils.schaetti@unine.ch>
+
+"""
+Created on 18 October 2026
+@author: Nils Schaetti
+"""
+
+# Imports
+import torch
+import math
+from .Conceptor import Conceptor
+
+
+# Conceptor stored as a truncated eigenbasis
+class LowRankConceptor(Conceptor):
+    """
+    Conceptor stored as a truncated eigenbasis C = U * diag(s) * U^T, with U (dim x rank) and s (rank).
+    R shares the eigenvectors (eigenvalues aperture^-2 * s / (1 - s)), so C and R are only built when
+    accessed. The rank is selected when the factors are set, by a maximum rank, a fraction of the
+    energy (sum of the eigenvalues) and/or a threshold on the eigenvalues. Evidences, filtering and PHI
+    cost O(dim * rank), AND and OR are computed in the subspace spanned by both operands.
+    """
+
+    # Constructor
+    def __init__(self, input_dim, aperture, *args, rank=None, energy=None, threshold=1e-10, **kwargs):
+        """
+        Constructor
+        :param input_dim: Conceptor dimension
+        :param aperture: Aperture parameter
+        :param args: Arguments
+        :param rank: Maximum rank (None for no limit)
+        :param energy: Fraction of the sum of the eigenvalues to keep (None for all)
+        :param threshold: Eigenvalues below the threshold are dropped
+        :param kwargs: Propositional arguments
+        """
+        # Superclass
+        super(LowRankConceptor, self).__init__(
+            input_dim,
+            aperture,
+            *args,
+            **kwargs
+        )
+
+        # Rank selection
+        self._rank = rank
+        self._energy = energy
+        self._threshold = threshold
+    # end __init__
+
+    # region PROPERTIES
+
+    # Conceptor matrix C
+    @property
+    def C(self):
+        """
+        Conceptor matrix C
+        :return: U * diag(s) * U^T
+        """
+        return torch.mm(self.U * self.s, self.U.t())
+    # end C
+
+    # Set conceptor matrix C
+    @C.setter
+    def C(self, C):
+        """
+        Set conceptor matrix C (truncated eigendecomposition)
+        :param C: Conceptor matrix
+        """
+        S, U = Conceptor._symmetric_eigen(C)
+        self._set_factors(S, U)
+    # end C
+
+    # Correlation matrix R
+    @property
+    def R(self):
+        """
+        Correlation matrix R
+        :return: U * diag(aperture^-2 * s / (1 - s)) * U^T
+        """
+        # R is only defined if all eigenvalues are below one
+        if torch.all(self.s < 1.0) and self.aperture != 0:
+            return torch.mm(self.U * self._correlation_eigenvalues(), self.U.t())
+        # end if
+        return Conceptor.computeR(self.C, self.aperture)
+    # end R
+
+    # Set correlation matrix R
+    @R.setter
+    def R(self, R):
+        """
+        Set correlation matrix R (truncated eigendecomposition)
+        :param R: Correlation matrix
+        """
+        S, U = Conceptor._symmetric_eigen(R)
+        self._set_factors(self._conceptor_eigenvalues(S.clamp(min=0.0), self.aperture), U)
+    # end R
+
+    # Get aperture
+    @property
+    def aperture(self):
+        """
+        Get aperture
+        :return: Aperture
+        """
+        return self._aperture
+    # end aperture
+
+    # Change aperture
+    @aperture.setter
+    def aperture(self, ap):
+        """
+        Change aperture, the eigenvalues of C are recomputed from the ones of R
+        """
+        if not torch.all(self.s < 1.0) or self._aperture == 0:
+            raise Exception("Cannot change the aperture of a conceptor without correlation matrix")
+        # end if
+        Sr = self._correlation_eigenvalues()
+        self._aperture = ap
+        self._set_factors(self._conceptor_eigenvalues(Sr, ap), self.U)
+    # end aperture
+
+    # Rank
+    @property
+    def rank(self):
+        """
+        Rank
+        :return: Number of eigenvectors kept
+        """
+        return self.s.numel()
+    # end rank
+
+    # Singular values decomposition on C
+    @property
+    def SVD(self):
+        """
+        Singular values decomposition on C (truncated)
+        :return: U, S, V
+        """
+        return self.U.clone(), self.s.clone(), self.U.clone()
+    # end SVD
+
+    # endregion PROPERTIES
+
+    # region PUBLIC
+
+    # Modify singular values with a function
+    def modify_SVs(self, svs_func):
+        """
+        Modify singular values with a function
+        """
+        self._set_factors(svs_func(self.s.abs()), self.U)
+    # end modify_SVs
+
+    # The conceptor is empty (zero matrix)
+    def is_null(self):
+        """
+        The conceptor is empty (zero matrix)
+        """
+        return self.rank == 0 or bool(torch.all(self.s == 0))
+    # end is_null
+
+    # Filter transform
+    def filter_transform(self, X, *args, **kwargs):
+        """
+        Filter transform in the eigenbasis
+        :param X: Input signal to filter (dim, or batch size x dim)
+        :return: Filtered signal
+        """
+        if X.ndim == 2:
+            return torch.mm(torch.mm(X, self.U) * self.s, self.U.t())
+        # end if
+        return self.U.mv(self.s * self.U.t().mv(X))
+    # end filter_transform
+
+    # Finalise
+    def finalize(self):
+        """
+        Finalize training (truncated eigendecomposition of the averaged correlation matrix)
+        """
+        # Average the accumulated states
+        self.R = (self._R_accumulator / self._n_samples).to(self._dtype)
+        self._R_accumulator = None
+
+        # Debug for C
+        self._call_debug_point("C", self.C, "Conceptor", "finalize")
+
+        # Out of training mode
+        self.train(False)
+    # end finalize
+
+    # Reset
+    def reset(self):
+        """
+        Reset
+        """
+        # No samples
+        self._n_samples = 0
+        self._R_accumulator = None
+
+        # No eigenvectors
+        self._set_factors(self.s.new_zeros(0), self.U.new_zeros(self.input_dim, 0))
+    # end reset
+
+    # Update Conceptor matrix C
+    def update_C(self):
+        """
+        Update Conceptor matrix C (C and R share the factors)
+        """
+        self.train(False)
+    # end update_C
+
+    # Update correlation matrix R
+    def update_R(self):
+        """
+        Update correlation matrix R (C and R share the factors)
+        """
+        self.train(False)
+    # end update_R
+
+    # Multiply aperture by a factor
+    def PHI(self, gamma):
+        """
+        Multiply aperture by a factor
+        :param gamma: Multiply aperture by a factor.
+        """
+        S = self.s.abs()
+
+        # Multiply by 0
+        if gamma == 0:
+            Snew = S.clone()
+            Snew[Snew < 1] = 0.0
+        elif gamma == float("inf"):
+            Snew = S.clone()
+            Snew[Snew > 0] = 1.0
+        else:
+            # Eigenvalues of C * (C + gamma^-2 * (I - C))^-1
+            Snew = S / (S + math.pow(gamma, -2) * (1.0 - S))
+        # end
+
+        # Same eigenvectors
+        self._aperture = self._aperture * gamma
+        self._set_factors(Snew, self.U)
+    # end PHI
+
+    # AND in Conceptor Logic
+    def AND(self, B, tol=1e-14):
+        """
+        AND in Conceptor Logic, computed in the subspace spanned by both operands
+        :param B: Second conceptor operand
+        :return: Self AND B
+        """
+        return self._subspace_operation(B, lambda C, D: C.AND(D, tol=tol))
+    # end AND
+
+    # OR in Conceptor Logic
+    def OR(self, Q, tol=1e-14):
+        """
+        OR in Conceptor Logic, computed in the subspace spanned by both operands
+        :param Q: Second conceptor operand
+        :return: Self OR Q
+        """
+        return self._subspace_operation(Q, lambda C, D: C.OR(D, tol=tol))
+    # end OR
+
+    # Make a copy of the conceptor
+    def copy(self):
+        """
+        Make a copy of the conceptor
+        """
+        new_C = self._new_conceptor(self.aperture)
+        new_C._set_factors(self.s, self.U)
+        return new_C
+    # end copy
+
+    # Dense conceptor
+    def to_dense(self):
+        """
+        Dense conceptor with the same matrices
+        :return: Conceptor
+        """
+        new_C = Conceptor(self.input_dim, self.aperture, dtype=self._dtype)
+        new_C.set_C(self.C, self.aperture, compute_R=True)
+        return new_C
+    # end to_dense
+
+    # endregion PUBLIC
+
+    # region PRIVATE
+
+    # Initialize matrices
+    def _init_matrices(self, c_size):
+        """
+        Initialize the eigenvectors U and eigenvalues s of C (no eigenvector)
+        :param c_size: Conceptor dimension
+        """
+        self.register_buffer('U', torch.zeros(c_size, 0, dtype=self._dtype))
+        self.register_buffer('s', torch.zeros(0, dtype=self._dtype))
+    # end _init_matrices
+
+    # Cached eigendecomposition of C or R
+    def _eigen(self, based_on='C'):
+        """
+        Truncated eigendecomposition of C or R, the eigenvectors are the U buffer and must not be
+        modified in place
+        :param based_on: Conceptor matrix ('C') or correlation matrix ('R')
+        :return: Eigenvalues (descending order), eigenvectors (dim x rank)
+        """
+        if based_on == 'C':
+            return self.s, self.U
+        # end if
+        return self._correlation_eigenvalues(), self.U
+    # end _eigen
+
+    # Matrix accumulating the states
+    def _accumulator(self):
+        """
+        Matrix accumulating the states until finalize
+        :return: Accumulator matrix
+        """
+        if self._R_accumulator is None:
+            self._R_accumulator = torch.zeros(
+                self.input_dim,
+                self.input_dim,
+                dtype=self._dtype if self._accumulation_dtype is None else self._accumulation_dtype,
+                device=self.U.device
+            )
+        # end if
+        return self._R_accumulator
+    # end _accumulator
+
+    # Quadratic forms x^T * C * x
+    def _quadratic_form(self, x):
+        """
+        Quadratic forms x^T * C * x in the eigenbasis
+        :param x: Reservoir state(s) (B x T x Nx, T x Nx, or Nx)
+        :return: Quadratic forms (B x T, T, or scalar)
+        """
+        return torch.sum(torch.pow(torch.matmul(x, self.U), 2) * self.s, dim=-1)
+    # end _quadratic_form
+
+    # Set eigenvalues and eigenvectors
+    def _set_factors(self, S, U):
+        """
+        Set the eigenvalues and eigenvectors of C, truncated to the selected rank
+        :param S: Eigenvalues (descending order)
+        :param U: Eigenvectors (as columns)
+        """
+        k = LowRankConceptor.select_rank(S, self._rank, self._energy, self._threshold)
+        self.s = S[:k].clone()
+        self.U = U[:, :k].clone()
+        self._invalidate('C')
+        self._invalidate('R')
+    # end _set_factors
+
+    # Eigenvalues of R
+    def _correlation_eigenvalues(self):
+        """
+        Eigenvalues of R
+        :return: aperture^-2 * s / (1 - s)
+        """
+        return math.pow(self.aperture, -2) * self.s / (1.0 - self.s)
+    # end _correlation_eigenvalues
+
+    # New empty conceptor with the same rank selection
+    def _new_conceptor(self, aperture):
+        """
+        New empty conceptor with the same rank selection
+        :param aperture: Aperture
+        :return: LowRankConceptor
+        """
+        return LowRankConceptor(
+            self.input_dim,
+            aperture,
+            rank=self._rank,
+            energy=self._energy,
+            threshold=self._threshold,
+            dtype=self._dtype
+        )
+    # end _new_conceptor
+
+    # Binary operation in the subspace spanned by both operands
+    def _subspace_operation(self, B, operation):
+        """
+        Binary operation in the subspace spanned by both operands. Both conceptors are zero outside
+        this subspace, so the operation is computed on their restrictions (m x m with m <= rank(C) + rank(B))
+        and the result is mapped back.
+        :param B: Second conceptor operand
+        :param operation: Operation on two dense conceptors
+        :return: Resulting conceptor
+        """
+        # Dense operand, dense operation
+        if not isinstance(B, LowRankConceptor):
+            return operation(self.to_dense(), B)
+        # end if
+
+        # Orthonormal basis of the subspace spanned by both operands
+        Q = self._joint_basis(B)
+        if Q.size(1) == 0:
+            return self.copy()
+        # end if
+
+        # Operation on the restrictions
+        result = operation(self._restriction(Q), B._restriction(Q))
+
+        # Map back the eigenvectors
+        S, V = result._eigen()
+        new_C = self._new_conceptor(result.aperture)
+        new_C._set_factors(S, torch.mm(Q, V))
+        new_C.train(False)
+        return new_C
+    # end _subspace_operation
+
+    # Orthonormal basis of the subspace spanned by both conceptors
+    def _joint_basis(self, B):
+        """
+        Orthonormal basis of the subspace spanned by the eigenvectors of both conceptors
+        :param B: Second conceptor
+        :return: Basis (dim x m)
+        """
+        # Part of B's eigenvectors outside the span of U
+        P = B.U - torch.mm(self.U, torch.mm(self.U.t(), B.U))
+
+        # Orthonormal basis of this part
+        if P.size(1) > 0:
+            W, S, _ = torch.svd(P)
+            W = W[:, S > max(P.size()) * torch.finfo(P.dtype).eps]
+        else:
+            W = P
+        # end if
+        return torch.cat((self.U, W), dim=1)
+    # end _joint_basis
+
+    # Restriction to a subspace
+    def _restriction(self, Q):
+        """
+        Dense conceptor restricted to the subspace spanned by an orthonormal basis
+        :param Q: Orthonormal basis (dim x m)
+        :return: Conceptor (m x m)
+        """
+        W = torch.mm(Q.t(), self.U)
+        restriction = Conceptor(Q.size(1), self.aperture, dtype=self._dtype)
+        restriction.set_C(torch.mm(W * self.s, W.t()), self.aperture, compute_R=True)
+        return restriction
+    # end _restriction
+
+    # endregion PRIVATE
+
+    # region OVERRIDE
+
+    # Extra-information
+    def extra_repr(self):
+        """
+        Extra-information
+        :return: String
+        """
+        return super(LowRankConceptor, self).extra_repr() + ', rank={}'.format(self.rank)
+    # end extra_repr
+
+    # Load buffers from a state dict
+    def _load_from_state_dict(self, state_dict, prefix, *args, **kwargs):
+        """
+        Load buffers from a state dict, U and s are resized to the rank of the saved conceptor first
+        :param state_dict: State dict
+        :param prefix: Prefix of this module's entries
+        """
+        for name in ['U', 's']:
+            key = prefix + name
+            if key in state_dict:
+                buffer = self._buffers[name]
+                self._buffers[name] = torch.zeros(state_dict[key].size(), dtype=buffer.dtype, device=buffer.device)
+            # end if
+        # end for
+        super(LowRankConceptor, self)._load_from_state_dict(state_dict, prefix, *args, **kwargs)
+    # end _load_from_state_dict
+
+    # Hash
+    def __hash__(self):
+        """
+        Hash object
+        """
+        return hash((self.U.__hash__(), self.s.__hash__(), self.aperture))
+    # end __hash__
+
+    # endregion OVERRIDE
+
+    # region STATIC
+
+    # Select a rank
+    @staticmethod
+    def select_rank(S, rank=None, energy=None, threshold=None):
+        """
+        Select a rank from eigenvalues in descending order
+        :param S: Eigenvalues (descending order)
+        :param rank: Maximum rank (None for no limit)
+        :param energy: Fraction of the sum of the positive eigenvalues to keep (None for all)
+        :param threshold: Eigenvalues below the threshold are dropped (None for non-positive ones only)
+        :return: Number of eigenvalues to keep
+        """
+        # Eigenvalues above the threshold
+        k = int(torch.sum(S > (0.0 if threshold is None else threshold)))
+
+        # Maximum rank
+        if rank is not None:
+            k = min(k, rank)
+        # end if
+
+        # Smallest rank keeping the energy
+        if energy is not None and k > 0:
+            cum_energy = torch.cumsum(S[:k], dim=0)
+            k = min(k, int(torch.sum(cum_energy < energy * torch.sum(S.clamp(min=0.0)))) + 1)
+        # end if
+        return k
+    # end select_rank
+
+    # Low-rank version of a conceptor
+    @staticmethod
+    def from_conceptor(conceptor, rank=None, energy=None, threshold=1e-10):
+        """
+        Low-rank version of a conceptor
+        :param conceptor: Conceptor
+        :param rank: Maximum rank (None for no limit)
+        :param energy: Fraction of the sum of the eigenvalues to keep (None for all)
+        :param threshold: Eigenvalues below the threshold are dropped
+        :return: LowRankConceptor
+        """
+        new_C = LowRankConceptor(
+            conceptor.input_dim,
+            conceptor.aperture,
+            rank=rank,
+            energy=energy,
+            threshold=threshold,
+            dtype=conceptor.dtype
+        )
+        S, U = conceptor._eigen()
+        new_C._set_factors(S, U)
+        new_C.train(False)
+        return new_C
+    # end from_conceptor
+
+    # Eigenvalues of C from the ones of R
+    @staticmethod
+    def _conceptor_eigenvalues(Sr, aperture):
+        """
+        Eigenvalues of C from the ones of R
+        :param Sr: Eigenvalues of R
+        :param aperture: Aperture
+        :return: s / (s + aperture^-2)
+        """
+        aperture_inv = math.pow(aperture, -2)
+        if aperture_inv > 0:
+            return Sr / (Sr + aperture_inv)
+        # end if
+        return (Sr > 0).to(Sr.dtype)
+    # end _conceptor_eigenvalues
+
+    # endregion STATIC
+
+# end LowRankConceptor
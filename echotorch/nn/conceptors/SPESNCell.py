@@ -28,6 +28,7 @@ Created on 26 January 2018
 import torch
 from torch.autograd import Variable
 from echotorch.nn.reservoir.ESNCell import ESNCell
+from .LowRankConceptor import LowRankConceptor
 import matplotlib.pyplot as plt
 
 
@@ -48,7 +49,7 @@ class SPESNCell(ESNCell):
         """
         Constructor
         :param w_learning_param:
-        :param w_learning_algo:
+        :param w_learning_algo: Inverse (inv), pseudo-inverse (pinv) or Cholesky solve (cholesky)
         :param averaged:
         :param fill_left:
         :param loading_method: Use W (w-loading), D (input-simulation) or R (input recreation)
@@ -81,8 +82,160 @@ class SPESNCell(ESNCell):
         self.register_buffer('R', Variable(torch.zeros(self._input_dim, self._output_dim, dtype=self._dtype), requires_grad=False))
     # end __init__
 
+    # region PUBLIC
+
+    # Loaded matrices for several ridge parameters
+    def ridge_path(self, ridge_params):
+        """
+        Loaded matrices (W, D or R depending on the loading method) for several ridge parameters
+        computed from a single eigendecomposition of xTx.
+        :param ridge_params: Sequence of K ridge parameters
+        :return: Loaded matrices stacked as a tensor (K x ...)
+        """
+        # Covariance matrices
+        if self._averaged:
+            xTx, xTy = self.xTx / self._n_samples, self.xTy / self._n_samples
+        else:
+            xTx, xTy = self.xTx, self.xTy
+        # end if
+
+        # Solve for each ridge parameter
+        return self._ridge_path("xTx", xTx, xTy, ridge_params, "SPESNCell", "ridge_path").transpose(1, 2)
+    # end ridge_path
+
+    # Recurrent matrix with the loaded inputs
+    def loaded_w(self):
+        """
+        Recurrent matrix including the inputs simulated or recreated from the states (after loading)
+        :return: W (W loading), W + D (input simulation) or W + Win * R (input recreation)
+        """
+        w = self.w.to_dense() if self.w.is_sparse else self.w
+        if self._loading_method == SPESNCell.INPUTS_SIMULATION:
+            return w + self.D
+        elif self._loading_method == SPESNCell.INPUTS_RECREATION:
+            w_in = self.w_in.to_dense() if self.w_in.is_sparse else self.w_in
+            return w + torch.mm(w_in, self.R)
+        # end if
+        return w
+    # end loaded_w
+
+    # endregion PUBLIC
+
     # region PRIVATE
 
+    # Forward all samples, each controlled by a conceptor
+    def _forward_controlled(self, u, conceptors, positions, reset_state=True):
+        """
+        Forward all samples of the batch together, the states of each sample being filtered by its own
+        conceptor (x = C * tanh(W* * x + Win * u + b)). The conceptors are folded into the recurrent matrix
+        once (W* * C, or W* * U * diag(s) and U for low-rank conceptors), so that each step costs one matrix
+        product per conceptor in use, and the states are filtered after the loop.
+        :param u: Input signal (batch size x time length x input dim)
+        :param conceptors: List of conceptors
+        :param positions: Index of the conceptor of each sample (batch size) or of each sample and time step
+        (batch size x time length)
+        :param reset_state: Reset state at each batch ?
+        :return: Resulting hidden states
+        """
+        # Time length and number of batches
+        time_length = int(u.size()[1])
+        n_batches = int(u.size()[0])
+
+        # Conceptor of each sample and time step
+        positions = torch.as_tensor(positions, dtype=torch.long)
+        if positions.ndim == 1:
+            positions = positions.unsqueeze(1).expand(n_batches, time_length)
+        # end if
+
+        # Recurrent matrix with the loaded inputs, then folded with each conceptor
+        w = self.loaded_w()
+        recurrent_maps = list()
+        for c in conceptors:
+            if isinstance(c, LowRankConceptor):
+                recurrent_maps.append((c.U, torch.mm(w, c.U * c.s)))
+            else:
+                recurrent_maps.append((None, torch.mm(w, c.C)))
+            # end if
+        # end for
+
+        # Hidden states, one per sample (start from the last state if not reset)
+        if reset_state:
+            self.hidden = torch.zeros(n_batches, self.output_dim, dtype=self.dtype, device=self.hidden.device)
+        elif self.hidden.ndim == 1 or self.hidden.size(0) != n_batches:
+            self.hidden = self.hidden.view(-1, self.output_dim)[-1].repeat(n_batches, 1)
+        # end if
+
+        # For each sample, pre-update hook
+        for b in range(n_batches):
+            u[b, :] = self._pre_update_hook(u[b, :], self._forward_calls, b)
+        # end for
+
+        # Input layer for all time steps (inputs loaded in the recurrent matrix otherwise)
+        if self._loading_method == SPESNCell.W_LOADING:
+            u_wins = self._precomputed_input_layer(u, '_pre_step_batch_update_hook')
+            if u_wins is None:
+                raise Exception("Conceptor-controlled runs need inputs computed for all time steps")
+            # end if
+        else:
+            u_wins = None
+        # end if
+        u_zero = torch.zeros(n_batches, self.output_dim, dtype=self.dtype, device=self.hidden.device)
+
+        # States before filtering
+        h_states = torch.zeros(n_batches, time_length, self.output_dim, dtype=self.dtype, device=self.hidden.device)
+
+        # First step from the last filtered states
+        x_w = torch.mm(self.hidden, w.t())
+
+        # For each steps
+        for t in range(time_length):
+            # Add everything and apply activation function
+            u_win = u_zero if u_wins is None else u_wins[:, t]
+            h = self._post_nonlinearity(self.nonlin_func(self._reservoir_layer(u_win, x_w)))
+            h_states[:, t] = h
+
+            # Recurrent layer for the next step, one product per conceptor in use
+            if t < time_length - 1:
+                x_w = torch.empty_like(h)
+                for k in torch.unique(positions[:, t]).tolist():
+                    rows = positions[:, t] == k
+                    U, M = recurrent_maps[k]
+                    h_k = h[rows] if U is None else torch.mm(h[rows], U)
+                    x_w[rows] = torch.mm(h_k, M.t())
+                # end for
+            # end if
+        # end for
+
+        # Filter all states at once
+        outputs = torch.empty_like(h_states)
+        for k in torch.unique(positions).tolist():
+            rows = positions == k
+            outputs[rows] = conceptors[k].filter_transform(h_states[rows])
+        # end for
+
+        # New last states (the one of the last sample if samples are run one by one)
+        self.hidden = outputs[:, -1].clone() if self._batched else outputs[-1, -1].clone()
+
+        # For each sample
+        for b in range(n_batches):
+            # Post-update hook
+            outputs[b, :] = self._post_update_hook(outputs[b, :], u[b, :], self._forward_calls, b)
+
+            # Post states update handlers
+            for handler in self._post_states_update_handlers:
+                handler(outputs[b, self._washout:], u[b, self._washout:], self._forward_calls, b)
+            # end for
+
+            # Observe states
+            self.observation_point('X', outputs[b, self._washout:])
+        # end for
+
+        # Count calls to forward
+        self._forward_calls += 1
+
+        return outputs[:, self._washout:]
+    # end _forward_controlled
+
     # Finalize ridge regression
     def _finalize_ridge_regression(self):
         """
@@ -105,19 +258,25 @@ class SPESNCell(ESNCell):
         self._call_debug_point("w_ridge_param", self._w_ridge_param, "SPESNCell", "_finalize_ridge_regression")
 
         # We need to solve w = (xTx)^(-1)xTy
-        # Covariance matrix xTx
-        ridge_xTx = self.xTx + self._w_ridge_param * torch.eye(self.output_dim, dtype=self._dtype)
+        # Covariance matrix xTx, ridge added in place on the diagonal
+        ridge_xTx = self.xTx.clone()
+        ridge_xTx.diagonal().add_(self._w_ridge_param)
 
         # Debug for ridge xTx
         self._call_debug_point("ridge_xTx", ridge_xTx, "SPESNCell", "_finalize_ridge_regression")
 
+        # Solve with a Cholesky factorization, no explicit inverse
+        if self._w_learning_algo == "cholesky":
+            return self._cholesky_solve("ridge_xTx", ridge_xTx, self.xTy, "SPESNCell", "_finalize_ridge_regression").t()
+        # end if
+
         # Inverse / pinverse
         if self._w_learning_algo == "inv":
             inv_xTx = self._inverse("ridge_xTx", ridge_xTx, "SPESNCell", "_finalize_ridge_regression")
         elif self._w_learning_algo == "pinv":
             inv_xTx = self._pinverse("ridge_xTx", ridge_xTx, "SPESNCell", "_finalize_ridge_regression")
         else:
-            raise Exception("Unknown learning method {}".format(self._learning_algo))
+            raise Exception("Unknown learning method {}".format(self._w_learning_algo))
         # end if
 
         # Debug for inv_xTx
@@ -339,6 +498,19 @@ class SPESNCell(ESNCell):
         # end if
     # end _input_layer
 
+    # Compute input layer for all time steps
+    def _input_layer_bulk(self, u):
+        """
+        Compute input layer for all time steps
+        :param u: Scaled inputs
+        :return: Processed inputs, or None if they depend on the reservoir states
+        """
+        if not self.training and self._loading_method != SPESNCell.W_LOADING:
+            return None
+        # end if
+        return super(SPESNCell, self)._input_layer_bulk(u)
+    # end _input_layer_bulk
+
     # Hook which gets executed before the update state equation for every sample.
     def _pre_update_hook(self, inputs, forward_i, sample_i):
         """
@@ -352,18 +524,6 @@ class SPESNCell(ESNCell):
         return inputs
     # end _pre_update_hook
 
-    # Hook which gets executed before the update state equation for every timesteps.
-    def _pre_step_update_hook(self, inputs, forward_i, sample_i, t):
-        """
-        Hook which gets executed before the update equation for every timesteps
-        :param inputs: Input signal.
-        :param forward_i: Index of forward call
-        :param sample_i: Position of the sample in the batch.
-        :param t: Timestep.
-        """
-        return inputs
-    # end _pre_step_update_hook
-
     # Hook which gets executed after the update state equation for every sample.
     def _post_update_hook(self, states, inputs, forward_i, sample_i):
         """
@@ -27,11 +27,12 @@ from .IncConceptorNet import IncConceptorNet
 from .IncForgSPESNCell import IncForgSPESNCell
 from .IncSPESN import IncSPESN
 from .IncSPESNCell import IncSPESNCell
+from .LowRankConceptor import LowRankConceptor
 from .SPESN import SPESN
 from .SPESNCell import SPESNCell
 
 # All
 __all__ = [
     'Conceptor', 'ConceptorNet', 'ConceptorSet', 'IncForgSPESNCell', 'IncConceptorNet', 'IncSPESN', 'IncSPESNCell',
-    'SPESN', 'SPESNCell'
+    'LowRankConceptor', 'SPESN', 'SPESNCell'
 ]
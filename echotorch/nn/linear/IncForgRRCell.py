@@ -57,7 +57,7 @@ class IncForgRRCell(IncRRCell):
         :param conceptors: ConceptorSet object of conceptors used to describe space.
         :param ridge_param: Ridge parameter
         :param with_bias: Add a bias to the linear layer
-        :param learning_algo: Inverse (inv) or pseudo-inverse (pinv)
+        :param learning_algo: Inverse (inv), pseudo-inverse (pinv) or Cholesky solve (cholesky)
         :param softmax_output: Add a softmax output (normalize outputs) ?
         :param averaged: Covariance matrix divided by the number of samples ?
         :param debug: Debug mode
@@ -159,12 +159,18 @@ class IncForgRRCell(IncRRCell):
         # Debug
         self._call_debug_point("sTy{}".format(self._n_samples), sTy, "IncForgRRCell", "_compute_update")
 
-        # Ridge sTs
-        ridge_sTs = sTs + ridge_param * torch.eye(self._input_dim)
+        # Ridge sTs, added on the diagonal of a copy (sTs was given to its debug point)
+        ridge_sTs = sTs.clone()
+        ridge_sTs.diagonal().add_(ridge_param)
 
         # Debug
         self._call_debug_point("ridge_sTs{}".format(self._n_samples), ridge_sTs, "IncForgRRCell", "_compute_update")
 
+        # Solve with a Cholesky factorization, no explicit inverse
+        if self._learning_algo == "cholesky":
+            return self._cholesky_solve("ridge_sTs", ridge_sTs, sTy, "IncForgRRCell", "_compute_update").t()
+        # end if
+
         # Inverse / pinverse
         if self._learning_algo == "inv":
             inv_sTs = self._inverse("ridge_sTs", ridge_sTs, "IncForgRRCell", "_compute_update")
@@ -295,9 +301,9 @@ class IncForgRRCell(IncRRCell):
 
         # Compute increment for Wout
         if quota(self.F) < 1e-1:
-            self.w_out_inc = self._compute_increment(X, Y, self._ridge_param_inc * 1000, F=self._compute_F_matrix())
+            self.w_out_inc = self._compute_increment(X, Y, self._ridge_param_inc * 1000, F=self.F)
         else:
-            self.w_out_inc = self._compute_increment(X, Y, self._ridge_param_inc, F=self._compute_F_matrix())
+            self.w_out_inc = self._compute_increment(X, Y, self._ridge_param_inc, F=self.F)
         # end if
 
         # Debug
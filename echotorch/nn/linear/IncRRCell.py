@@ -47,7 +47,7 @@ class IncRRCell(Node):
         :param conceptors: ConceptorSet object of conceptors used to describe space.
         :param ridge_param: Ridge parameter
         :param with_bias: Add a bias to the linear layer
-        :param learning_algo: Inverse (inv) or pseudo-inverse (pinv)
+        :param learning_algo: Inverse (inv), pseudo-inverse (pinv) or Cholesky solve (cholesky)
         :param softmax_output: Add a softmax output (normalize outputs) ?
         :param averaged: Covariance matrix divided by the number of samples ?
         :param debug: Debug mode
@@ -147,12 +147,18 @@ class IncRRCell(Node):
         # Debug
         self._call_debug_point("sTy{}".format(self._n_samples), sTy, "IncRRCell", "_compute_increment")
 
-        # Ridge sTs
-        ridge_sTs = sTs + ridge_param * torch.eye(self._input_dim)
+        # Ridge sTs, added on the diagonal of a copy (sTs was given to its debug point)
+        ridge_sTs = sTs.clone()
+        ridge_sTs.diagonal().add_(ridge_param)
 
         # Debug
         self._call_debug_point("ridge_sTs{}".format(self._n_samples), ridge_sTs, "IncRRCell", "_compute_increment")
 
+        # Solve with a Cholesky factorization, no explicit inverse
+        if self._learning_algo == "cholesky":
+            return self._cholesky_solve("ridge_sTs", ridge_sTs, sTy, "IncRRCell", "_compute_increment").t()
+        # end if
+
         # Inverse / pinverse
         if self._learning_algo == "inv":
             inv_sTs = self._inverse("ridge_sTs", ridge_sTs, "IncRRCell", "_compute_increment")
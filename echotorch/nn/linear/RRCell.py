@@ -47,7 +47,7 @@ class RRCell(Node):
         :param output_dim: Output space dimension
         :param ridge_param: Ridge parameter
         :param with_bias: Add a bias to the linear layer
-        :param learning_algo: Inverse (inv) or pseudo-inverse (pinv)
+        :param learning_algo: Inverse (inv), pseudo-inverse (pinv) or Cholesky solve (cholesky)
         :param softmax_output: Add a softmax output (normalize outputs) ?
         :param normalize_output: Normalize outputs to sum to one ?
         :param averaged: Covariance matrix divided by the number of samples ?
@@ -71,10 +71,12 @@ class RRCell(Node):
         self._learning_algo = learning_algo
         self._softmax_output = softmax_output
         self._normalize_output = normalize_output
-        self._softmax = torch.nn.Softmax(dim=2)
         self._averaged = averaged
         self._n_samples = 0
 
+        # Bias row/column accumulated in the covariance matrices
+        self._bias_accumulated = with_bias
+
         # Size
         if self._with_bias:
             self._x_size = input_dim + 1
@@ -90,6 +92,71 @@ class RRCell(Node):
 
     # region PROPERTIES
 
+    # Ridge parameter
+    @property
+    def ridge_param(self):
+        """
+        Ridge parameter
+        :return: Ridge parameter
+        """
+        return self._ridge_param
+    # end ridge_param
+
+    # Set ridge parameter
+    @ridge_param.setter
+    def ridge_param(self, value):
+        """
+        Set ridge parameter, call finalize() again to recompute the output matrix
+        :param value: New ridge parameter
+        """
+        self._ridge_param = value
+    # end ridge_param
+
+    # Learning algorithm
+    @property
+    def learning_algo(self):
+        """
+        Learning algorithm
+        :return: Inverse (inv), pseudo-inverse (pinv) or Cholesky solve (cholesky)
+        """
+        return self._learning_algo
+    # end learning_algo
+
+    # Set learning algorithm
+    @learning_algo.setter
+    def learning_algo(self, value):
+        """
+        Set learning algorithm, call finalize() again to recompute the output matrix
+        :param value: Inverse (inv), pseudo-inverse (pinv) or Cholesky solve (cholesky)
+        """
+        self._learning_algo = value
+    # end learning_algo
+
+    # With bias
+    @property
+    def with_bias(self):
+        """
+        Add a bias to the linear layer ?
+        :return: True if the output matrix has a bias column
+        """
+        return self._with_bias
+    # end with_bias
+
+    # Set with bias
+    @with_bias.setter
+    def with_bias(self, value):
+        """
+        Add a bias to the linear layer or not, call finalize() again to recompute the output matrix. The bias
+        can only be removed from a cell created with a bias, its row and column are then left out of the
+        covariance matrices.
+        :param value: True to add a bias
+        """
+        if value and not self._bias_accumulated:
+            raise Exception("Cannot add a bias to a RRCell created without bias")
+        # end if
+        self._with_bias = value
+    # end with_bias
+
     # endregion PROPERTIES
 
     # region PUBLIC
@@ -110,11 +177,12 @@ class RRCell(Node):
     # end reset
 
     # Forward
-    def forward(self, x, y=None):
+    def forward(self, x, y=None, out=None):
         """
         Forward
         :param x: Input signal.
         :param y: Target outputs
+        :param out: Optional output buffer (batch size x time length x output dim) filled in eval mode
         :return: Output or hidden states
         """
         # Batch size
@@ -123,89 +191,168 @@ class RRCell(Node):
         # Time length
         time_length = x.size()[1]
 
-        # Add bias
-        if self._with_bias:
-            x = self._add_constant(x)
-        # end if
-
         # Training or eval
         if self.training:
-            for b in range(batch_size):
-                if not self._averaged:
-                    self.xTx.data.add_(x[b].t().mm(x[b]).data)
-                    self.xTy.data.add_(x[b].t().mm(y[b]).data)
-                else:
-                    self.xTx.data.add_((x[b].t().mm(x[b]) / time_length).data)
-                    self.xTy.data.add_((x[b].t().mm(y[b]) / time_length).data)
-                    self._n_samples += 1.0
-            # end for
-
-            # Bias or not
+            # Update covariance matrices with the whole batch
+            self.accumulate(x, y, n_samples=batch_size)
+            return x
+        elif not self.training:
+            # Outputs buffer, filled through a flat view
+            if out is None:
+                out = torch.empty(batch_size, time_length, self._output_dim, dtype=self._dtype, device=x.device)
+            elif not out.is_contiguous():
+                raise Exception("The output buffer must be contiguous")
+            # end if
+
+            # All time steps of all samples as rows
+            X = x.reshape(-1, x.size(-1))
+            outputs = out.view(-1, self._output_dim)
+
+            # Y = X * Wout^T, the bias column of Wout is added by addmm
             if self._with_bias:
-                return x[:, :, 1:]
+                torch.addmm(self.w_out[:, 0], X, self.w_out[:, 1:].t(), out=outputs)
             else:
-                return x
+                torch.mm(X, self.w_out.t(), out=outputs)
             # end if
-        elif not self.training:
-            # Outputs
-            outputs = Variable(torch.zeros(batch_size, time_length, self._output_dim, dtype=self._dtype),
-                               requires_grad=False)
-            outputs = outputs.cuda() if self.w_out.is_cuda else outputs
-
-            # For each batch
-            for b in range(batch_size):
-                outputs[b] = torch.mm(self.w_out, x[b].t()).t()
-            # end for
 
             if self._softmax_output:
-                return self._softmax(outputs)
+                # Softmax over outputs, in place
+                out.sub_(torch.max(out, dim=2, keepdim=True)[0]).exp_()
+                return out.div_(torch.sum(out, dim=2, keepdim=True))
             elif self._normalize_output:
-                return torch.abs(outputs) / torch.sum(torch.abs(outputs), axis=2).reshape(outputs.size(0), outputs.size(1), 1)
+                # Normalize absolute outputs to sum to one, in place
+                out.abs_()
+                return out.div_(torch.sum(out, dim=2, keepdim=True))
             else:
-                return outputs
+                return out
         # end if
 
     # end forward
 
-    # Finish training
-    def finalize(self):
+    # Accumulate states and targets
+    def accumulate(self, x, y, time_length=None, n_samples=0):
         """
-        Finalize training with inverse or pseudo-inverse
+        Update the covariance matrices with a batch, or with a chunk of the time steps of a batch
+        when the states are streamed instead of being kept for whole sequences.
+        :param x: States (batch size x time length (or chunk length) x input dim)
+        :param y: Targets (batch size x time length (or chunk length) x output dim)
+        :param time_length: Whole time length of the samples (default: length of x)
+        :param n_samples: Number of new samples to count (batch size for whole sequences, zero for the next chunks)
         """
+        # Update covariance matrices
+        self._update_covariance_matrices(x, y, time_length=time_length)
+
+        # Averaged over samples
         if self._averaged:
-            # Average
-            self.xTx = self.xTx / self._n_samples
-            self.xTy = self.xTy / self._n_samples
+            self._n_samples += float(n_samples)
         # end if
+    # end accumulate
 
-        # Eye
-        eye_I = torch.eye(self._input_dim + self._with_bias, dtype=self._dtype)
-        eye_I = eye_I.cuda() if self.xTx.is_cuda else eye_I
+    # Finish training
+    def finalize(self):
+        """
+        Finalize training with inverse, pseudo-inverse or Cholesky solve. The covariance matrices
+        are left untouched so that finalize() can be called again with another ridge parameter.
+        """
+        # Covariance matrices
+        xTx, xTy = self._covariance_matrices()
 
         # We need to solve wout = (xTx)^(-1)xTy
-        # Covariance matrix xTx
-        ridge_xTx = self.xTx + self._ridge_param * eye_I
+        # Ridge added in place on the diagonal of the (copied) covariance matrix xTx,
+        # averaged matrices are already copies of the buffer
+        ridge_xTx = xTx if self._averaged else xTx.clone()
+        ridge_xTx.diagonal().add_(self._ridge_param)
 
-        # Inverse / pinverse
+        # Inverse / pinverse / Cholesky
         if self._learning_algo == "inv":
-            inv_xTx = ridge_xTx.inverse()
+            self.w_out = torch.mm(self._inverse("ridge_xTx", ridge_xTx, "RRCell", "finalize"), xTy).t()
         elif self._learning_algo == "pinv":
-            inv_xTx = ridge_xTx.pinverse()
+            self.w_out = torch.mm(self._pinverse("ridge_xTx", ridge_xTx, "RRCell", "finalize"), xTy).t()
+        elif self._learning_algo == "cholesky":
+            self.w_out = self._cholesky_solve("ridge_xTx", ridge_xTx, xTy, "RRCell", "finalize").t()
         else:
             raise Exception("Unknown learning method {}".format(self._learning_algo))
         # end if
 
-        # wout = (xTx)^(-1)xTy
-        self.w_out = torch.mm(inv_xTx, self.xTy).t()
-
         # Not in training mode anymore
         self.train(False)
     # end finalize
 
+    # Output matrices for several ridge parameters
+    def ridge_path(self, ridge_params):
+        """
+        Output matrices for several ridge parameters computed from a single eigendecomposition
+        of xTx, the reservoir does not need to be run again for each candidate.
+        :param ridge_params: Sequence of K ridge parameters
+        :return: Output matrices (K x output dim x input dim (+1 with bias))
+        """
+        # Covariance matrices
+        xTx, xTy = self._covariance_matrices()
+
+        # Solve for each ridge parameter
+        return self._ridge_path("xTx", xTx, xTy, ridge_params, "RRCell", "ridge_path").transpose(1, 2)
+    # end ridge_path
+
     # endregion PUBLIC
 
     # region PRIVATE
 
+    # Covariance matrices
+    def _covariance_matrices(self):
+        """
+        Covariance matrices xTx and xTy, averaged over samples if needed and without the
+        bias row/column if the bias has been removed after accumulation
+        :return: xTx, xTy
+        """
+        # Leave out the bias row/column
+        if self._bias_accumulated and not self._with_bias:
+            xTx, xTy = self.xTx[1:, 1:], self.xTy[1:]
+        else:
+            xTx, xTy = self.xTx, self.xTy
+        # end if
+
+        if self._averaged:
+            return xTx / self._n_samples, xTy / self._n_samples
+        # end if
+        return xTx, xTy
+    # end _covariance_matrices
+
+    # Update covariance matrices
+    def _update_covariance_matrices(self, x, y, time_length=None):
+        """
+        Update covariance matrices xTx and xTy with a whole batch, the bias column is
+        added to the covariance matrices without concatenating it to the states.
+        :param x: States (batch size x time length x input dim)
+        :param y: Targets (batch size x time length x output dim)
+        :param time_length: Whole time length of the samples (default: length of x)
+        """
+        # All time steps of all samples as rows
+        X = x.reshape(-1, x.size(-1)).data
+        Y = y.reshape(-1, y.size(-1)).data
+
+        # Each sample is divided by its length if averaged
+        scale = 1.0 / (time_length or x.size(1)) if self._averaged else 1.0
+
+        # Bias or not
+        if self._bias_accumulated:
+            # Sum of states and targets for the bias row/column
+            x_sum = X.sum(dim=0) * scale
+
+            # xTx = [[n, sum(x)], [sum(x), XtX]]
+            self.xTx.data[0, 0] += X.size(0) * scale
+            self.xTx.data[0, 1:] += x_sum
+            self.xTx.data[1:, 0] += x_sum
+            self.xTx.data[1:, 1:].addmm_(X.t(), X, alpha=scale)
+
+            # xTy = [[sum(y)], [XtY]]
+            self.xTy.data[0] += Y.sum(dim=0) * scale
+            self.xTy.data[1:].addmm_(X.t(), Y, alpha=scale)
+        else:
+            self.xTx.data.addmm_(X.t(), X, alpha=scale)
+            self.xTy.data.addmm_(X.t(), Y, alpha=scale)
+        # end if
+    # end _update_covariance_matrices
+
     # Add constant
     def _add_constant(self, x):
         """
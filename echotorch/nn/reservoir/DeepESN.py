@@ -43,8 +43,8 @@ class DeepESN(Node):
     def __init__(self, n_layers, input_dim, hidden_dim, output_dim, w_generator, win_generator, wbias_generator,
                  leak_rate, input_scaling=1.0, nonlin_func=torch.tanh, learning_algo='inv', ridge_param=0.0,
                  with_bias=True, softmax_output=False, normalize_output=False, washout=0, create_rnn=True,
-                 create_output=True, input_type='IF', output_type='AO', debug=Node.NO_DEBUG, test_case=None,
-                 dtype=torch.float32):
+                 create_output=True, input_type='IF', output_type='AO', batched=False, pipelined=False, stream_chunk=None,
+                 debug=Node.NO_DEBUG, test_case=None, dtype=torch.float32):
         """
         Constructor
         :param n_layers: Number of layers to create
@@ -65,6 +65,10 @@ class DeepESN(Node):
         :param create_output: Create the output layer ?
         :param input_type: Input variant (IF: input-to-first, IA: input-to-all, GE: grouped-ESNs)
         :param output_type: Output flavour (AO: all-to-outputs, LO: last-to-outputs)
+        :param batched: Step all the samples of a batch together in each layer
+        :param pipelined: Compute all layers in a single loop over time steps (layer k at t right after layer k-1 at t)
+        :param stream_chunk: In pipelined mode, number of time steps kept in memory before being streamed to
+        the output layer (None to keep the states of whole sequences)
         :param debug: Debug mode
         :param test_case: Test case to call for test
         :param dtype: Data type
@@ -86,6 +90,8 @@ class DeepESN(Node):
         self._wbias_generator = wbias_generator
         self._input_type = input_type
         self._washout = washout
+        self._pipelined = pipelined
+        self._stream_chunk = stream_chunk
         self._dtype = dtype
 
         # List of reservoirs
@@ -116,6 +122,7 @@ class DeepESN(Node):
                     input_scaling=self._get_hyperparam_value(input_scaling, layer_i),
                     nonlin_func=self._get_hyperparam_value(nonlin_func, layer_i),
                     washout=washout,
+                    batched=batched,
                     debug=debug,
                     test_case=test_case,
                     dtype=dtype
@@ -225,6 +232,195 @@ class DeepESN(Node):
         return w, w_in, w_bias
     # end _generate_matrices
 
+    # Can the layers be pipelined ?
+    def _pipelinable(self, reset_state):
+        """
+        Can the layers be pipelined ? Only with Li-ESN layers using their fused step loop
+        and dense matrices, without per-sample hooks, post states update handlers or observed
+        inputs and states, as the whole states of a layer are never available in pipelined mode.
+        :param reset_state: Reset hidden state to zero or keep old one ?
+        :return: True or False
+        """
+        for cell in self._reservoirs:
+            if not isinstance(cell, LiESNCell) or not cell._fusable(reset_state) or cell.w.is_sparse or \
+                    cell.w_in.is_sparse:
+                return False
+            # end if
+
+            # Per-sample hooks and handlers
+            if type(cell)._pre_update_hook is not Node._pre_update_hook or \
+                    type(cell)._post_update_hook is not Node._post_update_hook or \
+                    len(cell._post_states_update_handlers) > 0 or cell.observed('U') or cell.observed('X'):
+                return False
+            # end if
+        # end for
+        return True
+    # end _pipelinable
+
+    # Pipelined forward
+    def _forward_pipelined(self, u, y=None, reset_state=True):
+        """
+        Pipelined forward, each time step is computed for all layers in a single loop, the state of
+        layer k at t being computed right after the one of layer k-1. Input projections are computed
+        for a whole chunk of time steps with one GEMM per layer. With stream_chunk, only a chunk of
+        states is kept and sent to the output layer at a time.
+        :param u: Input signal
+        :param y: Target outputs (or None if prediction)
+        :param reset_state: Reset hidden state to zero or keep old one ?
+        :return: Output (eval), hidden states (train) or None (train with streamed states)
+        """
+        # Sizes
+        batch_size, time_length = int(u.size(0)), int(u.size(1))
+        n_layers, hidden_dim = self._n_layers, self._hidden_dim
+
+        # Chunk length
+        chunk_length = max(1, min(self._stream_chunk, time_length) if self._stream_chunk is not None else time_length)
+
+        # States of all layers for a chunk (time-major) and last states of the previous chunk
+        states = torch.empty(chunk_length, batch_size, hidden_dim * n_layers, dtype=self._dtype, device=u.device)
+        last_states = torch.zeros(batch_size, hidden_dim * n_layers, dtype=self._dtype, device=u.device)
+
+        # Initial states (start from the last states if not reset)
+        if not reset_state:
+            for layer_i, cell in enumerate(self._reservoirs):
+                layer_hidden = cell.hidden.view(-1, hidden_dim)
+                if layer_hidden.size(0) != batch_size:
+                    layer_hidden = layer_hidden[-1].repeat(batch_size, 1)
+                # end if
+                last_states[:, layer_i * hidden_dim:(layer_i + 1) * hidden_dim] = layer_hidden
+            # end for
+        # end if
+
+        # Outputs of the output layer and number of new samples when the states are streamed
+        outputs = list()
+        n_new_samples = batch_size
+
+        # Washout
+        washout = self._washout
+
+        # For each chunk
+        for chunk_start in range(0, time_length, chunk_length):
+            # Chunk end
+            chunk_end = min(chunk_start + chunk_length, time_length)
+
+            # Inputs projections and biases for the chunk
+            u_wins = [self._pipelined_input_layer(layer_i, u[:, chunk_start:chunk_end]) for layer_i in range(n_layers)]
+
+            # Previous states
+            previous = last_states
+
+            # For each time step
+            for t in range(chunk_end - chunk_start):
+                # States of all layers at t
+                current = states[t]
+
+                # For each layer
+                for layer_i, cell in enumerate(self._reservoirs):
+                    # Layer state and previous state
+                    x = current[:, layer_i * hidden_dim:(layer_i + 1) * hidden_dim]
+                    x_prev = previous[:, layer_i * hidden_dim:(layer_i + 1) * hidden_dim]
+
+                    # W * x(t-1) + Win * u(t) + Wbias
+                    torch.addmm(u_wins[layer_i][:, t], x_prev, cell.w.t(), out=x)
+
+                    # Win * x_(k-1)(t), states of the layer below at t
+                    if layer_i > 0 and self._input_type in ['IF', 'IA']:
+                        x.addmm_(
+                            current[:, (layer_i - 1) * hidden_dim:layer_i * hidden_dim],
+                            cell.w_in[:, :hidden_dim].t(),
+                            alpha=cell.input_scaling
+                        )
+                    # end if
+
+                    # Activation function
+                    if cell.nonlin_func is torch.tanh:
+                        x.tanh_()
+                    else:
+                        x.copy_(cell.nonlin_func(x))
+                    # end if
+
+                    # Leaky integration
+                    if cell.leaky_rate != 1.0:
+                        x.mul_(cell.leaky_rate).add_(x_prev, alpha=1.0 - cell.leaky_rate)
+                    # end if
+                # end for
+
+                # Next step
+                previous = current
+            # end for
+
+            # Keep last states for the next chunk
+            last_states.copy_(previous)
+
+            # Chunk states after washout (batch-major)
+            chunk_states = states[max(washout - chunk_start, 0):chunk_end - chunk_start].transpose(0, 1)
+
+            # Stream the chunk to the output layer
+            if self._stream_chunk is not None and chunk_end > washout:
+                if self.training:
+                    self._output.accumulate(
+                        chunk_states,
+                        y[:, max(washout, chunk_start):chunk_end],
+                        time_length=time_length - washout,
+                        n_samples=n_new_samples
+                    )
+                    n_new_samples = 0
+                else:
+                    outputs.append(self._output(chunk_states, None))
+                # end if
+            # end if
+        # end for
+
+        # Last states of each layer and forward calls
+        for layer_i, cell in enumerate(self._reservoirs):
+            layer_hidden = last_states[:, layer_i * hidden_dim:(layer_i + 1) * hidden_dim].clone()
+            cell.hidden = layer_hidden if cell.batched else layer_hidden[-1]
+            cell._forward_calls += 1
+        # end for
+
+        # States streamed to the output layer (no time step after the washout if no output)
+        if self._stream_chunk is not None:
+            if self.training:
+                return None
+            elif len(outputs) == 0:
+                return torch.empty(batch_size, 0, self._output.output_dim, dtype=self._dtype, device=u.device)
+            # end if
+            return torch.cat(outputs, dim=1)
+        # end if
+
+        # Learning algo
+        hidden_states = states[washout:time_length].transpose(0, 1)
+        if not self.training:
+            return self._output(hidden_states, None)
+        else:
+            return self._output(hidden_states, y[:, washout:])
+        # end if
+    # end _forward_pipelined
+
+    # Input projections of a layer for a chunk
+    def _pipelined_input_layer(self, layer_i, u):
+        """
+        Input projections and bias of a layer for a chunk in pipelined mode, the part coming from
+        the layer below is added at each time step.
+        :param layer_i: Layer index
+        :param u: Input signal (batch size x chunk length x input dim)
+        :return: Input projections and bias (batch size x chunk length x hidden dim)
+        """
+        # Layer
+        cell = self._reservoirs[layer_i]
+
+        # Layer inputs
+        if layer_i == 0 or self._input_type == 'GE':
+            return cell._input_layer_bulk(u * cell.input_scaling).add_(cell.w_bias)
+        elif self._input_type == 'IA':
+            return torch.matmul(u * cell.input_scaling, cell.w_in[:, self._hidden_dim:].t()).add_(cell.w_bias)
+        elif self._input_type == 'IF':
+            return cell.w_bias.expand(u.size(0), u.size(1), self._hidden_dim)
+        else:
+            raise Exception("Unknown input type : {}".format(self._input_type))
+        # end if
+    # end _pipelined_input_layer
+
     # endregion PRIVATE
 
     # region OVERRIDE
@@ -238,6 +434,11 @@ class DeepESN(Node):
         :param reset_state: Reset hidden state to zero or keep old one ?
         :return: Output (eval) or hidden states (train)
         """
+        # Pipelined execution
+        if self._pipelined and self._pipelinable(reset_state):
+            return self._forward_pipelined(u, y, reset_state=reset_state)
+        # end if
+
         # Sizes
         time_length = int(u.size(1))
         batch_sizes = int(u.size(0))
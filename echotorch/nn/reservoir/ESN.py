@@ -30,6 +30,7 @@ import echotorch.utils.matrix_generation as mg
 from echotorch.nn.linear.RRCell import RRCell
 from ..Node import Node
 from .ESNCell import ESNCell
+from .ESNStream import ESNStream
 
 
 # Echo State Network module.
@@ -42,7 +43,7 @@ class ESN(Node):
     def __init__(self, input_dim, hidden_dim, output_dim, w_generator, win_generator, wbias_generator,
                  input_scaling=1.0, nonlin_func=torch.tanh, learning_algo='inv', ridge_param=0.0, with_bias=True,
                  softmax_output=False, normalize_output=False, washout=0, create_rnn=True, create_output=True,
-                 debug=Node.NO_DEBUG, test_case=None, dtype=torch.float32):
+                 batched=False, debug=Node.NO_DEBUG, test_case=None, dtype=torch.float32):
         """
         Constructor
         :param input_dim: Input feature space dimension
@@ -61,6 +62,7 @@ class ESN(Node):
         :param washout: Washout period (ignore timesteps at the beginning of each sample)
         :param create_rnn: Create RNN layer ?
         :param create_output: Create the output layer ?
+        :param batched: Step all the samples of a batch together in the reservoir
         :param debug: Debug mode
         :param test_case: Test case to call for test
         :param dtype: Data type
@@ -96,6 +98,7 @@ class ESN(Node):
                 input_scaling=input_scaling,
                 nonlin_func=nonlin_func,
                 washout=washout,
+                batched=batched,
                 debug=debug,
                 test_case=test_case,
                 dtype=dtype
@@ -288,6 +291,16 @@ class ESN(Node):
         self._esn_cell.reset_hidden()
     # end reset_hidden
 
+    # Streaming session
+    def stream(self, n_streams=1):
+        """
+        Streaming session keeping one hidden state per stream across calls
+        :param n_streams: Number of concurrent streams
+        :return: ESNStream object
+        """
+        return ESNStream(self, n_streams=n_streams)
+    # end stream
+
     # endregion OVERRIDE
 
     # region PRIVATE
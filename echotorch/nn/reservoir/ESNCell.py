@@ -43,18 +43,19 @@ class ESNCell(Node, Observable):
 
     # Constructor
     def __init__(self, input_dim, output_dim, w, w_in, w_bias, input_scaling=1.0, nonlin_func=torch.tanh, washout=0,
-                 noise_generator=None, debug=Node.NO_DEBUG, test_case=None, dtype=torch.float32):
+                 noise_generator=None, batched=False, debug=Node.NO_DEBUG, test_case=None, dtype=torch.float32):
         """
         Constructor
         :param input_dim: Input dimension
         :param output_dim: Reservoir size
         :param input_scaling: Input scaling
-        :param w: Internal weight matrix W
-        :param w_in: Input-internal weight matrix Win
+        :param w: Internal weight matrix W (dense or sparse)
+        :param w_in: Input-internal weight matrix Win (dense or sparse)
         :param w_bias: Internal units bias vector Wbias
         :param nonlin_func: Non-linear function applied to the units
         :param washout: Period to ignore in training at the beginning
         :param noise_generator: Noise generator used to add noise to states before non-linearity
+        :param batched: Step all the samples of a batch together (hidden state as a batch x reservoir matrix)
         :param debug: Debug mode
         :param test_case: Test case to call for test.
         :param dtype: Data type used for vectors/matrices.
@@ -76,16 +77,17 @@ class ESNCell(Node, Observable):
         self._nonlin_func = nonlin_func
         self._washout = washout
         self._noise_generator = noise_generator
+        self._batched = batched
         self._dtype = dtype
 
         # Init hidden state
         self.register_buffer('hidden', self._init_hidden())
 
         # Initialize input weights
-        self.register_buffer('w_in', Variable(w_in, requires_grad=False))
+        self.register_buffer('w_in', Variable(w_in.coalesce() if w_in.is_sparse else w_in, requires_grad=False))
 
         # Initialize reservoir weights randomly
-        self.register_buffer('w', Variable(w, requires_grad=False))
+        self.register_buffer('w', Variable(w.coalesce() if w.is_sparse else w, requires_grad=False))
 
         # Initialize bias
         self.register_buffer('w_bias', Variable(w_bias, requires_grad=False))
@@ -120,6 +122,30 @@ class ESNCell(Node, Observable):
         self._washout = washout
     # end washout
 
+    # Batched execution mode
+    @property
+    def batched(self):
+        """
+        Batched execution mode
+        :return: True if all the samples of a batch are stepped together
+        """
+        return self._batched
+    # end batched
+
+    # Set batched execution mode
+    @batched.setter
+    def batched(self, batched):
+        """
+        Set batched execution mode
+        :param batched: True/False
+        """
+        # Hidden state shape changes with the mode
+        if batched != self._batched:
+            self.hidden = self._init_hidden()
+        # end if
+        self._batched = batched
+    # end batched
+
     # Get W's spectral radius
     @property
     def spectral_radius(self):
@@ -127,7 +153,7 @@ class ESNCell(Node, Observable):
         Get W's spectral radius
         :return: W's spectral radius
         """
-        return echotorch.utils.spectral_radius(self.w)
+        return echotorch.utils.estimate_spectral_radius(self.w)
     # end spectral_radius
 
     # Change spectral radius
@@ -137,7 +163,7 @@ class ESNCell(Node, Observable):
         Change spectral radius
         :param sp: New spectral radius
         """
-        self.w *= sp / echotorch.utils.spectral_radius(self.w)
+        self.w *= sp / echotorch.utils.estimate_spectral_radius(self.w)
     # end spectral_radius
 
     # Get input scaling
@@ -191,6 +217,11 @@ class ESNCell(Node, Observable):
         :param reset_state: Reset state at each batch ?
         :return: Resulting hidden states
         """
+        # Batched execution
+        if self._batched:
+            return self._forward_batch(u, reset_state=reset_state)
+        # end if
+
         # Time length
         time_length = int(u.size()[1])
 
@@ -214,6 +245,9 @@ class ESNCell(Node, Observable):
             # Observe inputs
             self.observation_point('U', u[b, :])
 
+            # Input layer for all time steps (None if computed at each step)
+            u_wins = self._precomputed_input_layer(u[b], '_pre_step_update_hook')
+
             # For each steps
             for t in range(time_length):
                 # Current input
@@ -223,7 +257,7 @@ class ESNCell(Node, Observable):
                 ut = self._pre_step_update_hook(ut, self._forward_calls, b, t)
 
                 # Compute input layer
-                u_win = self._input_layer(ut)
+                u_win = self._input_layer(ut) if u_wins is None else u_wins[t]
 
                 # Apply W to x
                 x_w = self._recurrent_layer(self.hidden)
@@ -274,6 +308,105 @@ class ESNCell(Node, Observable):
 
     # region PRIVATE
 
+    # Forward all samples of the batch together
+    def _forward_batch(self, u, reset_state=True):
+        """
+        Forward all samples of the batch together, the hidden state is a (batch size x reservoir) matrix
+        and each time step is computed for the whole batch at once.
+        :param u: Input signal
+        :param reset_state: Reset state at each batch ?
+        :return: Resulting hidden states
+        """
+        # Time length
+        time_length = int(u.size()[1])
+
+        # Number of batches
+        n_batches = int(u.size()[0])
+
+        # Outputs
+        outputs = torch.zeros(n_batches, time_length, self.output_dim, dtype=self.dtype, device=self.hidden.device)
+
+        # Hidden states, one per sample (start from the last state if not reset)
+        if reset_state:
+            self.hidden = torch.zeros(n_batches, self.output_dim, dtype=self.dtype, device=self.hidden.device)
+        elif self.hidden.ndim == 1 or self.hidden.size(0) != n_batches:
+            self.hidden = self.hidden.view(-1, self.output_dim)[-1].repeat(n_batches, 1)
+        # end if
+
+        # For each sample, pre-update hook and observe inputs
+        for b in range(n_batches):
+            u[b, :] = self._pre_update_hook(u[b, :], self._forward_calls, b)
+            self.observation_point('U', u[b, :])
+        # end for
+
+        # Input layer for all time steps (None if computed at each step)
+        u_wins = self._precomputed_input_layer(u, '_pre_step_batch_update_hook')
+
+        # For each steps
+        for t in range(time_length):
+            # Current inputs
+            ut = u[:, t] * self._input_scaling
+
+            # Pre-hook
+            ut = self._pre_step_batch_update_hook(ut, self._forward_calls, t)
+
+            # Compute input layer
+            u_win = self._input_layer(ut) if u_wins is None else u_wins[:, t]
+
+            # Apply W to x
+            x_w = self._recurrent_layer(self.hidden)
+
+            # Add everything
+            x = self._reservoir_layer(u_win, x_w)
+
+            # Apply activation function
+            x = self.nonlin_func(x)
+
+            # Post nonlinearity
+            x = self._post_nonlinearity(x)
+
+            # Post-hook
+            x = self._post_step_batch_update_hook(x.view(n_batches, self.output_dim), ut, self._forward_calls, t)
+
+            # Neural filter (per sample)
+            for neural_filter_handler in self._neural_filter_handlers:
+                for b in range(n_batches):
+                    x[b] = neural_filter_handler(x[b], ut[b], self._forward_calls, b, t, t < self._washout)
+                # end for
+            # end for
+
+            # Neural filter (whole batch)
+            for neural_batch_filter_handler in self._neural_batch_filter_handlers:
+                x = neural_batch_filter_handler(x, ut, self._forward_calls, t, t < self._washout)
+            # end for
+
+            # New last states
+            self.hidden.data = x.data
+
+            # Add to outputs
+            outputs[:, t] = self.hidden
+        # end for
+
+        # For each sample
+        for b in range(n_batches):
+            # Post-update hook
+            outputs[b, :] = self._post_update_hook(outputs[b, :], u[b, :], self._forward_calls, b)
+
+            # Post states update handlers
+            for handler in self._post_states_update_handlers:
+                handler(outputs[b, self._washout:], u[b, self._washout:], self._forward_calls, b)
+            # end for
+
+            # Observe states
+            self.observation_point('X', outputs[b, self._washout:])
+        # end for
+
+        # Count calls to forward
+        self._forward_calls += 1
+
+        return outputs[:, self._washout:]
+    # end _forward_batch
+
     # Compute post nonlinearity hook
     def _post_nonlinearity(self, x):
         """
@@ -294,8 +427,12 @@ class ESNCell(Node, Observable):
         """
         if self._noise_generator is None:
             return u_win + x_w + self.w_bias
-        else:
+        elif u_win.ndim == 1:
             return u_win + x_w + self.w_bias + self._noise_generator(self._output_dim)
+        else:
+            # One noise vector per sample
+            noise = torch.stack([self._noise_generator(self._output_dim) for _ in range(u_win.size(0))])
+            return u_win + x_w + self.w_bias + noise
         # end if
     # end _reservoir_layer
 
@@ -303,22 +440,85 @@ class ESNCell(Node, Observable):
     def _recurrent_layer(self, xt):
         """
         Compute recurrent layer
-        :param xt: Reservoir state at t-1
+        :param xt: Reservoir state at t-1 (reservoir or batch size x reservoir)
         :return: Processed state
         """
-        return self.w.mv(self.hidden)
+        if xt.ndim == 1:
+            return self.w.mv(xt)
+        elif self.w.is_sparse:
+            return torch.sparse.mm(self.w, xt.t()).t()
+        else:
+            return torch.mm(xt, self.w.t())
+        # end if
     # end _recurrent_layer
 
     # Compute input layer
     def _input_layer(self, ut):
         """
         Compute input layer
-        :param ut: Inputs
+        :param ut: Inputs (input dim or batch size x input dim)
         :return: Processed inputs
         """
-        return self.w_in.mv(ut)
+        if ut.ndim == 1:
+            return self.w_in.mv(ut)
+        elif self.w_in.is_sparse:
+            return torch.sparse.mm(self.w_in, ut.t()).t()
+        else:
+            return torch.mm(ut, self.w_in.t())
+        # end if
     # end _input_layer
 
+    # Compute input layer for all time steps
+    def _input_layer_bulk(self, u):
+        """
+        Compute input layer for all time steps with a single GEMM, subclasses overriding
+        _input_layer() must override this method too (or return None) to keep the same inputs.
+        :param u: Scaled inputs (time length x input dim or batch size x time length x input dim)
+        :return: Processed inputs (time length x reservoir or batch size x time length x reservoir),
+        or None if they must be computed at each step
+        """
+        # All time steps as rows
+        U = u.reshape(-1, u.size(-1))
+
+        # U * Win^T
+        if self.w_in.is_sparse:
+            u_win = torch.sparse.mm(self.w_in, U.t()).t()
+        else:
+            u_win = torch.mm(U, self.w_in.t())
+        # end if
+
+        return u_win.view(u.size()[:-1] + (self.output_dim,))
+    # end _input_layer_bulk
+
+    # Input layer precomputed for all time steps
+    def _precomputed_input_layer(self, u, pre_step_hook_name):
+        """
+        Input layer precomputed for all time steps if the inputs are not modified at each step
+        by the pre-step hook and if the input layer has a bulk version.
+        :param u: Inputs (time length x input dim or batch size x time length x input dim)
+        :param pre_step_hook_name: Name of the pre-step hook called in the loop
+        :return: Processed inputs or None if they must be computed at each step
+        """
+        # Class of the cell
+        cell_class = type(self)
+
+        # Pre-step hook overridden
+        if getattr(cell_class, pre_step_hook_name) is not getattr(Node, pre_step_hook_name):
+            return None
+        # end if
+
+        # Classes defining the step and bulk input layers
+        input_layer_class = next(c for c in cell_class.__mro__ if '_input_layer' in c.__dict__)
+        bulk_layer_class = next(c for c in cell_class.__mro__ if '_input_layer_bulk' in c.__dict__)
+
+        # Input layer overridden without bulk version
+        if not issubclass(bulk_layer_class, input_layer_class):
+            return None
+        # end if
+
+        return self._input_layer_bulk(u * self._input_scaling)
+    # end _precomputed_input_layer
+
     # Init hidden layer
     def _init_hidden(self):
         """
@@ -339,7 +539,7 @@ class ESNCell(Node, Observable):
         :return: String
         """
         s = super(ESNCell, self).extra_repr()
-        s += ', nonlin_func={_nonlin_func}, washout={_washout}'
+        s += ', nonlin_func={_nonlin_func}, washout={_washout}, batched={_batched}'
         return s.format(**self.__dict__)
     # end extra_repr
 
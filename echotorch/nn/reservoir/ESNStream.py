@@ -0,0 +1,252 @@
+# -*- coding: utf-8 -*-
+#
+# File : echotorch/nn/reservoir/ESNStream.py
+# Description : Streaming session over an ESN with one hidden state per stream.
+# Date : 18th of October, 2026
+#
+# This file is part of EchoTorch.  EchoTorch is free software: you can
+# redistribute it and/or modify it under the terms of the GNU General Public
+# License as published by the Free Software Foundation, version 2.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, write to the Free Software Foundation, Inc., 51
+# Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# Copyright Nils Schaetti <nils.schaetti@unine.ch>
+
+"""
+Created on 18 October 2026
+@author: Nils Schaetti
+"""
+
+# Imports
+import torch
+
+
+# Streaming session over an ESN
+class ESNStream(object):
+    """
+    Streaming session over an ESN (or Li-ESN). Each stream keeps its own hidden state between calls,
+    chunks of any length are fed for several streams at once and the readout outputs are returned
+    for each chunk. The washout is only applied to the first time steps of each stream.
+    """
+
+    # Constructor
+    def __init__(self, esn, n_streams=1):
+        """
+        Constructor
+        :param esn: ESN or LiESN module
+        :param n_streams: Number of concurrent streams
+        """
+        # Properties
+        self._esn = esn
+        self._hidden_dim = esn.cell.output_dim
+        self._dtype = esn.cell.dtype
+
+        # Hidden states and number of time steps seen by each stream
+        self._hidden = torch.zeros(n_streams, self._hidden_dim, dtype=self._dtype, device=esn.cell.hidden.device)
+        self._positions = torch.zeros(n_streams, dtype=torch.long)
+
+        # Number of valid time steps of each stream in the outputs of the last chunk
+        self._lengths = torch.zeros(0, dtype=torch.long)
+    # end __init__
+
+    # region PROPERTIES
+
+    # ESN
+    @property
+    def esn(self):
+        """
+        ESN
+        :return: ESN module
+        """
+        return self._esn
+    # end esn
+
+    # Number of streams
+    @property
+    def n_streams(self):
+        """
+        Number of streams
+        :return: Number of streams
+        """
+        return self._hidden.size(0)
+    # end n_streams
+
+    # Hidden states
+    @property
+    def hidden(self):
+        """
+        Hidden states
+        :return: Hidden states (n streams x hidden dim)
+        """
+        return self._hidden
+    # end hidden
+
+    # Positions
+    @property
+    def positions(self):
+        """
+        Number of time steps seen by each stream
+        :return: Positions (n streams)
+        """
+        return self._positions
+    # end positions
+
+    # Valid lengths
+    @property
+    def lengths(self):
+        """
+        Number of valid time steps of each stream fed in the outputs of the last chunk
+        :return: Lengths (n streams fed)
+        """
+        return self._lengths
+    # end lengths
+
+    # endregion PROPERTIES
+
+    # region PUBLIC
+
+    # Add streams
+    def add_streams(self, n_streams=1):
+        """
+        Add new streams starting from a null state
+        :param n_streams: Number of streams to add
+        :return: Indices of the new streams
+        """
+        first = self.n_streams
+        self._hidden = torch.cat(
+            (self._hidden, torch.zeros(n_streams, self._hidden_dim, dtype=self._dtype, device=self._hidden.device)),
+            dim=0
+        )
+        self._positions = torch.cat((self._positions, torch.zeros(n_streams, dtype=torch.long)))
+        return list(range(first, first + n_streams))
+    # end add_streams
+
+    # Reset streams
+    def reset(self, streams=None):
+        """
+        Reset streams to a null state, the washout will be applied again
+        :param streams: Indices of the streams to reset (all if None)
+        """
+        if streams is None:
+            self._hidden.fill_(0.0)
+            self._positions.fill_(0)
+        else:
+            self._hidden[streams] = 0.0
+            self._positions[streams] = 0
+        # end if
+    # end reset
+
+    # Feed a chunk
+    def forward(self, u, y=None, streams=None):
+        """
+        Feed a chunk of inputs to some streams and continue from their last states. The chunk is run for all
+        streams at once, the time steps still in the washout period of each stream are then dropped.
+        :param u: Inputs (n streams x chunk length x input dim)
+        :param y: Targets if the ESN is in training mode (n streams x chunk length x output dim)
+        :param streams: Indices of the streams fed (all streams if None)
+        :return: Readout outputs for the chunk without the time steps still in the washout period
+        (n streams x kept length x output dim). If the streams are not at the same position in the washout
+        period, the outputs of each stream are at the start and padded with zeros, the number of valid time
+        steps of each stream is given by lengths.
+        """
+        # Streams fed
+        if streams is None:
+            streams = list(range(self.n_streams))
+        # end if
+
+        # One input sequence per stream
+        if u.size(0) != len(streams):
+            raise Exception(
+                "One input sequence per stream expected, got {} for {} streams".format(u.size(0), len(streams))
+            )
+        # end if
+
+        # Reservoir cell
+        cell = self._esn.cell
+
+        # Time steps of this chunk still in the washout period of each stream
+        skips = torch.clamp(cell.washout - self._positions[streams], min=0, max=u.size(1))
+        self._lengths = u.size(1) - skips
+        skips = skips.tolist()
+
+        # Cell state, washout and execution mode to restore
+        cell_hidden, cell_washout, cell_batched = cell.hidden, cell.washout, cell.batched
+
+        # Continue from the streams' states (one state per stream, the fused loop of a Li-ESN is used
+        # if possible), the washout is applied per stream afterwards
+        cell.batched = True
+        cell.hidden = self._hidden[streams]
+        cell.washout = 0
+        try:
+            hidden_states = cell(u, reset_state=False)
+            self._hidden[streams] = cell.hidden.data
+        finally:
+            cell.batched = cell_batched
+            cell.hidden, cell.washout = cell_hidden, cell_washout
+        # end try
+
+        # Time steps seen
+        self._positions[streams] += u.size(1)
+
+        # Streams at the same position in the washout period
+        if len(set(skips)) == 1:
+            return self._readout(hidden_states[:, skips[0]:], y[:, skips[0]:] if self._esn.training else None)
+        # end if
+
+        # Readout of each stream without its washout, at the start of the padded outputs
+        if self._esn.training:
+            outputs = [
+                self._readout(hidden_states[i:i + 1, skip:], y[i:i + 1, skip:])[0]
+                for i, skip in enumerate(skips)
+            ]
+        else:
+            all_outputs = self._readout(hidden_states, None)
+            outputs = [all_outputs[i, skip:] for i, skip in enumerate(skips)]
+        # end if
+        padded = outputs[0].new_zeros(len(streams), u.size(1) - min(skips), outputs[0].size(-1))
+        for i, stream_outputs in enumerate(outputs):
+            padded[i, :stream_outputs.size(0)] = stream_outputs
+        # end for
+        return padded
+    # end forward
+
+    # endregion PUBLIC
+
+    # region PRIVATE
+
+    # Readout
+    def _readout(self, hidden_states, y):
+        """
+        Readout of hidden states, the states are only accumulated in training mode if there are time steps left
+        :param hidden_states: Hidden states (n streams x length x hidden dim)
+        :param y: Targets if the ESN is in training mode (n streams x length x output dim)
+        :return: Readout outputs
+        """
+        if self._esn.training and hidden_states.size(1) == 0:
+            return hidden_states
+        # end if
+        return self._esn.output(hidden_states, y)
+    # end _readout
+
+    # endregion PRIVATE
+
+    # region OVERRIDE
+
+    # Call
+    def __call__(self, *args, **kwargs):
+        """
+        Call
+        """
+        return self.forward(*args, **kwargs)
+    # end __call__
+
+    # endregion OVERRIDE
+
+# end ESNStream
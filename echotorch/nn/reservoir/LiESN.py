@@ -39,8 +39,8 @@ class LiESN(ESN):
     # Constructor
     def __init__(self, input_dim, hidden_dim, output_dim, leaky_rate, w_generator, win_generator, wbias_generator,
                  input_scaling=1.0, nonlin_func=torch.tanh, learning_algo='inv',
-                 ridge_param=0.0, with_bias=True, softmax_output=False, washout=0, debug=Node.NO_DEBUG, test_case=None,
-                 dtype=torch.float32):
+                 ridge_param=0.0, with_bias=True, softmax_output=False, washout=0, batched=False, debug=Node.NO_DEBUG,
+                 test_case=None, dtype=torch.float32):
         """
         Constructor
         :param input_dim: Input feature space dimension
@@ -57,6 +57,7 @@ class LiESN(ESN):
         :param with_bias: Add a bias to output ?
         :param softmax_output: Add a softmax layer at the outputs ?
         :param washout: Length of the washout period ?
+        :param batched: Step all the samples of a batch together in the reservoir
         :param debug: Debug mode
         :param test_case: Test case to call for test
         :param dtype: Data type
@@ -95,6 +96,7 @@ class LiESN(ESN):
             w_bias=w_bias,
             nonlin_func=nonlin_func,
             washout=washout,
+            batched=batched,
             debug=debug,
             test_case=test_case,
             dtype=dtype
@@ -29,6 +29,7 @@ import torch.sparse
 import torch.nn as nn
 from torch.autograd import Variable
 from echotorch.nn.reservoir.ESNCell import ESNCell
+from ..Node import Node
 
 
 # Leak-Integrated Echo State Network layer
@@ -38,17 +39,177 @@ class LiESNCell(ESNCell):
     """
 
     # Constructor
-    def __init__(self, leaky_rate=1.0, *args, **kwargs):
+    def __init__(self, leaky_rate=1.0, *args, fused=True, **kwargs):
         """
         Constructor
         :param leaky_rate: Reservoir's leaky rate (default 1.0, normal ESN)
+        :param fused: Use the fused step loop when no step hook, neural filter or noise is used
         """
         super(LiESNCell, self).__init__(*args, **kwargs)
 
         # Param
         self._leaky_rate = leaky_rate
+        self._fused = fused
     # end __init__
 
+    # region PROPERTIES
+
+    # Leaky rate
+    @property
+    def leaky_rate(self):
+        """
+        Leaky rate
+        :return: Leaky rate
+        """
+        return self._leaky_rate
+    # end leaky_rate
+
+    # endregion PROPERTIES
+
+    # region PUBLIC
+
+    # Forward
+    def forward(self, u, reset_state=True):
+        """
+        Forward pass function
+        :param u: Input signal
+        :param reset_state: Reset state at each batch ?
+        :return: Resulting hidden states
+        """
+        if self._fusable(reset_state):
+            return self._forward_fused(u, reset_state=reset_state)
+        # end if
+        return super(LiESNCell, self).forward(u, reset_state=reset_state)
+    # end forward
+
+    # endregion PUBLIC
+
+    # region PRIVATE
+
+    # Can the fused step loop be used ?
+    def _fusable(self, reset_state):
+        """
+        Can the fused step loop be used ? Only if the step computation is the one of the
+        Li-ESN (no overridden layer or step hook, no neural filter, no noise, no debug) and
+        if the samples do not depend on each other (batched or reset at each sample).
+        :param reset_state: Reset state at each batch ?
+        :return: True or False
+        """
+        # Class of the cell
+        cell_class = type(self)
+
+        # Overridden step computation
+        for method_name, base_class in [('_input_layer', ESNCell), ('_input_layer_bulk', ESNCell),
+                                        ('_recurrent_layer', ESNCell), ('_reservoir_layer', ESNCell),
+                                        ('_post_nonlinearity', LiESNCell),
+                                        ('_pre_step_update_hook', Node), ('_post_step_update_hook', Node),
+                                        ('_pre_step_batch_update_hook', Node), ('_post_step_batch_update_hook', Node)]:
+            if getattr(cell_class, method_name) is not getattr(base_class, method_name):
+                return False
+            # end if
+        # end for
+
+        return self._fused and self._noise_generator is None and self._debug == Node.NO_DEBUG and \
+            len(self._neural_filter_handlers) == 0 and len(self._neural_batch_filter_handlers) == 0 and \
+            (reset_state or self._batched)
+    # end _fusable
+
+    # Fused step loop
+    def _forward_fused(self, u, reset_state=True):
+        """
+        Fused step loop, the input projections of all time steps are computed with a single GEMM
+        before the loop and each state is written in place in a time-major state tensor.
+        :param u: Input signal
+        :param reset_state: Reset state at each batch ?
+        :return: Resulting hidden states
+        """
+        # Batch size, time length and reservoir size
+        n_batches, time_length, n_units = int(u.size(0)), int(u.size(1)), self.output_dim
+
+        # For each sample, pre-update hook and observe inputs
+        for b in range(n_batches):
+            u[b, :] = self._pre_update_hook(u[b, :], self._forward_calls, b)
+            self.observation_point('U', u[b, :])
+        # end for
+
+        # Input projections and bias for all time steps (batch size x time length x reservoir)
+        u_win = self._input_layer_bulk(u * self._input_scaling).add_(self.w_bias)
+
+        # States (time-major so that each step is contiguous)
+        states = torch.empty(time_length, n_batches, n_units, dtype=self.dtype, device=self.hidden.device)
+
+        # Initial states (start from the last state if not reset)
+        if reset_state:
+            hidden = torch.zeros(n_batches, n_units, dtype=self.dtype, device=self.hidden.device)
+        elif self.hidden.ndim == 2 and self.hidden.size(0) == n_batches:
+            hidden = self.hidden
+        else:
+            hidden = self.hidden.view(-1, n_units)[-1].repeat(n_batches, 1)
+        # end if
+
+        # Leaky rate
+        leaky_rate = self._leaky_rate
+
+        # For each steps
+        for t in range(time_length):
+            # State at t, written in place
+            x = states[t]
+
+            # W * x(t-1) + Win * u(t) + Wbias
+            if self.w.is_sparse:
+                torch.add(u_win[:, t], torch.sparse.mm(self.w, hidden.t()).t(), out=x)
+            else:
+                torch.addmm(u_win[:, t], hidden, self.w.t(), out=x)
+            # end if
+
+            # Activation function
+            if self.nonlin_func is torch.tanh:
+                x.tanh_()
+            else:
+                x.copy_(self.nonlin_func(x))
+            # end if
+
+            # Leaky integration
+            if leaky_rate != 1.0:
+                x.mul_(leaky_rate).add_(hidden, alpha=1.0 - leaky_rate)
+            # end if
+
+            # New last states
+            hidden = x
+        # end for
+
+        # Last states, one per sample in batched mode
+        if self._batched:
+            self.hidden = hidden.clone()
+        elif n_batches > 0 and time_length > 0:
+            self.hidden = hidden[-1].clone()
+        # end if
+
+        # Outputs
+        outputs = states.transpose(0, 1).contiguous()
+
+        # For each sample
+        for b in range(n_batches):
+            # Post-update hook
+            outputs[b, :] = self._post_update_hook(outputs[b, :], u[b, :], self._forward_calls, b)
+
+            # Post states update handlers
+            for handler in self._post_states_update_handlers:
+                handler(outputs[b, self._washout:], u[b, self._washout:], self._forward_calls, b)
+            # end for
+
+            # Observe states
+            self.observation_point('X', outputs[b, self._washout:])
+        # end for
+
+        # Count calls to forward
+        self._forward_calls += 1
+
+        return outputs[:, self._washout:]
+    # end _forward_fused
+
+    # endregion PRIVATE
+
     # region OVERRIDE
 
     # Compute post nonlinearity hook
@@ -58,7 +219,7 @@ class LiESNCell(ESNCell):
         :param x: Reservoir state at time t
         :return: Reservoir state
         """
-        return self.hidden.mul(1.0 - self._leaky_rate) + x.view(self.output_dim).mul(self._leaky_rate)
+        return self.hidden.mul(1.0 - self._leaky_rate) + x.view(self.hidden.size()).mul(self._leaky_rate)
     # end _post_nonlinearity
 
     # Extra-information
@@ -67,7 +228,7 @@ class LiESNCell(ESNCell):
         Extra-information
         """
         s = super(LiESNCell, self).extra_repr()
-        s += ', leaky-rate={_leaky_rate}'
+        s += ', leaky-rate={_leaky_rate}, fused={_fused}'
         return s.format(**self.__dict__)
     # end extra_repr
 
@@ -27,6 +27,7 @@ from .DeepESN import DeepESN
 from .EESN import EESN
 from .ESN import ESN
 from .ESNCell import ESNCell
+from .ESNStream import ESNStream
 from .GatedESN import GatedESN
 from .HESN import HESN
 from .LiESN import LiESN
@@ -35,5 +36,5 @@ from .StackedESN import StackedESN
 
 # All
 __all__ = [
-    'BDESN', 'BDESNPCA', 'DeepESN', 'EESN', 'ESN', 'ESNCell', 'GatedESN', 'HESN', 'LiESN', 'LiESNCell', 'StackedESN'
+    'BDESN', 'BDESNPCA', 'DeepESN', 'EESN', 'ESN', 'ESNCell', 'ESNStream', 'GatedESN', 'HESN', 'LiESN', 'LiESNCell', 'StackedESN'
 ]
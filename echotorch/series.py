@@ -357,12 +357,13 @@ def mackey_glass(
             tau=tau
         )
     else:
-        samples = list()
-        for sample_i in range(size):
-            return etds.MackeyGlassDataset.generate(
-
-            )
-        # end for
+        return etds.MackeyGlassDataset.generate(
+            sample_len=length,
+            history_len=tau * 10,
+            delta_t=10,
+            n_samples=size,
+            dtype=dtype if dtype is not None else torch.get_default_dtype()
+        )
     # end if
 # end mackey_glass
 
@@ -177,22 +177,28 @@ def generalized_squared_cosine(m1, m2):
     Ua, Sa, _ = torch.svd(m1)
     Ub, Sb, _ = torch.svd(m2)
 
-    # Diag
-    Sa = torch.diag(Sa)
-    Sb = torch.diag(Sb)
+    return generalized_squared_cosine_svd(Sa, Ua, Sb, Ub)
+# end generalized_squared_cosine
 
-    # Compute Va and Vb
-    Va = torch.sqrt(Sa).mm(Ua.t())
-    Vb = Ub.mm(torch.sqrt(Sb))
 
-    # Vab
-    Vab = Va.mm(Vb)
+# Generalized squared cosine from singular value decompositions
+def generalized_squared_cosine_svd(Sa, Ua, Sb, Ub):
+    """
+    Generalized square cosine from the singular values and vectors of both matrices
+    :param Sa: Singular values of the first matrix
+    :param Ua: Singular vectors of the first matrix
+    :param Sb: Singular values of the second matrix
+    :param Ub: Singular vectors of the second matrix
+    :return:
+    """
+    # Vab = sqrt(Sa) * Ua^T * Ub * sqrt(Sb)
+    Vab = torch.sqrt(Sa).unsqueeze(1) * torch.mm(Ua.t(), Ub) * torch.sqrt(Sb).unsqueeze(0)
 
     # Num
     num = torch.pow(torch.norm(Vab), 2)
 
     # Den
-    den = torch.norm(torch.diag(Sa), p=2) * torch.norm(torch.diag(Sb), p=2)
+    den = torch.norm(Sa, p=2) * torch.norm(Sb, p=2)
 
     return num / den
-# end generalized_squared_cosine
+# end generalized_squared_cosine_svd
@@ -41,7 +41,9 @@ class MatrixGenerator(object):
         self._parameters = dict()
         self._parameters['spectral_radius'] = 0.99
         self._parameters['apply_spectral_radius'] = True
+        self._parameters['spectral_radius_tol'] = 1e-6
         self._parameters['scale'] = 1.0
+        self._parameters['sparse'] = False
 
         # Set parameter values given
         for key, value in kwargs.items():
@@ -104,15 +106,26 @@ class MatrixGenerator(object):
         # Call matrix generation function
         w = self._generate_matrix(size, dtype)
 
+        # Sparse storage for 2-D matrices
+        if self.get_parameter('sparse') and w.ndimension() == 2 and not w.is_sparse:
+            w = w.to_sparse()
+        # end if
+
         # Scale
         w *= self.get_parameter('scale')
 
         # Set spectral radius
         # If two dim tensor, square matrix and spectral radius is available
         if w.ndimension() == 2 and w.size(0) == w.size(1) and self.get_parameter('apply_spectral_radius'):
+            # Estimate current spectral radius
+            current_spectral_radius = echotorch.utils.estimate_spectral_radius(
+                w,
+                tol=self.get_parameter('spectral_radius_tol')
+            )
+
             # If current spectral radius is not zero
-            if echotorch.utils.spectral_radius(w) > 0.0:
-                w = (w / echotorch.utils.spectral_radius(w)) * self.get_parameter('spectral_radius')
+            if current_spectral_radius > 0.0:
+                w = (w / current_spectral_radius) * self.get_parameter('spectral_radius')
             else:
                 warnings.warn("Spectral radius of W is zero (due to small size), spectral radius not changed")
             # end if
@@ -136,6 +149,51 @@ class MatrixGenerator(object):
         return  torch.randn(size, dtype=dtype)
     # end _generate_matrix
 
+    # Is the matrix to generate stored as a sparse tensor ?
+    def _sparse_generation(self, size):
+        """
+        Is the matrix to generate stored as a sparse tensor ?
+        :param size: Matrix size
+        :return: True if sparse storage is asked and size is 2-D
+        """
+        return self.get_parameter('sparse') and isinstance(size, (tuple, list, torch.Size)) and len(size) == 2
+    # end _sparse_generation
+
+    # Generate the positions of the non-zero entries of a sparse matrix
+    def _generate_sparse_indices(self, size, connectivity, minimum_edges=0):
+        """
+        Generate the positions of the non-zero entries of a sparse matrix without creating the dense mask
+        :param size: Matrix size (row, column)
+        :param connectivity: Probability for each entry to be non-zero
+        :param minimum_edges: Minimum number of non-zero entries
+        :return: Indices as a 2 x nnz LongTensor (sorted)
+        """
+        # Total number of entries
+        n_entries = int(size[0]) * int(size[1])
+
+        # Number of edges drawn as for a bernoulli mask
+        n_edges = int(torch.distributions.Binomial(
+            total_count=n_entries,
+            probs=torch.tensor(float(connectivity), dtype=torch.float64)
+        ).sample().item())
+
+        # Minimum edges
+        n_edges = max(n_edges, min(int(minimum_edges), n_entries))
+
+        # Draw unique positions
+        if n_edges * 2 > n_entries:
+            positions = torch.sort(torch.randperm(n_entries)[:n_edges])[0]
+        else:
+            positions = torch.unique(torch.randint(high=n_entries, size=(n_edges,)))
+            while positions.numel() < n_edges:
+                new_positions = torch.randint(high=n_entries, size=(n_edges - positions.numel(),))
+                positions = torch.unique(torch.cat((positions, new_positions)))
+            # end while
+        # end if
+
+        return torch.stack((positions // int(size[1]), positions % int(size[1])))
+    # end _generate_sparse_indices
+
     # Set parameters
     def _set_parameters(self, args):
         """
@@ -50,7 +50,8 @@ class NormalMatrixGenerator(MatrixGenerator):
             scale=1.0,
             mean=0.0,
             std=1.0,
-            minimum_edges=0
+            minimum_edges=0,
+            sparse=False
         )
 
         # Set parameters
@@ -74,6 +75,17 @@ class NormalMatrixGenerator(MatrixGenerator):
         mean = self.get_parameter('mean')
         std = self.get_parameter('std')
 
+        # Sparse storage, generate only the non-zero entries
+        if self._sparse_generation(size):
+            indices = self._generate_sparse_indices(
+                size,
+                1.0 if connectivity is None else connectivity,
+                self.get_parameter('minimum_edges')
+            )
+            values = torch.zeros(indices.size(1), dtype=dtype).normal_(mean=mean, std=std)
+            return torch.sparse_coo_tensor(indices, values, size=tuple(size)).coalesce()
+        # end if
+
         # Full connectivity if none
         if connectivity is None:
             w = torch.zeros(size, dtype=dtype)
@@ -49,7 +49,8 @@ class UniformMatrixGenerator(MatrixGenerator):
             input_set=[1.0, -1.0],
             minimum_edges=0,
             min=-1.0,
-            max=1.0
+            max=1.0,
+            sparse=False
         )
 
         # Set parameters
@@ -74,6 +75,19 @@ class UniformMatrixGenerator(MatrixGenerator):
             connectivity = 1.0
         # end if
 
+        # Sparse storage, generate only the non-zero entries
+        if self._sparse_generation(size):
+            indices = self._generate_sparse_indices(size, connectivity, self.get_parameter('minimum_edges'))
+            if input_set is None:
+                values = torch.zeros(indices.size(1), dtype=dtype)
+                values.uniform_(self.get_parameter('min'), self.get_parameter('max'))
+            else:
+                values = np.random.choice(input_set, indices.size(1), p=[1.0 / len(input_set)] * len(input_set))
+                values = torch.from_numpy(values.astype(np.float32 if dtype == torch.float32 else np.float64))
+            # end if
+            return torch.sparse_coo_tensor(indices, values, size=tuple(size)).coalesce()
+        # end if
+
         # Generate
         if input_set is None:
             # Generate matrix with entries from norm
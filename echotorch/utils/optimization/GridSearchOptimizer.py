@@ -102,29 +102,33 @@ class GridSearchOptimizer(Optimizer):
         param_ranges_list, comb_count = self._convert_parameter_range(param_ranges)
 
         # Population of parameter values
-        parameter_population = (
+        parameter_population = [
             dict(zip(param_ranges_list.keys(), values)) for values in product(*param_ranges_list.values())
-        )
+        ]
 
-        # Save fitness values
+        # Save fitness values, as (position, fitness value)
         winner = (None, math.inf)
 
-        # Test each member of the population
-        for r, param_individual in enumerate(parameter_population):
-            # Test the model
-            _, fitness_value = test_function(param_individual, datasets, **kwargs)
-
-            # Keep if it is the best
+        # Test each member of the population, the models are dropped as they complete
+        for param_i, fitness_value, _ in self._evaluate_as_completed(
+                test_function,
+                parameter_population,
+                datasets,
+                **kwargs
+        ):
+            # Keep if it is the best (the first in the grid on ties)
             if (self.get_parameter('target') == 'min' and fitness_value < winner[1]) or \
-                    (self.get_parameter('target') == 'max' and fitness_value > winner[1]):
-                winner = (param_individual, fitness_value)
+                    (self.get_parameter('target') == 'max' and fitness_value > winner[1]) or \
+                    (winner[0] is not None and fitness_value == winner[1] and param_i < winner[0]):
+                winner = (param_i, fitness_value)
             # end if
         # end for
 
         # Get the best model
-        model, fitness_value = test_function(winner[0], datasets, **kwargs)
+        best_param = parameter_population[winner[0]]
+        model, fitness_value = test_function(best_param, datasets, **kwargs)
 
-        return model, winner[0], fitness_value
+        return model, best_param, fitness_value
     # end _optimize_func
 
     # endregion PRIVATE
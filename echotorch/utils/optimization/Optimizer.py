@@ -20,8 +20,93 @@
 # Copyright Nils Schaetti <nils.schaetti@unine.ch>, <nils.schaetti@unige.ch>
 
 # Imports
-import math
+import random
+import numpy as np
+import torch
+import torch.multiprocessing
+import torch.utils.data
 import concurrent.futures
+from collections import OrderedDict
+from ..random import manual_seed
+
+
+# State of an evaluation worker process (test function, shared arguments and seed)
+_worker_state = dict()
+
+
+# Initialize an evaluation worker process
+def _init_worker(test_function, args, kwargs, seed, num_threads):
+    """
+    Initialize an evaluation worker process, the arguments (datasets) are received once per worker
+    :param test_function: Function evaluating a set of parameters
+    :param args: Arguments of the test function (datasets)
+    :param kwargs: Keyword arguments of the test function
+    :param seed: Base seed (None to reseed each worker randomly)
+    :param num_threads: Number of PyTorch threads in the worker
+    """
+    _worker_state['test_function'] = test_function
+    _worker_state['args'] = args
+    _worker_state['kwargs'] = kwargs
+    _worker_state['seed'] = seed
+
+    # Workers forked from the same process must not share random streams
+    if seed is None:
+        random.seed()
+        np.random.seed()
+        torch.seed()
+    # end if
+
+    # Do not oversubscribe the cores
+    torch.set_num_threads(num_threads)
+# end _init_worker
+
+
+# Evaluate a set of parameters in a worker process
+def _evaluate_in_worker(param_i, params):
+    """
+    Evaluate a set of parameters in a worker process (the model stays in the worker)
+    :param param_i: Position of the parameters in the set
+    :param params: Parameters to evaluate
+    :return: Position, fitness value
+    """
+    # Seed of this set of parameters
+    if _worker_state['seed'] is not None:
+        manual_seed(_worker_state['seed'] + param_i)
+    # end if
+
+    # Evaluate
+    _, fitness_value = _worker_state['test_function'](params, *_worker_state['args'], **_worker_state['kwargs'])
+    return param_i, fitness_value
+# end _evaluate_in_worker
+
+
+# Move the tensors of the arguments to shared memory
+def _share_memory(obj):
+    """
+    Move the tensors of the arguments (tensors, lists, tuples, dictionaries and dataset attributes)
+    to shared memory, so that they are not copied for each worker
+    :param obj: Object
+    """
+    if isinstance(obj, torch.Tensor):
+        if not obj.is_sparse:
+            obj.share_memory_()
+        # end if
+    elif isinstance(obj, (list, tuple)):
+        for o in obj:
+            _share_memory(o)
+        # end for
+    elif isinstance(obj, dict):
+        for o in obj.values():
+            _share_memory(o)
+        # end for
+    elif isinstance(obj, torch.utils.data.Dataset):
+        for o in vars(obj).values():
+            if isinstance(o, (torch.Tensor, list, tuple, dict)):
+                _share_memory(o)
+            # end if
+        # end for
+    # end if
+# end _share_memory
 
 
 # Optimizer base class
@@ -34,14 +119,19 @@ class Optimizer(object):
     def __init__(self, num_workers=1, **kwargs):
         """
         Constructor
+        :param num_workers: Number of parameter sets evaluated at the same time
         :param kwargs: Parameters for the optimizer
         """
         # Workers
         self._num_workers = num_workers
 
-        # Default generation parameters
+        # Default generation parameters, evaluation backend ('thread' or 'process') and seed
+        # of the evaluations (seed + position of the parameters, not with threads)
         self._parameters = dict()
         self._parameters['target'] = 'min'
+        self._parameters['backend'] = 'thread'
+        self._parameters['seed'] = None
+        self._parameters['start_method'] = None
 
         # Initialize hooks
         self._hooks = dict()
@@ -173,62 +263,117 @@ class Optimizer(object):
         # end if
     # end _call_hook
 
-    # Evaluate a set of parameters with multiple threads
+    # Evaluate a set of parameters with workers
     def _evaluate_with_workers(self, worker_func, params_set, *args, **kwargs):
         """
-        Evaluate a set of parameters with multiple threads
-        :param params_set:
-        :param worker_func:
-        :param args:
-        :param kwargs:
-        :return:
+        Evaluate a set of parameters with workers
+        :param worker_func: Function evaluating a set of parameters (returns the model and the fitness value)
+        :param params_set: List of parameter sets
+        :param args: Arguments of the function (datasets)
+        :param kwargs: Keyword arguments of the function
+        :return: List of (parameters, fitness value, model) in the order of the parameter sets
         """
-        # How many pass
-        n_passes = int(math.ceil(len(params_set) / self._num_workers))
-
-        # Overall results
-        overall_results = list()
-
-        # Position in param set
-        param_i = 0
-
-        # For each pass
-        for pass_i in range(n_passes):
-            # Create an executor
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                # List of thread
-                thread_list = list()
-
-                # For each worker
-                for worker_i in range(self._num_workers):
-                    # Launch threads
-                    thread_list.append(executor.submit(worker_func, params_set[param_i], *args, **kwargs))
-
-                    # Next parameters
-                    param_i += 1
-
-                    # If the end, break
-                    if param_i == len(params_set):
-                        break
-                    # end if
+        # Results in the order of the parameter sets
+        overall_results = [None] * len(params_set)
+        for param_i, fitness_value, model in self._evaluate_as_completed(worker_func, params_set, *args, **kwargs):
+            overall_results[param_i] = (params_set[param_i], fitness_value, model)
+        # end for
+        return overall_results
+    # end _evaluate_with_workers
+
+    # Evaluate a set of parameters and yield results as they complete
+    def _evaluate_as_completed(self, worker_func, params_set, *args, **kwargs):
+        """
+        Evaluate a set of parameters and yield the results as they complete. All parameter sets are queued at
+        once and each worker takes the next one as soon as it is free. With the process backend, the arguments
+        (datasets) are moved to shared memory and sent once to each worker, the function must be picklable
+        and the models stay in the workers (None).
+        :param worker_func: Function evaluating a set of parameters (returns the model and the fitness value)
+        :param params_set: List of parameter sets
+        :param args: Arguments of the function (datasets)
+        :param kwargs: Keyword arguments of the function
+        :return: Generator of (position of the parameters, fitness value, model)
+        """
+        # Backend and seed
+        backend = self.get_parameter('backend')
+        seed = self.get_parameter('seed')
+
+        # Order of evaluation
+        order = self._evaluation_order(worker_func, params_set)
+
+        # One worker, evaluated in this process
+        if self._num_workers == 1:
+            for param_i in order:
+                params = params_set[param_i]
+                if seed is not None:
+                    manual_seed(seed + param_i)
+                # end if
+                model, fitness_value = worker_func(params, *args, **kwargs)
+                yield param_i, fitness_value, model
+            # end for
+        elif backend == 'thread':
+            with concurrent.futures.ThreadPoolExecutor(max_workers=self._num_workers) as executor:
+                # Queue all parameter sets
+                futures = {
+                    executor.submit(worker_func, params_set[param_i], *args, **kwargs): param_i
+                    for param_i in order
+                }
+
+                # Results as they complete, the futures are released so that the models are not kept
+                for future in concurrent.futures.as_completed(futures):
+                    param_i = futures.pop(future)
+                    model, fitness_value = future.result()
+                    del future
+                    yield param_i, fitness_value, model
                 # end for
             # end with
+        elif backend == 'process':
+            # Datasets in shared memory
+            _share_memory(args)
+
+            # Pool of processes receiving the arguments once
+            with concurrent.futures.ProcessPoolExecutor(
+                    max_workers=self._num_workers,
+                    mp_context=torch.multiprocessing.get_context(self.get_parameter('start_method')),
+                    initializer=_init_worker,
+                    initargs=(worker_func, args, kwargs, seed, max(1, torch.get_num_threads() // self._num_workers))
+            ) as executor:
+                # Queue all parameter sets
+                futures = [
+                    executor.submit(_evaluate_in_worker, param_i, params_set[param_i]) for param_i in order
+                ]
+
+                # Results as they complete
+                for future in concurrent.futures.as_completed(futures):
+                    param_i, fitness_value = future.result()
+                    yield param_i, fitness_value, None
+                # end for
+            # end with
+        else:
+            raise Exception("Unknown evaluation backend : {}".format(backend))
+        # end if
+    # end _evaluate_as_completed
 
-            # Get results
-            for thread_i, t in enumerate(thread_list):
-                # Results
-                model, fitness_measure = t.result()
-
-                # Append
-                overall_results.append(
-                    (params_set[param_i-self._num_workers+thread_i], fitness_measure, model)
-                )
-            # end for
+    # Order of evaluation of a set of parameters
+    def _evaluation_order(self, worker_func, params_set):
+        """
+        Order of evaluation of a set of parameters. If the function caches the reservoirs (ReadoutCache), the
+        parameter sets sharing a reservoir configuration are queued one after the other.
+        :param worker_func: Function evaluating a set of parameters
+        :param params_set: List of parameter sets
+        :return: List of positions of the parameter sets
+        """
+        if not hasattr(worker_func, 'reservoir_key'):
+            return list(range(len(params_set)))
+        # end if
 
+        # Group by reservoir configuration, in order of first appearance
+        groups = OrderedDict()
+        for param_i, params in enumerate(params_set):
+            groups.setdefault(worker_func.reservoir_key(params), list()).append(param_i)
         # end for
-
-        return overall_results
-    # end _evaluate_with_workers
+        return [param_i for group in groups.values() for param_i in group]
+    # end _evaluation_order
 
     # Optimize function to override
     def _optimize_func(self, test_function, param_ranges, datasets, *args, **kwargs):
@@ -87,17 +87,15 @@ class RandomOptimizer(Optimizer):
         # Save fitness values
         fitness_values = np.zeros(R)
 
-        # Test each member of the population
-        for r, param_individual in enumerate(parameter_population):
-            # Test the model
-            _, fitness_value = test_function(
-                param_individual,
+        # Test each member of the population, the models are dropped as they complete
+        for param_i, fitness_value, _ in self._evaluate_as_completed(
+                test_function,
+                parameter_population,
                 datasets,
                 **kwargs
-            )
-
+        ):
             # Save fitness value
-            fitness_values[r] = fitness_value
+            fitness_values[param_i] = fitness_value
         # end for
 
         # Get the best parameter values
@@ -0,0 +1,278 @@
+# -*- coding: utf-8 -*-
+#
+# File : echotorch/utils/optimization/ReadoutCache.py
+# Description : Test function caching the reservoir of each configuration between readout-only candidates
+# Date : 18 October, 2026
+#
+# This file is part of EchoTorch.  EchoTorch is free software: you can
+# redistribute it and/or modify it under the terms of the GNU General Public
+# License as published by the Free Software Foundation, version 2.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, write to the Free Software Foundation, Inc., 51
+# Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# Copyright Nils Schaetti <nils.schaetti@unine.ch>, <nils.schaetti@unige.ch>
+
+# Imports
+import threading
+from collections import OrderedDict
+import numpy as np
+import torch
+
+
+# Test function caching the reservoir of each configuration
+class ReadoutCache(object):
+    """
+    Test function for the optimizers which separates reservoir-defining parameters from readout-only
+    parameters (ridge_param, learning_algo and with_bias of the RRCell by default). The object built for a
+    reservoir configuration (typically the ESN with its accumulated xTx/xTy and the states of the test set)
+    is kept in a bounded LRU cache, so that candidates which only change the readout run only finalize().
+    The optimizers evaluate the candidates sharing a reservoir configuration one after the other.
+    """
+
+    # Default readout-only parameters
+    READOUT_PARAMETERS = ('ridge_param', 'learning_algo', 'with_bias')
+
+    # Constructor
+    def __init__(self, build_function, readout_function, readout_parameters=READOUT_PARAMETERS, cache_size=8):
+        """
+        Constructor
+        :param build_function: Function mapping the reservoir parameters, the datasets and the keyword arguments
+        to the object to cache (ex: the trained ESN before finalize() and the test states)
+        :param readout_function: Function mapping the cached object, the readout parameters, the datasets and
+        the keyword arguments to a tuple (model, fitness value)
+        :param readout_parameters: Names of the readout-only parameters
+        :param cache_size: Maximum number of reservoir configurations kept in the cache
+        """
+        # Properties
+        self._build_function = build_function
+        self._readout_function = readout_function
+        self._readout_parameters = tuple(readout_parameters)
+        self._cache_size = cache_size
+
+        # Cache and statistics
+        self._init_cache()
+    # end __init__
+
+    # region PROPERTIES
+
+    # Readout-only parameters
+    @property
+    def readout_parameters(self):
+        """
+        Readout-only parameters
+        :return: Names of the readout-only parameters
+        """
+        return self._readout_parameters
+    # end readout_parameters
+
+    # Cache size
+    @property
+    def cache_size(self):
+        """
+        Cache size
+        :return: Maximum number of reservoir configurations kept in the cache
+        """
+        return self._cache_size
+    # end cache_size
+
+    # Number of reservoir configurations built
+    @property
+    def builds(self):
+        """
+        Number of reservoir configurations built (cache misses)
+        :return: Number of builds
+        """
+        return self._builds
+    # end builds
+
+    # Number of candidates evaluated from the cache
+    @property
+    def hits(self):
+        """
+        Number of candidates evaluated from the cache
+        :return: Number of cache hits
+        """
+        return self._hits
+    # end hits
+
+    # endregion PROPERTIES
+
+    # region PUBLIC
+
+    # Split parameters
+    def split(self, parameters):
+        """
+        Split a candidate into reservoir and readout parameters
+        :param parameters: Dictionary with parameters values
+        :return: Reservoir parameters, readout parameters (dictionaries)
+        """
+        reservoir_params = dict()
+        readout_params = dict()
+        for key, value in parameters.items():
+            if key in self._readout_parameters:
+                readout_params[key] = value
+            else:
+                reservoir_params[key] = value
+            # end if
+        # end for
+        return reservoir_params, readout_params
+    # end split
+
+    # Key of a reservoir configuration
+    def reservoir_key(self, parameters):
+        """
+        Key of the reservoir configuration of a candidate
+        :param parameters: Dictionary with parameters values
+        :return: Hashable key
+        """
+        reservoir_params, _ = self.split(parameters)
+        return self._freeze(reservoir_params)
+    # end reservoir_key
+
+    # Clear the cache
+    def clear(self):
+        """
+        Clear the cache
+        """
+        with self._lock:
+            self._cache.clear()
+            self._key_locks.clear()
+            self._datasets = None
+        # end with
+    # end clear
+
+    # endregion PUBLIC
+
+    # region PRIVATE
+
+    # Initialize the cache
+    def _init_cache(self):
+        """
+        Initialize the cache, the locks and the statistics
+        """
+        self._cache = OrderedDict()
+        self._datasets = None
+        self._lock = threading.Lock()
+        self._key_locks = dict()
+        self._builds = 0
+        self._hits = 0
+    # end _init_cache
+
+    # Get a cached object or build it
+    def _get(self, key, reservoir_params, datasets, **kwargs):
+        """
+        Get the object of a reservoir configuration from the cache, or build it (the lock of the key is held)
+        :param key: Key of the reservoir configuration
+        :param reservoir_params: Reservoir parameters
+        :param datasets: Datasets
+        :return: Cached object
+        """
+        # In the cache
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                self._hits += 1
+                return self._cache[key]
+            # end if
+        # end with
+
+        # Build outside the global lock, other configurations are built at the same time
+        cached = self._build_function(reservoir_params, datasets, **kwargs)
+
+        # Add and evict the least recently used configurations
+        with self._lock:
+            self._builds += 1
+            self._cache[key] = cached
+            while len(self._cache) > self._cache_size:
+                evicted_key, _ = self._cache.popitem(last=False)
+                self._key_locks.pop(evicted_key, None)
+            # end while
+        # end with
+
+        return cached
+    # end _get
+
+    # Hashable version of parameter values
+    @staticmethod
+    def _freeze(value):
+        """
+        Hashable version of parameter values
+        :param value: Value (dictionary, list, tuple, array, tensor or scalar)
+        :return: Hashable value
+        """
+        if isinstance(value, dict):
+            return tuple(sorted((k, ReadoutCache._freeze(v)) for k, v in value.items()))
+        elif isinstance(value, (list, tuple)):
+            return tuple(ReadoutCache._freeze(v) for v in value)
+        elif isinstance(value, (np.ndarray, torch.Tensor)):
+            return ReadoutCache._freeze(value.tolist())
+        # end if
+        return value
+    # end _freeze
+
+    # endregion PRIVATE
+
+    # region OVERRIDE
+
+    # Evaluate a candidate
+    def __call__(self, parameters, datasets, **kwargs):
+        """
+        Evaluate a candidate, the reservoir is built only if its configuration is not in the cache.
+        The readout of the candidates of the same configuration are computed one at a time.
+        :param parameters: Dictionary with parameters values
+        :param datasets: Datasets
+        :param kwargs: Keyword arguments of the build and readout functions
+        :return: A tuple (model, fitness value)
+        """
+        # Split parameters
+        reservoir_params, readout_params = self.split(parameters)
+        key = self._freeze(reservoir_params)
+
+        # Lock of this configuration, the cache is emptied when other datasets are given (ex: new budget)
+        with self._lock:
+            if datasets is not self._datasets:
+                self._cache.clear()
+                self._key_locks.clear()
+                self._datasets = datasets
+            # end if
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        # end with
+
+        # Build or get the reservoir, then finalize the readout
+        with key_lock:
+            cached = self._get(key, reservoir_params, datasets, **kwargs)
+            return self._readout_function(cached, readout_params, datasets, **kwargs)
+        # end with
+    # end __call__
+
+    # State to pickle (process workers have their own cache)
+    def __getstate__(self):
+        """
+        State to pickle, without the cache, the datasets and the locks
+        """
+        state = self.__dict__.copy()
+        for key in ['_cache', '_datasets', '_lock', '_key_locks']:
+            del state[key]
+        # end for
+        return state
+    # end __getstate__
+
+    # Restore state
+    def __setstate__(self, state):
+        """
+        Restore state with an empty cache
+        """
+        self.__dict__.update(state)
+        self._init_cache()
+    # end __setstate__
+
+    # endregion OVERRIDE
+
+# end ReadoutCache
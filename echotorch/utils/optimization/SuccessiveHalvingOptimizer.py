@@ -0,0 +1,335 @@
+# -*- coding: utf-8 -*-
+#
+# File : echotorch/utils/optimization/SuccessiveHalvingOptimizer.py
+# Description : Hyperparameters optimization by successive halving and Hyperband
+# Date : 18 October, 2026
+#
+# This file is part of EchoTorch.  EchoTorch is free software: you can
+# redistribute it and/or modify it under the terms of the GNU General Public
+# License as published by the Free Software Foundation, version 2.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, write to the Free Software Foundation, Inc., 51
+# Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# Copyright Nils Schaetti <nils.schaetti@unine.ch>, <nils.schaetti@unige.ch>
+
+# Imports
+import random
+import math
+import torch
+import torch.utils.data
+from .Optimizer import Optimizer
+from .OptimizerFactory import optimizer_factory
+
+
+# Dataset with the first time steps of each sample
+class _PrefixDataset(torch.utils.data.Dataset):
+    """
+    Dataset with the first time steps of each sample of another dataset
+    """
+
+    # Constructor
+    def __init__(self, root_dataset, budget):
+        """
+        Constructor
+        :param root_dataset: Dataset
+        :param budget: Fraction of the time steps to keep
+        """
+        self._root_dataset = root_dataset
+        self._budget = budget
+    # end __init__
+
+    # Length
+    def __len__(self):
+        """
+        Length
+        """
+        return len(self._root_dataset)
+    # end __len__
+
+    # Get item
+    def __getitem__(self, item):
+        """
+        Get item, each tensor of the sample is cut along its first (time) dimension
+        :param item: Index
+        """
+        item_data = self._root_dataset[item]
+        if isinstance(item_data, (list, tuple)):
+            return [self._prefix(d) for d in item_data]
+        # end if
+        return self._prefix(item_data)
+    # end __getitem__
+
+    # Prefix of a tensor
+    def _prefix(self, x):
+        """
+        Prefix of a tensor
+        :param x: Timeseries (time length x dim)
+        """
+        if isinstance(x, torch.Tensor) and x.dim() > 0:
+            return x[:max(1, int(math.ceil(self._budget * x.size(0))))]
+        # end if
+        return x
+    # end _prefix
+
+# end _PrefixDataset
+
+
+# Hyperparameters optimization by successive halving and Hyperband
+class SuccessiveHalvingOptimizer(Optimizer):
+    """
+    Hyperparameters optimization by successive halving. Many random candidates are evaluated with a small
+    budget (a subset of the samples, or the first time steps of each sample, of each dataset of the tuple),
+    then the best 1/eta of them are evaluated again with a budget eta times larger, until the whole datasets.
+    With hyperband=True, several brackets trading the number of candidates for the starting budget are run.
+    """
+
+    # Constructor
+    def __init__(self, num_workers=1, **kwargs):
+        """
+        Constructor
+        :param kwargs: Argument for the optimizer
+        """
+        # Set default parameter values, the budget is the fraction of the datasets given to the test function,
+        # budget_mode 'samples' keeps the first samples and 'length' the first time steps of each sample
+        super(SuccessiveHalvingOptimizer, self).__init__(
+            num_workers=num_workers,
+            n_candidates=None,
+            eta=3,
+            min_budget=1.0 / 27.0,
+            budget_mode='samples',
+            budget_function=None,
+            hyperband=False
+        )
+
+        # Set parameters
+        self._set_parameters(args=kwargs)
+    # end __init__
+
+    # region PROPERTIES
+
+    # List of hooks (to override)
+    @property
+    def hooks_list(self):
+        """
+        List of hooks
+        :return: List of hooks
+        """
+        return ['rung']
+    # end hooks_list
+
+    # endregion PROPERTIES
+
+    # region PRIVATE
+
+    # Brackets
+    def _brackets(self):
+        """
+        Number of candidates and starting budget of each bracket
+        :return: List of (number of candidates, starting budget)
+        """
+        eta = self.get_parameter('eta')
+
+        # Maximum number of halvings from the minimum budget
+        s_max = int(math.floor(math.log(1.0 / self.get_parameter('min_budget')) / math.log(eta) + 1e-9))
+
+        # Successive halving, a single bracket
+        if not self.get_parameter('hyperband'):
+            n_candidates = self.get_parameter('n_candidates')
+            return [(n_candidates if n_candidates is not None else eta ** s_max, float(eta) ** -s_max)]
+        # end if
+
+        # Hyperband, from the most aggressive bracket to the full budget
+        return [
+            (int(math.ceil((s_max + 1) / (s + 1) * eta ** s)), float(eta) ** -s)
+            for s in range(s_max, -1, -1)
+        ]
+    # end _brackets
+
+    # Generate random candidates
+    def _generate_candidates(self, param_ranges, n_candidates):
+        """
+        Generate random candidates
+        :param param_ranges: Parameters values
+        :param n_candidates: Number of candidates
+        :return: List of candidates
+        """
+        return [
+            {
+                param_name: param_range[random.randrange(len(param_range))]
+                for param_name, param_range in param_ranges.items()
+            }
+            for _ in range(n_candidates)
+        ]
+    # end _generate_candidates
+
+    # Datasets reduced to a budget
+    def _budget_datasets(self, datasets, budget):
+        """
+        Datasets reduced to a budget
+        :param datasets: Tuple of datasets (or a single dataset)
+        :param budget: Fraction of the datasets
+        :return: Reduced datasets
+        """
+        # Whole datasets
+        if budget >= 1.0:
+            return datasets
+        # end if
+
+        # User function
+        budget_function = self.get_parameter('budget_function')
+        if budget_function is not None:
+            return budget_function(datasets, budget)
+        # end if
+
+        # Each dataset of the tuple
+        if isinstance(datasets, tuple):
+            return tuple(self._budget_dataset(dataset, budget) for dataset in datasets)
+        # end if
+        return self._budget_dataset(datasets, budget)
+    # end _budget_datasets
+
+    # Dataset reduced to a budget
+    def _budget_dataset(self, dataset, budget):
+        """
+        Dataset reduced to a budget
+        :param dataset: Dataset, tensor (batch size x time length x dim, left whole without time dimension)
+        or list of samples
+        :param budget: Fraction of the dataset
+        :return: Reduced dataset
+        """
+        budget_mode = self.get_parameter('budget_mode')
+        if budget_mode == 'samples':
+            n_samples = max(1, int(math.ceil(budget * len(dataset))))
+            if isinstance(dataset, torch.utils.data.Dataset):
+                return torch.utils.data.Subset(dataset, range(n_samples))
+            # end if
+            return dataset[:n_samples]
+        elif budget_mode == 'length':
+            if isinstance(dataset, torch.utils.data.Dataset):
+                return _PrefixDataset(dataset, budget)
+            elif isinstance(dataset, torch.Tensor):
+                if dataset.dim() < 2:
+                    return dataset
+                # end if
+                return dataset[:, :max(1, int(math.ceil(budget * dataset.size(1))))]
+            # end if
+            prefix_dataset = _PrefixDataset(dataset, budget)
+            return [prefix_dataset[sample_i] for sample_i in range(len(dataset))]
+        else:
+            raise Exception("Unknown budget mode : {}".format(budget_mode))
+        # end if
+    # end _budget_dataset
+
+    # Sort key of a fitness value (best first)
+    def _fitness_key(self, fitness_value):
+        """
+        Sort key of a fitness value, the best first and NaN last
+        :param fitness_value: Fitness value
+        :return: Key
+        """
+        if fitness_value != fitness_value:
+            return math.inf
+        elif self.get_parameter('target') == 'min':
+            return fitness_value
+        elif self.get_parameter('target') == 'max':
+            return -fitness_value
+        else:
+            raise Exception("Unknown target value to optimize : {}".format(self.get_parameter('target')))
+        # end if
+    # end _fitness_key
+
+    # Run a bracket of successive halving
+    def _successive_halving(self, test_function, candidates, budget, datasets, **kwargs):
+        """
+        Run a bracket of successive halving
+        :param test_function: Function evaluating a set of parameters
+        :param candidates: Candidates of the first rung
+        :param budget: Starting budget
+        :param datasets: Datasets
+        :return: Best candidate and its fitness value with the whole datasets
+        """
+        eta = self.get_parameter('eta')
+
+        # Until the whole datasets
+        while True:
+            # Evaluate the rung with its budget, keep (position, fitness value) and drop the models
+            evaluations = [
+                (param_i, fitness_value)
+                for param_i, fitness_value, _ in self._evaluate_as_completed(
+                    test_function,
+                    candidates,
+                    self._budget_datasets(datasets, budget),
+                    **kwargs
+                )
+            ]
+
+            # Best first (the first position on ties)
+            evaluations = sorted(evaluations, key=lambda e: (self._fitness_key(e[1]), e[0]))
+            self._call_hook(
+                'rung',
+                [candidates[e[0]] for e in evaluations],
+                [e[1] for e in evaluations],
+                min(budget, 1.0)
+            )
+
+            # Last rung
+            if budget >= 1.0 - 1e-9 or len(evaluations) == 1:
+                return candidates[evaluations[0][0]], evaluations[0][1]
+            # end if
+
+            # Promote the best 1/eta candidates with a larger budget
+            candidates = [candidates[e[0]] for e in evaluations[:max(1, len(evaluations) // eta)]]
+            budget = min(budget * eta, 1.0)
+        # end while
+    # end _successive_halving
+
+    # Optimize hyper-parameters
+    def _optimize_func(self, test_function, param_ranges, datasets, **kwargs):
+        """
+        Optimize function to override
+        :param test_function: The function that maps a list of parameters, training samples, test samples,
+        and their corresponding ground truth to a measured fitness.
+        :param param_ranges: A dictionary with parameter names and ranges
+        :param datasets: A tuple with dataset used to train and test the model as a list of tuples (X, Y) with X,
+        and Y the target to be learned. (training dataset, test dataset) or
+        (training dataset, dev dataset, test dataset)
+        :return: Three objects, the model object, the best parameter values as a dict,
+        the fitness value obtained by the best model.
+        """
+        # Best candidate of each bracket
+        winners = list()
+        for n_candidates, budget in self._brackets():
+            winners.append(
+                self._successive_halving(
+                    test_function,
+                    self._generate_candidates(param_ranges, n_candidates),
+                    budget,
+                    datasets,
+                    **kwargs
+                )
+            )
+        # end for
+
+        # Best of the brackets
+        best_param = min(winners, key=lambda w: self._fitness_key(w[1]))[0]
+
+        # Get the best model
+        model, fitness_value = test_function(best_param, datasets, **kwargs)
+
+        return model, best_param, fitness_value
+    # end _optimize_func
+
+    # endregion PRIVATE
+
+# end SuccessiveHalvingOptimizer
+
+
+# Add
+optimizer_factory.register_optimizer("successive-halving", SuccessiveHalvingOptimizer)
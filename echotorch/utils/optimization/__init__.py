@@ -25,6 +25,9 @@ from .OptimizerFactory import OptimizerFactory, optimizer_factory
 from .GeneticOptimizer import GeneticOptimizer
 from .GridSearchOptimizer import GridSearchOptimizer
 from .RandomOptimizer import RandomOptimizer
+from .ReadoutCache import ReadoutCache
+from .SuccessiveHalvingOptimizer import SuccessiveHalvingOptimizer
 
 # ALL
-__all__ = ['Optimizer', 'OptimizerFactory', 'GeneticOptimizer', 'GridSearchOptimizer', 'RandomOptimizer']
+__all__ = ['Optimizer', 'OptimizerFactory', 'GeneticOptimizer', 'GridSearchOptimizer', 'RandomOptimizer', 'ReadoutCache',
+           'SuccessiveHalvingOptimizer']
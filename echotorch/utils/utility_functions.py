@@ -22,9 +22,11 @@
 # Imports
 import torch
 import numpy as np
-from .error_measures import nrmse, generalized_squared_cosine
+from .error_measures import nrmse, generalized_squared_cosine, generalized_squared_cosine_svd
 from scipy.interpolate import interp1d
 import numpy.linalg as lin
+import scipy.sparse
+import scipy.sparse.linalg
 from scipy import stats
 import scipy.integrate as integrate
 import matplotlib.pyplot as plt
@@ -392,10 +394,12 @@ def compute_similarity_matrix(svd_list):
     # Similarity matrix
     sim_matrix = torch.zeros(n_samples, n_samples)
 
-    # For each combinasion
+    # For each combinasion (upper triangle, the measure is symmetric)
     for i, (Sa, Ua) in enumerate(svd_list):
-        for j, (Sb, Ub) in enumerate(svd_list):
-            sim_matrix[i, j] = generalized_squared_cosine(Sa, Ua, Sb, Ub)
+        for j in range(i, n_samples):
+            Sb, Ub = svd_list[j]
+            sim_matrix[i, j] = generalized_squared_cosine_svd(Sa, Ua, Sb, Ub)
+            sim_matrix[j, i] = sim_matrix[i, j]
         # end for
     # end for
 
@@ -421,24 +425,95 @@ def compute_singular_values(stats):
 # Compute spectral radius of a square 2-D tensor
 def spectral_radius(m):
     """
-    Compute spectral radius of a square 2-D tensor
-    :param m: squared 2D tensor
+    Compute spectral radius of a square 2-D tensor with a full eigendecomposition
+    :param m: squared 2D tensor (dense or sparse)
     :return:
     """
-    return torch.max(torch.abs(torch.eig(m)[0])).item()
+    if m.is_sparse:
+        m = m.to_dense()
+    # end if
+
+    # Eigenvalues as (real, imaginary) pairs (torch.eig is removed in recent versions of PyTorch)
+    if hasattr(torch, 'linalg') and hasattr(torch.linalg, 'eigvals'):
+        eigenvalues = torch.view_as_real(torch.linalg.eigvals(m))
+    else:
+        eigenvalues = torch.eig(m)[0]
+    # end if
+
+    return torch.max(torch.abs(eigenvalues)).item()
 # end spectral_radius
 
 
+# Estimate spectral radius of a square 2-D tensor
+def estimate_spectral_radius(m, tol=1e-6, max_iter=None, n_vectors=60, min_size=256):
+    """
+    Estimate spectral radius of a square 2-D tensor with implicitly restarted Arnoldi iterations (ARPACK),
+    only the (conjugate) eigenvalues with the largest magnitude are computed.
+    :param m: squared 2D tensor (dense or sparse)
+    :param tol: Relative accuracy of the estimated eigenvalue
+    :param max_iter: Maximum number of Arnoldi update iterations (None for ARPACK's default)
+    :param n_vectors: Number of Arnoldi vectors, more vectors helps when the spectrum is crowded near its radius
+    :param min_size: Matrices smaller than this are handled by a full eigendecomposition (cheaper at that size)
+    :return: The spectral radius
+    """
+    # Small matrices, full eigendecomposition
+    if m.size(0) < max(min_size, 3):
+        return spectral_radius(m)
+    # end if
+
+    # To scipy (no densification for sparse matrices)
+    if m.is_sparse:
+        m = m.coalesce()
+        indices = m.indices().cpu().numpy()
+        a = scipy.sparse.csr_matrix(
+            (m.values().cpu().double().numpy(), (indices[0], indices[1])),
+            shape=tuple(m.size())
+        )
+    else:
+        a = m.detach().cpu().double().numpy()
+    # end if
+
+    # Eigenvalue with largest magnitude
+    try:
+        eigenvalues = scipy.sparse.linalg.eigs(
+            a,
+            k=2,
+            ncv=min(m.size(0) - 1, n_vectors),
+            which='LM',
+            tol=tol,
+            maxiter=max_iter,
+            return_eigenvectors=False
+        )
+    except scipy.sparse.linalg.ArpackNoConvergence as e:
+        if len(e.eigenvalues) == 0:
+            return spectral_radius(m)
+        # end if
+        eigenvalues = e.eigenvalues
+    # end try
+
+    return float(np.max(np.abs(eigenvalues)))
+# end estimate_spectral_radius
+
+
 # Compute spectral radius of a square 2-D tensor for stacked-ESN
-def deep_spectral_radius(m, leaky_rate):
+def deep_spectral_radius(m, leaky_rate, tol=1e-6):
     """
     Compute spectral radius of a square 2-D tensor for stacked-ESN
-    :param m: squared 2D tensor
+    :param m: squared 2D tensor (dense or sparse)
     :param leaky_rate: Layer's leaky rate
+    :param tol: Relative accuracy of the estimation
     :return:
     """
-    return spectral_radius((1.0 - leaky_rate) * torch.eye(m.size(0), m.size(0)) + leaky_rate * m)
-# end spectral_radius
+    # Sparse identity to keep sparse matrices sparse
+    if m.is_sparse:
+        diag = torch.arange(m.size(0)).repeat(2, 1)
+        eye = torch.sparse_coo_tensor(diag, torch.ones(m.size(0), dtype=m.dtype), size=tuple(m.size()))
+    else:
+        eye = torch.eye(m.size(0), m.size(0), dtype=m.dtype)
+    # end if
+
+    return estimate_spectral_radius((1.0 - leaky_rate) * eye + leaky_rate * m, tol=tol)
+# end deep_spectral_radius
 
 
 # Normalize a tensor on a single dimension
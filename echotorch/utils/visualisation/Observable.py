@@ -95,6 +95,21 @@ class Observable:
         # end for
     # end observation_point
 
+    # Is a point observed ?
+    def observed(self, point_name):
+        """
+        Is a point observed (at least one handler registered) ?
+        :param point_name: The name of the observation point
+        :return: True or False
+        """
+        for point in self.observation_points:
+            if point.name == point_name and len(point.handlers) > 0:
+                return True
+            # end if
+        # end for
+        return False
+    # end observed
+
     # Add observation point(
     def add_observation_point(self, name, unique):
         """
@@ -68,6 +68,16 @@ class ObservationPoint:
         return self._unique
     # end unique
 
+    # Registered handlers
+    @property
+    def handlers(self):
+        """
+        Registered handlers
+        :return: List of handling functions
+        """
+        return self._handlers
+    # end handlers
+
     ################
     # PUBLIC
     ################
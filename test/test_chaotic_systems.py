@@ -0,0 +1,229 @@
+# -*- coding: utf-8 -*-
+#
+# File : test/test_chaotic_systems.py
+# Description : Test the generators of chaotic timeseries.
+# Date : 18th of October, 2026
+#
+# This file is part of EchoTorch.  EchoTorch is free software: you can
+# redistribute it and/or modify it under the terms of the GNU General Public
+# License as published by the Free Software Foundation, version 2.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, write to the Free Software Foundation, Inc., 51
+# Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# Copyright Nils Schaetti <nils.schaetti@unine.ch>
+
+# Imports
+import os
+import tempfile
+import collections
+import torch
+from echotorch.datasets import LorenzAttractor, RosslerAttractor, HenonAttractor, MackeyGlassDataset, TimeseriesCache
+
+from . import EchoTorchTestCase
+
+
+# Test case : chaotic timeseries generators
+class Test_Chaotic_Systems(EchoTorchTestCase):
+    """
+    Test chaotic timeseries generators
+    """
+
+    # region PRIVATE
+
+    # Scalar RK4 trajectory
+    def rk4_trajectory(self, derivatives, state, dt, washout, length):
+        """
+        Scalar RK4 trajectory
+        :param derivatives: Function of the state returning the list of derivatives
+        :param state: Initial state as a list
+        :param dt: Time step
+        :param washout: Steps ignored
+        :param length: Length of the trajectory
+        :return: Trajectory (length x state dim)
+        """
+        trajectory = list()
+        for t in range(washout + length):
+            k1 = derivatives(state)
+            k2 = derivatives([s + 0.5 * dt * k for s, k in zip(state, k1)])
+            k3 = derivatives([s + 0.5 * dt * k for s, k in zip(state, k2)])
+            k4 = derivatives([s + dt * k for s, k in zip(state, k3)])
+            state = [s + dt / 6.0 * (a + 2.0 * b + 2.0 * c + d) for s, a, b, c, d in zip(state, k1, k2, k3, k4)]
+            if t >= washout:
+                trajectory.append(state)
+            # end if
+        # end for
+        return torch.tensor(trajectory, dtype=torch.float64)
+    # end rk4_trajectory
+
+    # endregion PRIVATE
+
+    # region TESTS
+
+    # Test Lorenz and Rössler trajectories against a scalar RK4
+    def test_rk4_attractors(self):
+        """
+        Test Lorenz and Rössler trajectories against a scalar RK4
+        """
+        # Initial states
+        initial_states = [[1.0, 1.0, 1.0], [-2.0, 0.5, 3.0], [0.1, -0.1, 0.2]]
+
+        # Lorenz and Rössler systems
+        systems = [
+            (LorenzAttractor, dict(sigma=10.0, b=8.0 / 3.0, r=28.0),
+             lambda s: [10.0 * (s[1] - s[0]), 28.0 * s[0] - s[1] - s[0] * s[2], s[0] * s[1] - 8.0 / 3.0 * s[2]]),
+            (RosslerAttractor, dict(a=0.2, b=0.2, c=5.7),
+             lambda s: [-(s[1] + s[2]), s[0] + 0.2 * s[1], 0.2 + s[0] * s[2] - 5.7 * s[2]])
+        ]
+
+        # For each system
+        for dataset_class, parameters, derivatives in systems:
+            # Independent trajectories stepped together
+            dataset = dataset_class(40, 3, initial_states, dt=0.01, washout=5, dtype=torch.float64, **parameters)
+            self.assertEqual(len(dataset), 3)
+            for sample_i, initial_state in enumerate(initial_states):
+                self.assertTensorAlmostEqual(
+                    dataset[sample_i],
+                    self.rk4_trajectory(derivatives, initial_state, 0.01, 5, 40),
+                    0.000001
+                )
+            # end for
+
+            # Consecutive segments of one trajectory
+            dataset = dataset_class(20, 2, initial_states[0], dt=0.01, washout=5, dtype=torch.float64, **parameters)
+            self.assertTensorAlmostEqual(
+                torch.cat((dataset[0], dataset[1]), dim=0),
+                self.rk4_trajectory(derivatives, initial_states[0], 0.01, 5, 40),
+                0.000001
+            )
+
+            # Regenerate continues the trajectory after a new washout
+            dataset.regenerate()
+            self.assertTensorAlmostEqual(
+                dataset[1],
+                self.rk4_trajectory(derivatives, initial_states[0], 0.01, 70, 20),
+                0.000001
+            )
+        # end for
+    # end test_rk4_attractors
+
+    # Test Hénon map and normalization
+    def test_henon(self):
+        """
+        Test Hénon map and normalization
+        """
+        # Initial states
+        initial_states = [[0.0, 0.0], [0.1, 0.2], [-0.1, 0.1]]
+
+        # Independent trajectories, shuffled
+        dataset = HenonAttractor(30, 3, initial_states, a=1.4, b=0.3, washout=2, dtype=torch.float64)
+        samples = sorted([dataset[i] for i in range(3)], key=lambda s: s[-1, 0].item())
+
+        # Scalar iterations
+        expected = list()
+        for x, y in initial_states:
+            trajectory = list()
+            for t in range(32):
+                x, y = HenonAttractor.henon(1.4, 0.3, x, y)
+                trajectory.append([x, y])
+            # end for
+            expected.append(torch.tensor(trajectory[2:], dtype=torch.float64))
+        # end for
+        expected = sorted(expected, key=lambda s: s[-1, 0].item())
+        for sample, expected_sample in zip(samples, expected):
+            self.assertTensorAlmostEqual(sample, expected_sample, 0.000001)
+        # end for
+
+        # Static generation and normalization
+        samples = HenonAttractor.generate(4, 25, [0.0, 0.0], a=1.4, b=0.3, washout=0, normalize=True)
+        self.assertEqual(len(samples), 4)
+        for sample in samples:
+            self.assertTensorSize(sample, [25, 2])
+            self.assertAlmostEqual(torch.min(sample).item(), 0.0, places=6)
+            self.assertAlmostEqual(torch.max(sample).item(), 1.0, places=6)
+        # end for
+    # end test_henon
+
+    # Test Mackey-Glass series against the sub-step recurrence
+    def test_mackey_glass(self):
+        """
+        Test Mackey-Glass series against the sub-step recurrence
+        """
+        # Random histories
+        history = 1.2 + 0.2 * (torch.rand(2, 170, dtype=torch.float64) - 0.5)
+        series = MackeyGlassDataset.generate_series(60, history, 10)
+        self.assertTensorSize(series, [2, 60])
+
+        # Recurrence with a deque for each history
+        for sample_i in range(2):
+            sample_history = collections.deque(history[sample_i].tolist())
+            x = 1.2
+            expected = list()
+            for t in range(60):
+                for _ in range(10):
+                    xtau = sample_history.popleft()
+                    sample_history.append(x)
+                    x = x + (0.2 * xtau / (1.0 + xtau ** 10) - 0.1 * x) / 10
+                # end for
+                expected.append(x)
+            # end for
+            self.assertTensorAlmostEqual(series[sample_i], torch.tensor(expected, dtype=torch.float64), 0.000001)
+        # end for
+
+        # Dataset generated once
+        dataset = MackeyGlassDataset(50, 3, tau=17)
+        inputs, targets = dataset[1]
+        self.assertTensorSize(inputs, [49, 1])
+        self.assertTrue(torch.equal(dataset[1][0], inputs))
+        self.assertTrue(torch.equal(inputs[1:], targets[:-1]))
+    # end test_mackey_glass
+
+    # Test on-disk cache
+    def test_cache(self):
+        """
+        Test on-disk cache
+        """
+        with tempfile.TemporaryDirectory() as cache_dir:
+            # Generated, then loaded from the cache
+            datasets = [
+                LorenzAttractor(30, 2, [[1.0, 1.0, 1.0], [2.0, 1.0, 0.0]], sigma=10.0, b=8.0 / 3.0, r=28.0,
+                                seed=1, cache=cache_dir)
+                for _ in range(2)
+            ]
+            self.assertEqual(len(os.listdir(cache_dir)), 1)
+            self.assertTrue(torch.equal(datasets[0].data, datasets[1].data))
+            self.assertTrue(torch.equal(
+                datasets[0].data,
+                LorenzAttractor(30, 2, [[1.0, 1.0, 1.0], [2.0, 1.0, 0.0]], sigma=10.0, b=8.0 / 3.0, r=28.0).data
+            ))
+
+            # Other parameters, other file
+            LorenzAttractor(30, 2, [[1.0, 1.0, 1.0], [2.0, 1.0, 0.0]], sigma=10.0, b=8.0 / 3.0, r=20.0, seed=1,
+                            cache=cache_dir)
+            self.assertEqual(len(os.listdir(cache_dir)), 2)
+
+            # Random histories cached with a seed
+            cache = TimeseriesCache(cache_dir)
+            first = MackeyGlassDataset(40, 2, seed=5, cache=cache)
+            torch.manual_seed(100)
+            second = MackeyGlassDataset(40, 2, seed=5, cache=cache)
+            self.assertEqual(len(os.listdir(cache_dir)), 3)
+            self.assertTrue(torch.equal(first.outputs, second.outputs))
+
+            # Shuffled samples only cached with a seed
+            HenonAttractor(20, 3, [[0.0, 0.0], [0.1, 0.2], [-0.1, 0.1]], a=1.4, b=0.3, cache=cache)
+            self.assertEqual(len(os.listdir(cache_dir)), 3)
+            HenonAttractor(20, 3, [[0.0, 0.0], [0.1, 0.2], [-0.1, 0.1]], a=1.4, b=0.3, seed=2, cache=cache)
+            self.assertEqual(len(os.listdir(cache_dir)), 4)
+        # end with
+    # end test_cache
+
+    # endregion TESTS
+
+# end Test_Chaotic_Systems
@@ -0,0 +1,568 @@
+# -*- coding: utf-8 -*-
+#
+# File : test/test_conceptor_operations.py
+# Description : Test conceptor operations against their matrix definitions.
+# Date : 18th of October, 2026
+#
+# This file is part of EchoTorch.  EchoTorch is free software: you can
+# redistribute it and/or modify it under the terms of the GNU General Public
+# License as published by the Free Software Foundation, version 2.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, write to the Free Software Foundation, Inc., 51
+# Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# Copyright Nils Schaetti <nils.schaetti@unine.ch>
+
+# Imports
+import torch
+import echotorch.utils
+from echotorch.nn.conceptors import Conceptor, ConceptorSet, ConceptorNet, LowRankConceptor, SPESNCell
+from echotorch.nn.reservoir import ESNCell
+
+from . import EchoTorchTestCase
+
+
+# Test case : conceptor operations
+class Test_Conceptor_Operations(EchoTorchTestCase):
+    """
+    Test conceptor operations
+    """
+
+    # region PRIVATE
+
+    # Random correlation matrix
+    def correlation_matrix(self, dim=10, length=50):
+        """
+        Random correlation matrix
+        :param dim: Dimension
+        :param length: Number of states
+        :return: Correlation matrix
+        """
+        X = torch.randn(length, dim, dtype=torch.float64)
+        return torch.mm(X.t(), X) / length
+    # end correlation_matrix
+
+    # Create a conceptor
+    def create_conceptor(self, aperture=10.0, dim=10):
+        """
+        Create a conceptor from a random correlation matrix
+        :param aperture: Aperture
+        :param dim: Dimension
+        :return: The conceptor
+        """
+        conceptor = Conceptor(input_dim=dim, aperture=aperture, dtype=torch.float64)
+        conceptor.set_R(self.correlation_matrix(dim))
+        return conceptor
+    # end create_conceptor
+
+    # endregion PRIVATE
+
+    # region TESTS
+
+    # Test cached decompositions against the matrix definitions
+    def test_cached_decomposition(self):
+        """
+        Test cached decompositions against the matrix definitions
+        """
+        # Set seeds
+        echotorch.utils.manual_seed(1)
+
+        # Conceptor
+        A = self.create_conceptor(aperture=10.0)
+        self.assertTensorAlmostEqual(A.C, Conceptor.computeC(A.R, 10.0), 0.0001)
+        self.assertTensorAlmostEqual(A.SV, torch.svd(A.C)[1], 0.0001)
+
+        # Aperture adaptation with the eigenvalues of C
+        R = A.R.clone()
+        A.PHI(2.0)
+        self.assertAlmostEqual(A.aperture, 20.0)
+        self.assertTensorAlmostEqual(A.C, Conceptor.computeC(R, 20.0), 0.0001)
+        self.assertTensorAlmostEqual(A.R, R, 0.0001)
+
+        # Aperture changed with the eigenvalues of R
+        A.aperture = 5.0
+        self.assertTensorAlmostEqual(A.C, Conceptor.computeC(R, 5.0), 0.0001)
+
+        # Cache invalidated when R changes
+        R2 = self.correlation_matrix()
+        A.set_R(R2)
+        self.assertTensorAlmostEqual(A.C, Conceptor.computeC(R2, 5.0), 0.0001)
+        self.assertTensorAlmostEqual(A.SV, torch.svd(A.C)[1], 0.0001)
+
+        # Cache invalidated when C is assigned
+        A.C = torch.eye(10, dtype=torch.float64) * 0.5
+        self.assertTensorAlmostEqual(A.SV, torch.ones(10, dtype=torch.float64) * 0.5, 0.0001)
+
+        # Generalized squared cosine with the decompositions
+        B = self.create_conceptor(aperture=10.0)
+        A.set_R(self.correlation_matrix())
+        sqrt_A, sqrt_B = torch.svd(A.C)[1].sqrt(), torch.svd(B.C)[1].sqrt()
+        expected = torch.norm(
+            torch.mm(torch.mm(torch.diag(sqrt_A), torch.mm(torch.svd(A.C)[0].t(), torch.svd(B.C)[0])),
+                     torch.diag(sqrt_B))
+        ) ** 2 / (torch.norm(sqrt_A ** 2) * torch.norm(sqrt_B ** 2))
+        self.assertAlmostEqual(float(Conceptor.similarity(A, B)), float(expected), 4)
+        self.assertAlmostEqual(float(Conceptor.similarity(A, A)), 1.0, 4)
+
+        # Cache invalidated when the buffers are loaded from a state dict
+        A.quota
+        A.load_state_dict(B.state_dict())
+        self.assertAlmostEqual(A.quota, B.quota, 4)
+        A.PHI(2.0)
+        B.PHI(2.0)
+        self.assertTensorAlmostEqual(A.C, B.C, 0.0001)
+
+        # Decompositions returned as copies of the cached ones
+        S, U = A.eigen()
+        S.zero_()
+        U.zero_()
+        self.assertTensorAlmostEqual(A.eigen()[0], torch.svd(A.C)[1], 0.0001)
+        self.assertTensorAlmostEqual(A.copy().eigen()[0], torch.svd(A.C)[1], 0.0001)
+
+        # Cache invalidated when the buffers are converted
+        A.eigen()
+        A.float()
+        self.assertEqual(A.eigen()[0].dtype, torch.float32)
+        self.assertEqual(A.SVD[1].dtype, torch.float32)
+    # end test_cached_decomposition
+
+    # Test batched evidences against the evidences of each conceptor
+    def test_evidences(self):
+        """
+        Test batched evidences against the evidences of each conceptor
+        """
+        # Set seeds
+        echotorch.utils.manual_seed(1)
+
+        # Set of three conceptors
+        conceptor_set = ConceptorSet(input_dim=10, dtype=torch.float64)
+        for k in range(3):
+            conceptor_set.add(k, self.create_conceptor(aperture=5.0))
+        # end for
+
+        # States (batch x time x dim)
+        x = torch.randn(2, 15, 10, dtype=torch.float64)
+
+        # NOT(OR of others) for each conceptor
+        negative_conceptors = list()
+        for k in range(3):
+            others = [conceptor_set[j] for j in range(3) if j != k]
+            negative_conceptors.append(Conceptor.operator_OR(others[0], others[1]).NOT())
+        # end for
+
+        # Expected evidences, time step by time step
+        positive = torch.zeros(2, 15, 3, dtype=torch.float64)
+        negative = torch.zeros(2, 15, 3, dtype=torch.float64)
+        for b in range(2):
+            for t in range(15):
+                for k in range(3):
+                    xt = x[b, t]
+                    positive[b, t, k] = torch.dot(torch.mv(conceptor_set[k].C, xt), xt) / torch.dot(xt, xt)
+                    negative[b, t, k] = torch.dot(torch.mv(negative_conceptors[k].C, xt), xt) / torch.dot(xt, xt)
+                # end for
+            # end for
+        # end for
+
+        # Batched evidences
+        self.assertTensorAlmostEqual(conceptor_set.evidences(x, based_on='positive'), positive, 0.0001)
+        self.assertTensorAlmostEqual(conceptor_set.evidences(x, based_on='negative'), negative, 0.0001)
+        self.assertTensorAlmostEqual(conceptor_set.evidences(x), (positive + negative) / 2.0, 0.0001)
+        self.assertTensorAlmostEqual(conceptor_set.evidences(x[0], average=True), torch.mean(
+            (positive[0] + negative[0]) / 2.0, dim=0), 0.0001)
+        self.assertTensorAlmostEqual(conceptor_set.Eneg(1, x[1]), negative[1, :, 1], 0.0001)
+        self.assertTensorAlmostEqual(Conceptor.evidence(conceptor_set[2], x), positive[:, :, 2], 0.0001)
+
+        # Cached matrices computed again when a conceptor changes
+        conceptor_set[0].aperture = 20.0
+        self.assertTensorAlmostEqual(conceptor_set.evidence_matrices()[0][0], conceptor_set[0].C, 0.0001)
+    # end test_evidences
+
+    # Test similarity and intersection matrices against pair by pair computation
+    def test_similarity_matrices(self):
+        """
+        Test similarity and intersection matrices against pair by pair computation
+        """
+        # Set seeds
+        echotorch.utils.manual_seed(1)
+
+        # Set of four conceptors
+        conceptor_set = ConceptorSet(input_dim=10, dtype=torch.float64)
+        for k in range(4):
+            conceptor_set.add(k, self.create_conceptor(aperture=5.0))
+        # end for
+
+        # Pair by pair similarities with the SVDs
+        for based_on in ['C', 'R']:
+            expected = torch.zeros(4, 4)
+            for i in range(4):
+                for j in range(4):
+                    m1 = conceptor_set[i].C if based_on == 'C' else conceptor_set[i].R
+                    m2 = conceptor_set[j].C if based_on == 'C' else conceptor_set[j].R
+                    expected[i, j] = echotorch.utils.generalized_squared_cosine(m1, m2)
+                # end for
+            # end for
+
+            # Bulk similarities
+            self.assertTensorAlmostEqual(conceptor_set.similarity_matrix(based_on=based_on), expected, 0.0001)
+            self.assertTensorAlmostEqual(conceptor_set.sim(conceptor_set[2], based_on=based_on), expected[:, 2],
+                                         0.0001)
+        # end for
+
+        # Pair by pair intersections
+        expected = torch.zeros(4, 4)
+        for i in range(4):
+            for j in range(4):
+                expected[i, j] = Conceptor.operator_AND(conceptor_set[i], conceptor_set[j]).quota
+            # end for
+        # end for
+
+        # Upper triangle, with and without threads
+        for num_workers in [1, 3]:
+            self.assertTensorAlmostEqual(conceptor_set.intersection_matrix(num_workers=num_workers), expected, 0.0001)
+        # end for
+    # end test_similarity_matrices
+
+    # Test chunked correlation matrix accumulation
+    def test_chunked_accumulation(self):
+        """
+        Test chunked correlation matrix accumulation
+        """
+        # Set seeds
+        echotorch.utils.manual_seed(1)
+
+        # States (batch x time x dim)
+        X = torch.randn(3, 60, 10, dtype=torch.float64)
+
+        # Learned on whole sequences
+        A = Conceptor(input_dim=10, aperture=5.0, dtype=torch.float64)
+        A(X)
+        A.finalize()
+
+        # Expected correlation matrix
+        expected = sum([torch.mm(X[b].t(), X[b]) / 60.0 for b in range(3)]) / 3.0
+        self.assertTensorAlmostEqual(A.R, expected, 0.0001)
+
+        # Learned chunk by chunk with float32 states accumulated in float64
+        B = Conceptor(input_dim=10, aperture=5.0, accumulation_dtype=torch.float64)
+        for start in range(0, 60, 25):
+            B.accumulate(X[:, start:start+25].float(), time_length=60, n_samples=3 if start == 0 else 0)
+        # end for
+        B.finalize()
+        self.assertEqual(B.R.dtype, torch.float32)
+        self.assertTensorAlmostEqual(B.R, A.R, 0.0001)
+        self.assertTensorAlmostEqual(B.C, A.C, 0.0001)
+
+        # Learned as a post-states-update handler of a reservoir cell
+        cell = ESNCell(
+            input_dim=2,
+            output_dim=10,
+            w=torch.randn(10, 10, dtype=torch.float64) * 0.1,
+            w_in=torch.randn(10, 2, dtype=torch.float64),
+            w_bias=torch.zeros(10, dtype=torch.float64),
+            washout=5,
+            dtype=torch.float64
+        )
+        C = Conceptor(input_dim=10, aperture=5.0, dtype=torch.float64)
+        cell.connect("post-states-update", C.accumulate_handler)
+        states = cell(torch.randn(2, 30, 2, dtype=torch.float64))
+        C.finalize()
+        expected = sum([torch.mm(states[b].t(), states[b]) / 25.0 for b in range(2)]) / 2.0
+        self.assertTensorAlmostEqual(C.R, expected, 0.0001)
+    # end test_chunked_accumulation
+
+    # Test Boolean operations against their matrix definitions
+    def test_boolean_algebra(self):
+        """
+        Test Boolean operations against their matrix definitions
+        """
+        # Set seeds
+        echotorch.utils.manual_seed(1)
+
+        # Identity
+        I = torch.eye(10, dtype=torch.float64)
+
+        # Three full rank conceptors
+        A, B, C = [self.create_conceptor(aperture=3.0) for _ in range(3)]
+
+        # NOT, AND, OR
+        self.assertTensorAlmostEqual(A.NOT().C, I - A.C, 0.0001)
+        self.assertTensorAlmostEqual(A.NOT().R, Conceptor.computeR(I - A.C, 1.0 / 3.0), 0.0001)
+        AandB = torch.inverse(torch.inverse(A.C) + torch.inverse(B.C) - I)
+        self.assertTensorAlmostEqual(A.AND(B).C, AandB, 0.0001)
+        AorB = I - torch.inverse(torch.inverse(I - A.C) + torch.inverse(I - B.C) - I)
+        self.assertTensorAlmostEqual(A.OR(B).C, AorB, 0.0001)
+
+        # Multi-operand OR and AND against pairwise folding
+        self.assertTensorAlmostEqual(Conceptor.OR_all([A, B, C]).C, A.OR(B).OR(C).C, 0.0001)
+        self.assertTensorAlmostEqual(Conceptor.AND_all([A, B, C]).C, A.AND(B).AND(C).C, 0.0001)
+        self.assertEqual(Conceptor.OR_all([A, B, C]).aperture, 3.0)
+        self.assertTensorAlmostEqual(Conceptor.OR_all([A, B, C]).R, A.OR(B).OR(C).R, 0.0001)
+
+        # Rank deficient conceptor (null space projector approach)
+        D = Conceptor(input_dim=10, aperture=3.0, dtype=torch.float64)
+        D.set_R(self.correlation_matrix(length=5))
+        self.assertTensorAlmostEqual(Conceptor.AND_all([A, D]).C, A.AND(D).C, 0.0001)
+        self.assertTensorAlmostEqual(Conceptor.OR_all([D, A]).C, D.OR(A).C, 0.0001)
+
+        # OR of a set of conceptors
+        conceptor_set = ConceptorSet(input_dim=10, dtype=torch.float64)
+        for k, c in enumerate([A, B, C]):
+            conceptor_set.add(k, c)
+        # end for
+        self.assertTensorAlmostEqual(conceptor_set.A().C, A.OR(B).OR(C).C, 0.0001)
+    # end test_boolean_algebra
+
+    # Test incremental memory conceptor
+    def test_incremental_memory(self):
+        """
+        Test incremental memory conceptor
+        """
+        # Set seeds
+        echotorch.utils.manual_seed(1)
+
+        # Conceptors
+        conceptors = [self.create_conceptor(aperture=3.0) for _ in range(4)]
+
+        # Memory of an empty set
+        conceptor_set = ConceptorSet(input_dim=10, dtype=torch.float64)
+        self.assertTrue(conceptor_set.A().is_null())
+        self.assertTensorAlmostEqual(conceptor_set.F(), torch.eye(10, dtype=torch.float64), 0.0001)
+
+        # Add conceptors one by one
+        for k, c in enumerate(conceptors):
+            conceptor_set.add(k, c)
+            expected = Conceptor.OR_all(conceptors[:k+1])
+            self.assertTensorAlmostEqual(conceptor_set.A().C, expected.C, 0.0001)
+            self.assertTensorAlmostEqual(conceptor_set.F(), torch.eye(10, dtype=torch.float64) - expected.C, 0.0001)
+            self.assertAlmostEqual(conceptor_set.quota(), expected.quota, 4)
+        # end for
+
+        # Delete a conceptor
+        conceptor_set.delete(1)
+        expected = Conceptor.OR_all([conceptors[0], conceptors[2], conceptors[3]])
+        self.assertTensorAlmostEqual(conceptor_set.A().C, expected.C, 0.0001)
+
+        # Modify a conceptor
+        conceptors[2].aperture = 10.0
+        expected = Conceptor.OR_all([conceptors[0], conceptors[2], conceptors[3]])
+        self.assertTensorAlmostEqual(conceptor_set.A().C, expected.C, 0.0001)
+        self.assertTensorAlmostEqual(conceptor_set.N().C, expected.NOT().C, 0.0001)
+    # end test_incremental_memory
+
+    # Test morphing with stacked conceptor matrices
+    def test_morphing(self):
+        """
+        Test morphing with stacked conceptor matrices
+        """
+        # Set seeds
+        echotorch.utils.manual_seed(1)
+
+        # Set of three conceptors
+        conceptor_set = ConceptorSet(input_dim=10, dtype=torch.float64)
+        for k in range(3):
+            conceptor_set.add(k, self.create_conceptor(aperture=5.0))
+        # end for
+
+        # Morphed filter against the morphed conceptor matrix
+        conceptor_set.train(False)
+        x = torch.randn(4, 10, dtype=torch.float64)
+        w = torch.rand(4, 3, dtype=torch.float64)
+        expected = torch.stack([torch.mv(conceptor_set.morphed_C(w[b]), x[b]) for b in range(4)])
+        self.assertTensorAlmostEqual(conceptor_set.morphed_filter(x, w), expected, 0.0001)
+        self.assertTensorAlmostEqual(conceptor_set(x[0], morphing_vector=w[0]), expected[0], 0.0001)
+
+        # Conceptor network
+        conceptor_net = ConceptorNet(
+            conceptor=conceptor_set,
+            input_dim=1,
+            hidden_dim=10,
+            output_dim=1,
+            w_generator=torch.randn(10, 10, dtype=torch.float64) * 0.2,
+            win_generator=torch.randn(10, 1, dtype=torch.float64),
+            wbias_generator=torch.randn(10, dtype=torch.float64),
+            dtype=torch.float64
+        )
+        conceptor_net.output.w_out = torch.randn(1, 11, dtype=torch.float64)
+        conceptor_net.train(False)
+        conceptor_net.conceptor_active(True)
+
+        # Morphing schedule (batch x time x conceptors)
+        u = torch.randn(4, 20, 1, dtype=torch.float64)
+        schedule = torch.rand(4, 20, 3, dtype=torch.float64)
+
+        # Sample by sample and whole batch filtering
+        sequential_outputs = conceptor_net(u.clone(), morphing_vectors=schedule)
+        conceptor_net.cell.batched = True
+        batched_outputs = conceptor_net(u.clone(), morphing_vectors=schedule)
+        self.assertTensorAlmostEqual(batched_outputs, sequential_outputs, 0.0001)
+    # end test_morphing
+
+    # Test low-rank conceptors against dense ones
+    def test_low_rank(self):
+        """
+        Test low-rank conceptors against dense ones
+        """
+        # Set seeds
+        echotorch.utils.manual_seed(1)
+
+        # Dense and low-rank conceptors learned from states of rank 3 and 4
+        dense, low_rank = list(), list()
+        for rank in [3, 4]:
+            W = torch.randn(rank, 20, dtype=torch.float64)
+            X = torch.matmul(torch.randn(2, 50, rank, dtype=torch.float64), W)
+            for conceptors, conceptor_class in [(dense, Conceptor), (low_rank, LowRankConceptor)]:
+                conceptor = conceptor_class(input_dim=20, aperture=5.0, dtype=torch.float64)
+                conceptor(X)
+                conceptor.finalize()
+                conceptors.append(conceptor)
+            # end for
+            self.assertEqual(low_rank[-1].rank, rank)
+            self.assertTensorAlmostEqual(low_rank[-1].C, dense[-1].C, 0.0001)
+            self.assertTensorAlmostEqual(low_rank[-1].R, dense[-1].R, 0.0001)
+        # end for
+
+        # Evidences and filtering
+        x = torch.randn(2, 10, 20, dtype=torch.float64)
+        self.assertTensorAlmostEqual(low_rank[0].E(x), dense[0].E(x), 0.0001)
+        self.assertTensorAlmostEqual(low_rank[0].filter_transform(x[0]), dense[0].filter_transform(x[0]), 0.0001)
+        self.assertTensorAlmostEqual(low_rank[0].filter_transform(x[0, 0]), dense[0].filter_transform(x[0, 0]), 0.0001)
+
+        # Boolean operators, the AND of a conceptor with itself stays in its subspace
+        self.assertTensorAlmostEqual(low_rank[0].OR(low_rank[1]).C, dense[0].OR(dense[1]).C, 0.0001)
+        self.assertEqual(low_rank[0].AND(low_rank[1]).rank, 0)
+        S, U = low_rank[0].eigen()
+        self.assertTensorAlmostEqual(low_rank[0].AND(low_rank[0]).C, torch.mm(U / (2.0 / S - 1.0), U.t()), 0.0001)
+        self.assertTensorAlmostEqual(low_rank[0].NOT().C, dense[0].NOT().C, 0.0001)
+
+        # PHI and aperture
+        low_rank[0].PHI(2.0)
+        dense[0].PHI(2.0)
+        self.assertTensorAlmostEqual(low_rank[0].C, dense[0].C, 0.0001)
+        low_rank[1].aperture = 20.0
+        dense[1].aperture = 20.0
+        self.assertTensorAlmostEqual(low_rank[1].C, dense[1].C, 0.0001)
+
+        # Rank selection
+        self.assertEqual(LowRankConceptor.from_conceptor(dense[1], rank=2).rank, 2)
+        self.assertEqual(LowRankConceptor.select_rank(torch.tensor([4.0, 3.0, 2.0, 1.0]), energy=0.75), 3)
+
+        # Save and load into a new conceptor
+        loaded = LowRankConceptor(input_dim=20, aperture=5.0, dtype=torch.float64)
+        loaded.load_state_dict(low_rank[0].state_dict())
+        self.assertEqual(loaded.rank, low_rank[0].rank)
+        self.assertTensorAlmostEqual(loaded.C, low_rank[0].C, 0.0001)
+        self.assertTensorAlmostEqual(loaded.E(x), low_rank[0].E(x), 0.0001)
+
+        # Factors returned as copies
+        loaded.eigen()[1].zero_()
+        self.assertTensorAlmostEqual(loaded.C, low_rank[0].C, 0.0001)
+    # end test_low_rank
+
+    # Test aperture curves against conceptors computed for each aperture
+    def test_aperture_search(self):
+        """
+        Test aperture curves against conceptors computed for each aperture
+        """
+        # Set seeds
+        echotorch.utils.manual_seed(1)
+
+        # Conceptor and candidate apertures
+        A = self.create_conceptor(aperture=2.0)
+        apertures = [0.5, 1.0, 4.0, 30.0]
+
+        # Norm and quota curves
+        norms = A.aperture_curve(apertures, measure='norm')
+        quotas = A.aperture_curve(apertures, measure='quota')
+        for i, aperture in enumerate(apertures):
+            B = Conceptor(input_dim=10, aperture=aperture, dtype=torch.float64)
+            B.set_R(A.R)
+            self.assertAlmostEqual(norms[i].item(), torch.sum(B.C * B.C).item(), 4)
+            self.assertAlmostEqual(quotas[i].item(), B.quota, 4)
+        # end for
+
+        # Delta measure against its finite difference
+        self.assertAlmostEqual(A.aperture_curve([2.0])[0].item(), A.delta(1.0, epsilon=0.001)[0], 4)
+
+        # Best apertures of a set
+        conceptor_set = ConceptorSet(input_dim=10, dtype=torch.float64)
+        conceptor_set.add(0, A)
+        conceptor_set.add(1, self.create_conceptor(aperture=5.0))
+        best_apertures = conceptor_set.optimal_apertures(apply=True)
+        for k, c in conceptor_set.conceptors.items():
+            self.assertEqual(c.aperture, best_apertures[k])
+            curve = c.aperture_curve([best_apertures[k] * 0.9, best_apertures[k], best_apertures[k] * 1.1])
+            self.assertEqual(int(torch.argmax(curve)), 1)
+        # end for
+
+        # Aperture for a target quota
+        aperture, quota = A.optimal_aperture(measure='quota', target=0.5)
+        self.assertAlmostEqual(quota, 0.5, 1)
+    # end test_aperture_search
+
+    # Test conceptor-controlled runs against conceptor filtering at each step
+    def test_controlled_run(self):
+        """
+        Test conceptor-controlled runs against conceptor filtering at each step
+        """
+        # Set seeds
+        echotorch.utils.manual_seed(1)
+
+        # Conceptors, the last one in low-rank form
+        conceptor_set = ConceptorSet(input_dim=10, dtype=torch.float64)
+        for k in range(3):
+            conceptor_set.add(k, self.create_conceptor(aperture=5.0))
+        # end for
+        conceptor_set.add(3, LowRankConceptor.from_conceptor(conceptor_set.conceptors[2], rank=6))
+        conceptor_set.train(False)
+
+        # Inputs, conceptor of each sample and of each time step
+        u = torch.randn(4, 20, 1, dtype=torch.float64)
+        indices = [2, 0, 3, 2]
+        schedule = torch.randint(0, 4, (4, 20))
+
+        # For each loading method
+        for loading_method in [SPESNCell.W_LOADING, SPESNCell.INPUTS_SIMULATION]:
+            # Conceptor network
+            conceptor_net = ConceptorNet(
+                conceptor=conceptor_set,
+                input_dim=1,
+                hidden_dim=10,
+                output_dim=1,
+                w_generator=torch.randn(10, 10, dtype=torch.float64) * 0.2,
+                win_generator=torch.randn(10, 1, dtype=torch.float64),
+                wbias_generator=torch.randn(10, dtype=torch.float64),
+                washout=5,
+                loading_method=loading_method,
+                dtype=torch.float64
+            )
+            conceptor_net.cell.D = torch.randn(10, 10, dtype=torch.float64) * 0.1
+            conceptor_net.output.w_out = torch.randn(1, 11, dtype=torch.float64)
+            conceptor_net.train(False)
+            conceptor_net.conceptor_active(True)
+
+            # One conceptor per sample, against the current conceptor of the set
+            expected = list()
+            for b, k in enumerate(indices):
+                conceptor_set.set(k)
+                expected.append(conceptor_net(u[b:b + 1].clone()))
+            # end for
+            outputs = conceptor_net(u.clone(), conceptor_indices=indices)
+            self.assertTensorAlmostEqual(outputs, torch.cat(expected, dim=0), 0.0001)
+
+            # Conceptor switches, against one-hot morphing vectors
+            morphing_vectors = torch.nn.functional.one_hot(schedule, 4).to(torch.float64)
+            expected = conceptor_net(u.clone(), morphing_vectors=morphing_vectors)
+            outputs = conceptor_net(u.clone(), conceptor_indices=schedule)
+            self.assertTensorAlmostEqual(outputs, expected, 0.0001)
+        # end for
+    # end test_controlled_run
+
+    # endregion TESTS
+
+# end Test_Conceptor_Operations
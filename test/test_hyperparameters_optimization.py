@@ -25,6 +25,7 @@ from echotorch.datasets.NARMADataset import NARMADataset
 import echotorch.utils.optimization as optim
 import torch
 import random
+import weakref
 from torch.autograd import Variable
 from torch.utils.data.dataloader import DataLoader
 import echotorch.nn.reservoir as etrs
@@ -33,6 +34,75 @@ import numpy as np
 from . import EchoTorchTestCase
 
 
+# Noisy quadratic fitness (module level to be picklable)
+def noisy_quadratic_fitness(parameters, datasets, noise=0.1):
+    """
+    Noisy quadratic fitness
+    :param parameters: Dictionary with parameters values
+    :param datasets: Target tensor of the parameters x and y
+    :param noise: Noise amplitude
+    :return: A tuple (model, fitness value)
+    """
+    position = torch.tensor([parameters['x'], parameters['y']], dtype=torch.float64)
+    return None, torch.sum((position - datasets) ** 2).item() + noise * torch.rand(1).item()
+# end noisy_quadratic_fitness
+
+
+# Li-ESN trained on a dataset of tensors (module level to be picklable)
+def build_liesn(parameters, datasets, with_bias=True):
+    """
+    Create a Li-ESN, accumulate the training states and compute the test states
+    :param parameters: Dictionary with the reservoir parameters
+    :param datasets: Tuple (train inputs, train targets, test inputs, test targets)
+    :param with_bias: Accumulate a bias in the readout
+    :return: The Li-ESN before finalize() and the test states
+    """
+    train_u, train_y, test_u, _ = datasets
+
+    # Fixed matrices for each configuration
+    generator = torch.Generator().manual_seed(1)
+    w = torch.randn(20, 20, generator=generator, dtype=torch.float64) * parameters['spectral_radius'] / 4.0
+    w_in = torch.randn(20, 1, generator=generator, dtype=torch.float64)
+    w_bias = torch.randn(20, generator=generator, dtype=torch.float64) * 0.1
+
+    # Li-ESN
+    esn = etrs.LiESN(
+        input_dim=1,
+        hidden_dim=20,
+        output_dim=1,
+        leaky_rate=parameters['leaky_rate'],
+        w_generator=w,
+        win_generator=w_in,
+        wbias_generator=w_bias,
+        with_bias=with_bias,
+        washout=10,
+        dtype=torch.float64
+    )
+
+    # Accumulate xTx and xTy, then test states
+    esn(train_u, train_y)
+    return esn, esn.cell(test_u)
+# end build_liesn
+
+
+# Finalize the readout of a Li-ESN and compute the test NRMSE
+def liesn_readout(cached, parameters, datasets, with_bias=True):
+    """
+    Finalize the readout of a Li-ESN and compute the test NRMSE
+    :param cached: Li-ESN and test states
+    :param parameters: Dictionary with the readout parameters
+    :param datasets: Tuple (train inputs, train targets, test inputs, test targets)
+    :param with_bias: Accumulate a bias in the readout
+    :return: A tuple (model, fitness value)
+    """
+    esn, test_states = cached
+    esn.output.ridge_param = parameters['ridge_param']
+    esn.output.with_bias = parameters['with_bias']
+    esn.finalize()
+    return esn, echotorch.utils.nrmse(esn.output(test_states), datasets[3][:, 10:])
+# end liesn_readout
+
+
 # Test cases : Hyper-parameters optimization
 class Test_Hyperparameters_Optimization(EchoTorchTestCase):
     """
@@ -329,6 +399,186 @@ class Test_Hyperparameters_Optimization(EchoTorchTestCase):
         )
     # end test_random_optimization_NARMA10
 
+    # Test evaluation backends against evaluation in the process
+    def test_evaluation_backends(self):
+        """
+        Test evaluation backends against evaluation in the process
+        """
+        # Target and parameters ranges
+        target = torch.tensor([0.3, -0.6], dtype=torch.float64)
+        param_ranges = {'x': np.linspace(-1.0, 1.0, 9).tolist(), 'y': np.linspace(-1.0, 1.0, 9).tolist()}
+
+        # Grid search in the process, with threads and with processes
+        results = list()
+        for backend, num_workers, seed in [('thread', 1, 1), ('thread', 3, None), ('process', 2, 1)]:
+            grid_optimizer = optim.optimizer_factory.get_optimizer(
+                'grid-search',
+                num_workers=num_workers,
+                backend=backend,
+                seed=seed
+            )
+            results.append(grid_optimizer.optimize(noisy_quadratic_fitness, param_ranges, target, noise=0.001)[1])
+        # end for
+
+        # Same best parameters
+        for best_param in results:
+            self.assertDictEqual(best_param, {'x': 0.25, 'y': -0.5})
+        # end for
+
+        # Same seeded fitness values, in the order of the parameters
+        params_set = [{'x': 0.1 * i, 'y': 0.0} for i in range(7)]
+        fitness_values = list()
+        for backend, num_workers in [('thread', 1), ('process', 3)]:
+            random_optimizer = optim.optimizer_factory.get_optimizer(
+                'random',
+                num_workers=num_workers,
+                backend=backend,
+                seed=10
+            )
+            evaluations = random_optimizer._evaluate_with_workers(noisy_quadratic_fitness, params_set, target)
+            self.assertListEqual([e[0] for e in evaluations], params_set)
+            fitness_values.append([e[1] for e in evaluations])
+        # end for
+        self.assertListEqual(fitness_values[0], fitness_values[1])
+
+        # Models released as the candidates complete
+        models = weakref.WeakSet()
+        alive = list()
+
+        def fitness_with_model(parameters, datasets):
+            alive.append(len(models))
+            model = torch.zeros(100)
+            models.add(model)
+            return model, noisy_quadratic_fitness(parameters, datasets, noise=0.0)[1]
+        # end fitness_with_model
+
+        for optimizer_name in ['grid-search', 'random']:
+            del alive[:]
+            optimizer = optim.optimizer_factory.get_optimizer(optimizer_name, num_workers=1)
+            optimizer.optimize(fitness_with_model, param_ranges, target)
+            self.assertLessEqual(max(alive), 1)
+        # end for
+    # end test_evaluation_backends
+
+    # Test reservoir caching between readout-only candidates
+    def test_readout_cache(self):
+        """
+        Test reservoir caching between readout-only candidates
+        """
+        # Dataset of tensors
+        echotorch.utils.manual_seed(1)
+        u = torch.rand(4, 60, 1, dtype=torch.float64)
+        y = torch.roll(u, 2, dims=1) ** 2
+        datasets = (u[:3], y[:3], u[3:], y[3:])
+
+        # Parameters ranges, readout parameters first
+        param_ranges = {
+            'ridge_param': [0.0001, 0.01, 1.0],
+            'with_bias': [True, False],
+            'spectral_radius': [0.5, 0.9],
+            'leaky_rate': [0.3, 1.0]
+        }
+
+        # Grid search with the cache
+        cached_evaluation = optim.ReadoutCache(build_liesn, liesn_readout, cache_size=1)
+        grid_optimizer = optim.optimizer_factory.get_optimizer('grid-search')
+        _, best_param, best_fitness = grid_optimizer.optimize(cached_evaluation, param_ranges, datasets)
+
+        # One build per reservoir configuration, then the best one again
+        self.assertEqual(cached_evaluation.builds, 5)
+        self.assertEqual(cached_evaluation.hits, 20)
+
+        # Same fitness values as a full evaluation of each candidate
+        params_set = [{'ridge_param': r, 'with_bias': b, 'spectral_radius': 0.9, 'leaky_rate': 0.3}
+                      for r in [0.0001, 1.0] for b in [True, False]]
+        for params, fitness_value, _ in grid_optimizer._evaluate_with_workers(cached_evaluation, params_set, datasets):
+            esn, test_states = build_liesn(params, datasets, with_bias=params['with_bias'])
+            esn.output.ridge_param = params['ridge_param']
+            esn.finalize()
+            self.assertAlmostEqual(
+                fitness_value,
+                echotorch.utils.nrmse(esn.output(test_states), datasets[3][:, 10:]),
+                places=6
+            )
+        # end for
+
+        # Best candidate
+        self.assertAlmostEqual(best_fitness, cached_evaluation(best_param, datasets)[1], places=6)
+
+        # Same results with threads, candidates of a configuration are evaluated one at a time
+        thread_optimizer = optim.optimizer_factory.get_optimizer('grid-search', num_workers=3)
+        threaded_evaluation = optim.ReadoutCache(build_liesn, liesn_readout, cache_size=4)
+        self.assertDictEqual(thread_optimizer.optimize(threaded_evaluation, param_ranges, datasets)[1], best_param)
+        self.assertEqual(threaded_evaluation.builds, 4)
+    # end test_readout_cache
+
+    # Test successive halving and Hyperband
+    def test_successive_halving(self):
+        """
+        Test successive halving and Hyperband
+        """
+        # Target and parameters ranges
+        target = torch.tensor([0.3, -0.6], dtype=torch.float64)
+        param_ranges = {'x': np.linspace(-1.0, 1.0, 21).tolist(), 'y': np.linspace(-1.0, 1.0, 21).tolist()}
+
+        # Fitness recording the number of samples given and the models alive
+        n_samples = list()
+        models, alive = weakref.WeakSet(), list()
+        def budget_fitness(parameters, datasets):
+            n_samples.append(len(datasets[0]))
+            alive.append(len(models))
+            model = torch.zeros(100)
+            models.add(model)
+            return model, noisy_quadratic_fitness(parameters, target, noise=0.0)[1]
+        # end budget_fitness
+
+        # Successive halving
+        echotorch.utils.manual_seed(1)
+        halving_optimizer = optim.optimizer_factory.get_optimizer('successive-halving', n_candidates=27,
+                                                                  min_budget=1.0 / 9.0)
+        rungs = list()
+        halving_optimizer.add_hook('rung', lambda candidates, fitness_values, budget: rungs.append(
+            (len(candidates), budget, candidates[0], fitness_values[0])
+        ))
+        _, best_param, best_fitness = halving_optimizer.optimize(
+            budget_fitness,
+            param_ranges,
+            (torch.zeros(27),)
+        )
+
+        # 27 candidates on 3 samples, 9 on 9 samples and 3 on the whole dataset, then the best one
+        self.assertListEqual([(r[0], round(r[1], 4)) for r in rungs], [(27, 0.1111), (9, 0.3333), (3, 1.0)])
+        self.assertListEqual(n_samples, [3] * 27 + [9] * 9 + [27] * 4)
+        self.assertLessEqual(max(alive), 1)
+
+        # The best candidate of the first rung wins without noise
+        self.assertDictEqual(best_param, rungs[0][2])
+        self.assertAlmostEqual(best_fitness, rungs[0][3])
+
+        # Hyperband brackets
+        hyperband_optimizer = optim.optimizer_factory.get_optimizer(
+            'successive-halving',
+            min_budget=1.0 / 9.0,
+            hyperband=True,
+            budget_mode='length'
+        )
+        self.assertListEqual(
+            [(n, round(b, 4)) for n, b in hyperband_optimizer._brackets()],
+            [(9, 0.1111), (5, 0.3333), (3, 1.0)]
+        )
+
+        # Time prefixes of tensors and datasets
+        u = torch.zeros(2, 90, 1)
+        datasets = hyperband_optimizer._budget_datasets((u, [u[0]]), 1.0 / 9.0)
+        self.assertTensorSize(datasets[0], [2, 10, 1])
+        self.assertTensorSize(datasets[1][0], [10, 1])
+        self.assertTensorSize(hyperband_optimizer._budget_dataset(NARMADataset(90, 2), 1.0 / 3.0)[1][0], [30, 1])
+
+        # Hyperband on the quadratic fitness
+        _, best_param, _ = hyperband_optimizer.optimize(noisy_quadratic_fitness, param_ranges, target, noise=0.0)
+        self.assertLess(noisy_quadratic_fitness(best_param, target, noise=0.0)[1], 0.2)
+    # end test_successive_halving
+
     # endregion TESTS
 
 # end Test_Hyperparameters_Optimization
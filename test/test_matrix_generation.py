@@ -285,6 +285,80 @@ class Test_Matrix_Generation(EchoTorchTestCase):
         )
     # end test_uniform_matrix_generation_with_input_set
 
+    # Test generation of sparse normal and uniform matrices
+    def test_sparse_matrix_generation(self):
+        """
+        Test generation of sparse normal and uniform matrices
+        """
+        # Set seeds
+        echotorch.utils.manual_seed(1)
+
+        # Sparse generators
+        normal_generator = mg.NormalMatrixGenerator(
+            connectivity=0.05,
+            apply_spectral_radius=False,
+            minimum_edges=4,
+            sparse=True
+        )
+        uniform_generator = mg.UniformMatrixGenerator(
+            connectivity=0.05,
+            apply_spectral_radius=False,
+            input_set=[1.0, -1.0],
+            sparse=True
+        )
+
+        # Generate matrices
+        matrix1 = normal_generator.generate(size=(200, 200))
+        matrix2 = uniform_generator.generate(size=(200, 200))
+        matrix3 = normal_generator.generate(size=(2, 2))
+
+        # Sparse storage
+        self.assertTrue(matrix1.is_sparse)
+        self.assertTrue(matrix2.is_sparse)
+        self.assertTensorSize(matrix1, [200, 200])
+
+        # Test connectivity
+        self.assertAlmostEqual(matrix1._nnz() / 40000.0, 0.05, places=2)
+        self.assertAlmostEqual(matrix2._nnz() / 40000.0, 0.05, places=2)
+
+        # Test values and minimum edges
+        self.assertEqual(torch.sum(torch.abs(matrix2.to_dense()) == 1.0).item(), matrix2._nnz())
+        self.assertGreaterEqual(matrix3._nnz(), 4)
+    # end test_sparse_matrix_generation
+
+    # Test spectral radius estimation
+    def test_spectral_radius_estimation(self):
+        """
+        Test spectral radius estimation
+        """
+        # Set seeds
+        echotorch.utils.manual_seed(1)
+
+        # Large sparse-like matrix
+        matrix_generator = mg.NormalMatrixGenerator(connectivity=0.1, apply_spectral_radius=False)
+        matrix1 = matrix_generator.generate(size=(400, 400))
+
+        # Magnitude of the dominant eigenvalue
+        exact_spectral_radius = float(np.max(np.abs(np.linalg.eigvals(matrix1.numpy()))))
+
+        # Dense and sparse estimations
+        self.assertAlmostEqual(
+            echotorch.utils.estimate_spectral_radius(matrix1) / exact_spectral_radius,
+            1.0,
+            places=4
+        )
+        self.assertAlmostEqual(
+            echotorch.utils.estimate_spectral_radius(matrix1.to_sparse()) / exact_spectral_radius,
+            1.0,
+            places=4
+        )
+
+        # Rescaled sparse matrix
+        matrix_generator = mg.NormalMatrixGenerator(connectivity=0.1, spectral_radius=0.9, sparse=True)
+        matrix2 = matrix_generator.generate(size=(400, 400))
+        self.assertAlmostEqual(echotorch.utils.estimate_spectral_radius(matrix2), 0.9, places=4)
+    # end test_spectral_radius_estimation
+
     # Test matlab loader
     def test_matlab_loader(self):
         """
@@ -482,6 +482,49 @@ class Test_NARMA10_Prediction(EchoTorchTestCase):
         self.assertLessEqual(test_nrmse32, 3.5)
     # end test_narma10_prediction_liesn_cuda
 
+    # Test NARMA generation against the step by step recurrence
+    def test_narma_generation(self):
+        """
+        Test NARMA generation against the step by step recurrence
+        """
+        # For each order
+        for system_order in [10, 20, 30]:
+            # Dataset of three samples
+            narma_dataset = NARMADataset(200, 3, system_order=system_order, seed=1, dtype=torch.float64)
+            alpha, beta, delay, gamma = narma_dataset.parameters.tolist()
+
+            # Recurrence re-summing the window for each sample
+            for sample_i in range(3):
+                ins, outs = narma_dataset[sample_i]
+                self.assertTensorSize(ins, [200, 1])
+                expected = torch.zeros(200, 1, dtype=torch.float64)
+                for k in range(system_order - 1, 199):
+                    expected[k + 1] = alpha * expected[k] + beta * expected[k] * torch.sum(
+                        expected[k - (system_order - 1):k + 1]) + 1.5 * ins[k - int(delay)] * ins[k] + gamma
+                # end for
+                self.assertTensorAlmostEqual(outs, expected, 0.000001)
+            # end for
+        # end for
+
+        # Samples advanced together as tensors
+        narma_dataset = NARMADataset(100, NARMADataset.LOCKSTEP_MIN_SAMPLES, seed=1, dtype=torch.float64)
+        for sample_i in [0, NARMADataset.LOCKSTEP_MIN_SAMPLES - 1]:
+            ins, outs = narma_dataset[sample_i]
+            self.assertTensorAlmostEqual(
+                outs[:, 0],
+                NARMADataset.narma(ins.t(), 10, *narma_dataset.parameters.tolist())[0],
+                0.000001
+            )
+        # end for
+
+        # Same inputs with the same seed
+        self.assertTensorAlmostEqual(
+            NARMADataset(50, 2, seed=5)[1][0],
+            NARMADataset(50, 2, seed=5)[1][0],
+            0.000001
+        )
+    # end test_narma_generation
+
     # endregion TESTS
 
 # end test_narma10_prediction
@@ -0,0 +1,339 @@
+# -*- coding: utf-8 -*-
+#
+# File : test/test_reservoir_execution.py
+# Description : Test the execution modes of the reservoir cells.
+# Date : 18th of October, 2026
+#
+# This file is part of EchoTorch.  EchoTorch is free software: you can
+# redistribute it and/or modify it under the terms of the GNU General Public
+# License as published by the Free Software Foundation, version 2.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, write to the Free Software Foundation, Inc., 51
+# Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# Copyright Nils Schaetti <nils.schaetti@unine.ch>
+
+# Imports
+import torch
+import echotorch.utils
+from echotorch.nn.reservoir import ESNCell, LiESNCell, LiESN, DeepESN
+
+from . import EchoTorchTestCase
+
+
+# ESN cell computing its input layer at each time step
+class StepInputESNCell(ESNCell):
+    """
+    ESN cell computing its input layer at each time step
+    """
+
+    # Pre-step hook
+    def _pre_step_update_hook(self, inputs, forward_i, sample_i, t):
+        """
+        Pre-step hook
+        """
+        return inputs
+    # end _pre_step_update_hook
+
+# end StepInputESNCell
+
+
+# Test case : reservoir execution modes
+class Test_Reservoir_Execution(EchoTorchTestCase):
+    """
+    Test reservoir execution modes
+    """
+
+    # region PRIVATE
+
+    # Create a cell
+    def create_cell(self, cell_class, reservoir_size=30, input_dim=3, dtype=torch.float64, **kwargs):
+        """
+        Create a cell with random matrices
+        :param cell_class: ESNCell or LiESNCell
+        :param reservoir_size: Reservoir size
+        :param input_dim: Input dimension
+        :param dtype: Data type
+        :return: The cell
+        """
+        # Set seeds
+        echotorch.utils.manual_seed(1)
+
+        # Random matrices
+        w = torch.randn(reservoir_size, reservoir_size, dtype=dtype) * 0.1
+        w_in = torch.randn(reservoir_size, input_dim, dtype=dtype)
+        w_bias = torch.randn(reservoir_size, dtype=dtype)
+
+        return cell_class(
+            input_dim=input_dim,
+            output_dim=reservoir_size,
+            w=w,
+            w_in=w_in,
+            w_bias=w_bias,
+            dtype=dtype,
+            **kwargs
+        )
+    # end create_cell
+
+    # endregion PRIVATE
+
+    # region TESTS
+
+    # Test batched execution against sample-by-sample execution
+    def test_batched_execution(self):
+        """
+        Test batched execution against sample-by-sample execution
+        """
+        # Inputs
+        u = torch.randn(4, 20, 3, dtype=torch.float64)
+
+        # For ESN and Li-ESN
+        for cell_class, kwargs in [(ESNCell, {}), (LiESNCell, {'leaky_rate': 0.3})]:
+            # Sequential and batched cells
+            seq_cell = self.create_cell(cell_class, washout=5, **kwargs)
+            batch_cell = self.create_cell(cell_class, washout=5, batched=True, **kwargs)
+
+            # Compute states
+            seq_states = seq_cell(u.clone())
+            batch_states = batch_cell(u.clone())
+
+            # Same states, one hidden state per sample
+            self.assertTensorSize(batch_states, [4, 15, 30])
+            self.assertTensorAlmostEqual(seq_states, batch_states, 0.0001)
+            self.assertTensorSize(batch_cell.hidden, [4, 30])
+        # end for
+    # end test_batched_execution
+
+    # Test execution with sparse internal and input matrices
+    def test_sparse_execution(self):
+        """
+        Test execution with sparse internal and input matrices
+        """
+        # Inputs
+        u = torch.randn(2, 20, 3, dtype=torch.float64)
+
+        # Dense cell
+        dense_cell = self.create_cell(LiESNCell, leaky_rate=0.5)
+
+        # Same cell with sparse matrices
+        for batched in [False, True]:
+            sparse_cell = LiESNCell(
+                leaky_rate=0.5,
+                input_dim=3,
+                output_dim=30,
+                w=dense_cell.w.to_sparse(),
+                w_in=dense_cell.w_in.to_sparse(),
+                w_bias=dense_cell.w_bias,
+                batched=batched,
+                dtype=torch.float64
+            )
+
+            # Same states
+            self.assertTrue(sparse_cell.w.is_sparse)
+            self.assertTensorAlmostEqual(dense_cell(u.clone()), sparse_cell(u.clone()), 0.0001)
+        # end for
+    # end test_sparse_execution
+
+    # Test input layer precomputed for all time steps
+    def test_precomputed_input_layer(self):
+        """
+        Test input layer precomputed for all time steps
+        """
+        # Inputs
+        u = torch.randn(2, 20, 3, dtype=torch.float64)
+
+        # Precomputed and step by step input layer
+        bulk_cell = self.create_cell(ESNCell, washout=5, input_scaling=0.5)
+        step_cell = self.create_cell(StepInputESNCell, washout=5, input_scaling=0.5)
+
+        # Bulk inputs only without a pre-step hook
+        self.assertIsNotNone(bulk_cell._precomputed_input_layer(u[0], '_pre_step_update_hook'))
+        self.assertIsNone(step_cell._precomputed_input_layer(u[0], '_pre_step_update_hook'))
+
+        # Same states
+        self.assertTensorAlmostEqual(bulk_cell(u.clone()), step_cell(u.clone()), 0.0001)
+    # end test_precomputed_input_layer
+
+    # Test fused step loop against the generic one
+    def test_fused_execution(self):
+        """
+        Test fused step loop against the generic one
+        """
+        # Inputs
+        u = torch.randn(4, 20, 3, dtype=torch.float64)
+
+        # Execution modes
+        for batched in [False, True]:
+            for nonlin_func in [torch.tanh, torch.relu]:
+                # Generic and fused cells
+                cells = [
+                    self.create_cell(LiESNCell, leaky_rate=0.3, washout=5, batched=batched, nonlin_func=nonlin_func,
+                                     fused=fused)
+                    for fused in [False, True]
+                ]
+
+                # Two calls, the second one continue from the last states in batched mode
+                for reset_state in [True, False]:
+                    generic_states, fused_states = [cell(u.clone(), reset_state=reset_state) for cell in cells]
+                    self.assertTensorAlmostEqual(fused_states, generic_states, 0.0001)
+                    self.assertTensorAlmostEqual(cells[1].hidden, cells[0].hidden, 0.0001)
+                # end for
+            # end for
+        # end for
+    # end test_fused_execution
+
+    # Test pipelined deep ESN against layer by layer execution
+    def test_pipelined_deep_esn(self):
+        """
+        Test pipelined deep ESN against layer by layer execution
+        """
+        # Set seeds
+        echotorch.utils.manual_seed(1)
+
+        # Inputs and targets
+        u = torch.randn(3, 30, 3, dtype=torch.float64)
+        y = torch.randn(3, 30, 2, dtype=torch.float64)
+
+        # For each input type
+        for input_type, layer_input_dim in [('IF', 20), ('IA', 23), ('GE', 3)]:
+            # Matrices
+            w = [torch.randn(20, 20, dtype=torch.float64) * 0.1 for _ in range(3)]
+            w_in = [torch.randn(20, 3, dtype=torch.float64)] + \
+                   [torch.randn(20, layer_input_dim, dtype=torch.float64) * 0.2 for _ in range(2)]
+            w_bias = [torch.randn(20, dtype=torch.float64) for _ in range(3)]
+
+            # Layer by layer, pipelined and pipelined with streamed states
+            deep_esns = [
+                DeepESN(
+                    n_layers=3,
+                    input_dim=3,
+                    hidden_dim=20,
+                    output_dim=2,
+                    w_generator=w,
+                    win_generator=w_in,
+                    wbias_generator=w_bias,
+                    leak_rate=[0.3, 0.5, 1.0],
+                    input_scaling=[1.0, 0.5, 0.5],
+                    ridge_param=0.01,
+                    input_type=input_type,
+                    washout=washout,
+                    pipelined=pipelined,
+                    stream_chunk=stream_chunk,
+                    dtype=torch.float64
+                )
+                for washout, pipelined, stream_chunk in [(0, False, None), (0, True, None), (0, True, 7),
+                                                         (5, True, None), (5, True, 4)]
+            ]
+
+            # Train and test
+            outputs = list()
+            for deep_esn in deep_esns:
+                deep_esn(u.clone(), y)
+                deep_esn.finalize()
+                outputs.append(deep_esn(u.clone()))
+            # end for
+
+            # Same readouts and outputs
+            for deep_esn, output in zip(deep_esns[1:3], outputs[1:3]):
+                self.assertTensorAlmostEqual(deep_esn._output.w_out, deep_esns[0]._output.w_out, 0.0001)
+                self.assertTensorAlmostEqual(output, outputs[0], 0.0001)
+            # end for
+
+            # Same readouts and outputs with a washout
+            self.assertTensorSize(outputs[4], [3, 25, 2])
+            self.assertTensorAlmostEqual(deep_esns[4]._output.w_out, deep_esns[3]._output.w_out, 0.0001)
+            self.assertTensorAlmostEqual(outputs[4], outputs[3], 0.0001)
+        # end for
+
+        # Handlers and observers of the layers are run (layer by layer execution)
+        deep_esn = deep_esns[2]
+        observed, handled = list(), list()
+        deep_esn._reservoirs[1].observe('X', lambda point, data: observed.append(data))
+        deep_esn._reservoirs[2].connect("post-states-update", lambda *args: handled.append(args[0]))
+        forward_calls = deep_esn._reservoirs[0]._forward_calls
+        self.assertTensorAlmostEqual(deep_esn(u.clone()), outputs[2], 0.0001)
+        self.assertEqual(len(observed), 3)
+        self.assertEqual(len(handled), 3)
+        self.assertEqual(deep_esn._reservoirs[0]._forward_calls, forward_calls + 1)
+
+        # Forward calls counted in pipelined mode
+        forward_calls = deep_esns[3]._reservoirs[2]._forward_calls
+        deep_esns[3](u.clone())
+        self.assertEqual(deep_esns[3]._reservoirs[2]._forward_calls, forward_calls + 1)
+
+        # Streamed states shorter than the washout, and empty sequences
+        self.assertTensorSize(deep_esns[4](u[:, :4].clone()), [3, 0, 2])
+        self.assertTensorSize(deep_esns[1](u[:, :0].clone()), [3, 0, 2])
+    # end test_pipelined_deep_esn
+
+    # Test streaming session against whole sequences
+    def test_streaming(self):
+        """
+        Test streaming session against whole sequences
+        """
+        # Inputs and targets
+        u = torch.randn(3, 40, 3, dtype=torch.float64)
+        y = torch.randn(3, 40, 2, dtype=torch.float64)
+
+        # Matrices
+        cell = self.create_cell(LiESNCell, leaky_rate=0.5)
+
+        # Li-ESN
+        esn = LiESN(
+            input_dim=3,
+            hidden_dim=30,
+            output_dim=2,
+            leaky_rate=0.5,
+            w_generator=cell.w,
+            win_generator=cell.w_in,
+            wbias_generator=cell.w_bias,
+            ridge_param=0.01,
+            washout=5,
+            dtype=torch.float64
+        )
+
+        # Train and outputs on whole sequences
+        esn(u.clone(), y)
+        esn.finalize()
+        expected = esn(u.clone())
+
+        # Same outputs with chunks of different lengths
+        stream = esn.stream(n_streams=3)
+        outputs = [stream(u[:, start:end].clone()) for start, end in [(0, 3), (3, 10), (10, 11), (11, 40)]]
+        self.assertTensorSize(outputs[0], [3, 0, 2])
+        self.assertTensorSize(outputs[1], [3, 5, 2])
+        self.assertTensorAlmostEqual(torch.cat(outputs, dim=1), expected, 0.0001)
+
+        # Streams fed separately
+        stream.reset()
+        first = stream(u[:1, :20].clone(), streams=[0])
+        others = stream(u[1:, :20].clone(), streams=[1, 2])
+        self.assertTensorAlmostEqual(torch.cat((first, others), dim=0), expected[:, :15], 0.0001)
+        self.assertTensorAlmostEqual(stream(u[:, 20:].clone()), expected[:, 15:], 0.0001)
+
+        # Stream added to a running session, fed with the others
+        stream = esn.stream(n_streams=2)
+        stream(u[:2, :8].clone())
+        new_stream = stream.add_streams(1)
+        outputs = stream(torch.cat((u[:2, 8:20], u[2:, :12]), dim=0).clone(), streams=[0, 1] + new_stream)
+        self.assertTensorSize(outputs, [3, 12, 2])
+        self.assertListEqual(stream.lengths.tolist(), [12, 12, 7])
+        self.assertTensorAlmostEqual(outputs[:2], expected[:2, 3:15], 0.0001)
+        self.assertTensorAlmostEqual(outputs[2, :7], expected[2, :7], 0.0001)
+        self.assertTensorAlmostEqual(outputs[2, 7:], torch.zeros(5, 2, dtype=torch.float64), 0.0001)
+
+        # One input sequence per stream
+        with self.assertRaises(Exception):
+            stream(u[:2, :5].clone())
+        # end with
+    # end test_streaming
+
+    # endregion TESTS
+
+# end Test_Reservoir_Execution
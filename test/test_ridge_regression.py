@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+#
+# File : test/test_ridge_regression.py
+# Description : Test the ridge regression output layer.
+# Date : 18th of October, 2026
+#
+# This file is part of EchoTorch.  EchoTorch is free software: you can
+# redistribute it and/or modify it under the terms of the GNU General Public
+# License as published by the Free Software Foundation, version 2.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, write to the Free Software Foundation, Inc., 51
+# Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# Copyright Nils Schaetti <nils.schaetti@unine.ch>
+
+# Imports
+import torch
+import echotorch.utils
+from echotorch.nn.linear import RRCell
+
+from . import EchoTorchTestCase
+
+
+# Test case : ridge regression output layer
+class Test_Ridge_Regression(EchoTorchTestCase):
+    """
+    Test ridge regression output layer
+    """
+
+    # region PRIVATE
+
+    # Covariance matrices computed sample by sample
+    def covariance_matrices(self, x, y, with_bias, averaged):
+        """
+        Covariance matrices computed sample by sample
+        :param x: States
+        :param y: Targets
+        :param with_bias: Add a bias column
+        :param averaged: Divide by the time length
+        :return: xTx, xTy
+        """
+        # Add bias
+        if with_bias:
+            x = torch.cat((torch.ones(x.size(0), x.size(1), 1, dtype=x.dtype), x), dim=2)
+        # end if
+
+        # Sum over samples
+        xTx = sum([x[b].t().mm(x[b]) for b in range(x.size(0))])
+        xTy = sum([x[b].t().mm(y[b]) for b in range(x.size(0))])
+
+        # Averaged
+        if averaged:
+            return xTx / x.size(1), xTy / x.size(1)
+        # end if
+        return xTx, xTy
+    # end covariance_matrices
+
+    # endregion PRIVATE
+
+    # region TESTS
+
+    # Test batched covariance accumulation
+    def test_covariance_accumulation(self):
+        """
+        Test batched covariance accumulation
+        """
+        # Set seeds
+        echotorch.utils.manual_seed(1)
+
+        # States and targets
+        x = torch.randn(5, 40, 10, dtype=torch.float64)
+        y = torch.randn(5, 40, 2, dtype=torch.float64)
+
+        # For each flavour
+        for with_bias in [True, False]:
+            for averaged in [True, False]:
+                # Ridge regression
+                rr_cell = RRCell(
+                    input_dim=10,
+                    output_dim=2,
+                    with_bias=with_bias,
+                    averaged=averaged,
+                    dtype=torch.float64
+                )
+
+                # Accumulate
+                states = rr_cell(x, y)
+
+                # States returned without bias
+                self.assertTensorEqual(states, x)
+
+                # Compare with sample by sample computation
+                xTx, xTy = self.covariance_matrices(x, y, with_bias, averaged)
+                self.assertTensorAlmostEqual(rr_cell.xTx, xTx, 0.0001)
+                self.assertTensorAlmostEqual(rr_cell.xTy, xTy, 0.0001)
+            # end for
+        # end for
+    # end test_covariance_accumulation
+
+    # Test Cholesky solver and ridge path against the inverse
+    def test_ridge_solvers(self):
+        """
+        Test Cholesky solver and ridge path against the inverse
+        """
+        # Set seeds
+        echotorch.utils.manual_seed(1)
+
+        # States and targets
+        x = torch.randn(5, 40, 10, dtype=torch.float64)
+        y = torch.randn(5, 40, 2, dtype=torch.float64)
+
+        # Ridge parameters
+        ridge_params = [0.0001, 0.01, 1.0]
+
+        # Output matrices with inverse, Cholesky and ridge path
+        rr_cells = dict()
+        for learning_algo in ["inv", "cholesky"]:
+            rr_cells[learning_algo] = RRCell(
+                input_dim=10,
+                output_dim=2,
+                learning_algo=learning_algo,
+                dtype=torch.float64
+            )
+            rr_cells[learning_algo](x, y)
+        # end for
+
+        # Ridge path, without running the states again
+        w_outs = rr_cells["cholesky"].ridge_path(ridge_params)
+        self.assertTensorSize(w_outs, [3, 2, 11])
+
+        # Finalize for each ridge parameter
+        for i, ridge_param in enumerate(ridge_params):
+            for learning_algo in ["inv", "cholesky"]:
+                rr_cells[learning_algo].ridge_param = ridge_param
+                rr_cells[learning_algo].finalize()
+            # end for
+
+            # Same matrices
+            self.assertTensorAlmostEqual(rr_cells["cholesky"].w_out, rr_cells["inv"].w_out, 0.0001)
+            self.assertTensorAlmostEqual(w_outs[i], rr_cells["inv"].w_out, 0.0001)
+        # end for
+    # end test_ridge_solvers
+
+    # Test batched inference against sample by sample outputs
+    def test_inference(self):
+        """
+        Test batched inference against sample by sample outputs
+        """
+        # Set seeds
+        echotorch.utils.manual_seed(1)
+
+        # States and targets
+        x = torch.randn(5, 40, 10, dtype=torch.float64)
+        y = torch.randn(5, 40, 3, dtype=torch.float64)
+
+        # For each flavour
+        for with_bias in [True, False]:
+            for output_kwargs in [{}, {'softmax_output': True}, {'normalize_output': True}]:
+                # Ridge regression
+                rr_cell = RRCell(
+                    input_dim=10,
+                    output_dim=3,
+                    ridge_param=0.01,
+                    with_bias=with_bias,
+                    dtype=torch.float64,
+                    **output_kwargs
+                )
+
+                # Train
+                rr_cell(x, y)
+                rr_cell.finalize()
+
+                # Sample by sample outputs
+                xb = torch.cat((torch.ones(5, 40, 1, dtype=torch.float64), x), dim=2) if with_bias else x
+                expected = torch.stack([torch.mm(rr_cell.w_out, xb[b].t()).t() for b in range(5)])
+                if 'softmax_output' in output_kwargs:
+                    expected = torch.softmax(expected, dim=2)
+                elif 'normalize_output' in output_kwargs:
+                    expected = torch.abs(expected) / torch.sum(torch.abs(expected), dim=2, keepdim=True)
+                # end if
+
+                # Outputs, allocated or in a given buffer
+                out = torch.zeros(5, 40, 3, dtype=torch.float64)
+                self.assertTensorAlmostEqual(rr_cell(x), expected, 0.0001)
+                self.assertTensorAlmostEqual(rr_cell(x, out=out), expected, 0.0001)
+                self.assertTensorAlmostEqual(out, expected, 0.0001)
+            # end for
+        # end for
+    # end test_inference
+
+    # endregion TESTS
+
+# end Test_Ridge_Regression